@@ -0,0 +1,95 @@
+"""Benchmark di AnimatedBackground: draw a righe/primitive contro gradiente in cache e atlas.
+
+Confronta headless (driver SDL dummy) il vecchio draw, una draw.line per riga
+di gradiente e una primitiva per stella, con quello attuale di main.py.
+Entrambi partono dallo stesso seed e fanno update + draw a 1280x720.
+
+    python benchmarks/background_draw.py
+    python benchmarks/background_draw.py --frames 1200
+"""
+import argparse
+import contextlib
+import io
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import pygame
+    import main
+
+
+class LineBackground(main.AnimatedBackground):
+    """Il draw originale: 720 draw.line per il gradiente e primitive per stelle e linee"""
+
+    def draw(self, surface: pygame.Surface):
+        for y in range(720):
+            factor = y / 720
+            r = int(5 + math.sin(self.time * 0.5 + factor) * 3)
+            g = int(8 + math.sin(self.time * 0.3 + factor * 1.5) * 3)
+            b = int(25 + math.sin(self.time * 0.4 + factor * 2) * 5)
+            pygame.draw.line(surface, (r, g, b), (0, y), (1280, y))
+
+        for star in self.stars:
+            brightness = int(star['brightness'] * 255)
+            twinkle = abs(math.sin(self.time * 2 + star['x'] * 0.01)) * 0.3 + 0.7
+            color_val = int(brightness * twinkle)
+            color = (color_val, color_val, min(255, color_val + 50))
+
+            if star['size'] > 1:
+                pygame.draw.circle(surface, color, (int(star['x']), int(star['y'])), star['size'])
+            else:
+                try:
+                    surface.set_at((int(star['x']), int(star['y'])), color)
+                except:
+                    pass
+
+        for line in self.speed_lines:
+            start_pos = (int(line['x']), int(line['y']))
+            end_pos = (int(line['x'] + line['length']), int(line['y']))
+            pygame.draw.line(surface, self.LINE_COLOR, start_pos, end_pos, line['thickness'])
+
+
+def run(background_class, args) -> float:
+    """ms medi per frame di update + draw"""
+    random.seed(args.seed)
+    background = background_class()
+    surface = pygame.Surface((1280, 720))
+    dt = 1 / 60
+    for _ in range(args.warmup):
+        background.update(dt)
+        background.draw(surface)
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        background.update(dt)
+        background.draw(surface)
+    return (time.perf_counter() - start) / args.frames * 1000
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--warmup', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    pygame.init()
+    before = run(LineBackground, args)
+    after = run(main.AnimatedBackground, args)
+    print(f"[Bench] AnimatedBackground update+draw, {args.frames} frame 1280x720: "
+          f"lines {before:.2f} ms/frame, cached {after:.2f} ms/frame ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main_cli()
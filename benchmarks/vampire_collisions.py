@@ -0,0 +1,192 @@
+"""Benchmark di VampireBall: broadphase SpatialHashGrid contro loop diretto.
+
+Scenario headless (driver SDL dummy): 250 nemici attorno al giocatore, 30 %
+uccidibili al primo colpo, centinaia di proiettili (homing, pierce, chain,
+bounce) e 3 aure. Ogni ripetizione ricostruisce lo scenario dallo stesso seed
+e misura check_collisions() e la ricerca dei bersagli homing, una volta con
+la griglia e una con ListScan (stessa interfaccia, scorre tutta la lista come
+il codice originale). Colpi, uccisioni e bersagli devono coincidere.
+
+    python benchmarks/vampire_collisions.py
+    python benchmarks/vampire_collisions.py --enemies 1000 --projectiles 300
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import pygame
+    import numpy as np
+    import main
+
+
+class ListScan:
+    """Stessa interfaccia di SpatialHashGrid senza indice: query() restituisce
+    tutti gli oggetti, nearest() li scorre tutti (a parità vince il primo)"""
+
+    def __init__(self, cell_size: float = 128):
+        self.items = []
+        self.positions = []
+
+    def clear(self):
+        self.items.clear()
+        self.positions.clear()
+
+    def insert(self, item, x, y, radius=0.0):
+        self.items.append(item)
+        self.positions.append((x, y))
+
+    def query(self, x, y, radius):
+        return list(self.items)
+
+    def nearest(self, x, y, max_dist=float('inf'), accept=None):
+        limit_sq = max_dist * max_dist
+        best = None
+        best_dist = float('inf')
+        for item, (px, py) in zip(self.items, self.positions):
+            dist_sq = (px - x) ** 2 + (py - y) ** 2
+            if dist_sq < limit_sq and dist_sq < best_dist and (accept is None or accept(item)):
+                best_dist = dist_sq
+                best = item
+        return best
+
+    def __len__(self):
+        return len(self.items)
+
+
+def load_rom(path: Path):
+    """Importa la ROM con le stesse dipendenze iniettate dal motore"""
+    rom_globals = {
+        'MiniGame': main.MiniGame,
+        'TrackballInput': main.TrackballInput,
+        'text_cache': main.TextCache(),
+        'glow_cache': main.GlowCache(),
+        'GlowCache': main.GlowCache,
+        'SpatialHashGrid': main.SpatialHashGrid,
+        'ParticleSystem': main.ParticleSystem,
+        'Camera': main.Camera,
+        'profiler': main.FrameProfiler(),
+        'pygame': pygame,
+        'math': math,
+        'random': random,
+        'sys': sys,
+        'os': os
+    }
+    spec = importlib.util.spec_from_file_location("roms.VampireBall", path)
+    module = importlib.util.module_from_spec(spec)
+    module.__dict__.update(rom_globals)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_scenario(module, grid_class, seed: int, args):
+    random.seed(seed)
+    np.random.seed(seed)
+    game = module.VampireBall(sound=None)
+    game.enemy_grid = grid_class(128)
+    px, py = game.player_x, game.player_y
+
+    for _ in range(args.enemies):
+        enemy = module.Enemy(px + random.uniform(-900, 900), py + random.uniform(-500, 500),
+                             random.randrange(10), 1.0)
+        if random.random() < 0.3:
+            enemy.hp = 1
+        game.add_enemy(enemy)
+    game.rebuild_enemy_grid()
+
+    for i in range(args.projectiles):
+        angle = random.uniform(0, math.pi * 2)
+        projectile = module.Projectile(
+            px + random.uniform(-900, 900), py + random.uniform(-500, 500),
+            math.cos(angle) * 500, math.sin(angle) * 500, 12, (255, 220, 120),
+            size=random.uniform(4, 12), piercing=random.randint(1, 3), homing=i % 3 == 0,
+            crit_chance=0.2, chain_count=1 if i % 7 == 0 else 0, bounce=1 if i % 11 == 0 else 0)
+        projectile.spawn_time = 0.2
+        game.projectiles.append(projectile)
+
+    for _ in range(3):
+        game.aura_effects.append(module.AuraEffect(
+            px + random.uniform(-300, 300), py + random.uniform(-200, 200),
+            random.uniform(120, 200), 5, (200, 80, 255)))
+    return game
+
+
+def run_scenario(game):
+    """(ms bersagli, ms collisioni, esito) di un frame di targeting + check_collisions"""
+    index = {id(enemy): i for i, enemy in enumerate(game.enemies)}
+
+    def slot(enemy):
+        return None if enemy is None else index[id(enemy)]
+
+    start = time.perf_counter()
+    targets = [p.find_closest_enemy(game.enemy_grid) for p in game.projectiles if p.homing]
+    targets.append(game.find_closest_enemy())
+    targeting = time.perf_counter() - start
+
+    start = time.perf_counter()
+    game.check_collisions()
+    collisions = time.perf_counter() - start
+
+    outcome = (
+        [slot(enemy) for enemy in targets],
+        [(enemy.hp, enemy.alive) for enemy in game.enemies],
+        [(p.active, p.hits, slot(p.last_hit_enemy), round(p.vx, 6), round(p.vy, 6))
+         for p in game.projectiles],
+        game.kill_count, game.score
+    )
+    return targeting * 1000, collisions * 1000, outcome
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--enemies', type=int, default=250)
+    parser.add_argument('--projectiles', type=int, default=300)
+    parser.add_argument('--repeats', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    pygame.init()
+    module = load_rom(ROOT / "roms" / "VampireBall.py")
+    totals = {'list scan': [0.0, 0.0], 'grid': [0.0, 0.0]}
+    kills = rebuild = 0.0
+    for repeat in range(args.repeats):
+        seed = args.seed + repeat
+        outcomes = {}
+        for name, grid_class in (('list scan', ListScan), ('grid', main.SpatialHashGrid)):
+            game = build_scenario(module, grid_class, seed, args)
+            if name == 'grid':
+                start = time.perf_counter()
+                game.rebuild_enemy_grid()
+                rebuild += time.perf_counter() - start
+            targeting, collisions, outcomes[name] = run_scenario(game)
+            totals[name][0] += targeting
+            totals[name][1] += collisions
+        if outcomes['list scan'] != outcomes['grid']:
+            sys.exit(f"[Bench] Grid and list scan disagree on hits/targets (seed {seed})")
+        kills += outcomes['grid'][3]
+
+    print(f"[Bench] VampireBall, {args.enemies} enemies, {args.projectiles} projectiles, "
+          f"{args.repeats} repeats: identical hits, kills and targets "
+          f"(avg {kills / args.repeats:.0f} kills)")
+    for name, (targeting, collisions) in totals.items():
+        print(f"[Bench]   {name:9s}  check_collisions {collisions / args.repeats:6.2f} ms  "
+              f"homing targets {targeting / args.repeats:6.2f} ms")
+    print(f"[Bench]   grid rebuild {rebuild / args.repeats * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main_cli()
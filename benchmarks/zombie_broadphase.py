@@ -0,0 +1,139 @@
+"""Benchmark di ZombieRolloutEasy: 150 zombie a schermo e multishot pesante.
+
+Misura il tempo medio di update() e di update_collisions() per frame,
+headless (driver SDL dummy). Con --no-grid forza il loop diretto su tutti
+gli zombie, per confrontare la broadphase sulla griglia con il caso O(n*m).
+
+    python benchmarks/zombie_broadphase.py
+    python benchmarks/zombie_broadphase.py --no-grid --frames 1200
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import pygame
+    import numpy as np
+    import main
+
+
+class ScriptedTrackball:
+    """Sinistro tenuto premuto (auto-fire) e un lento movimento circolare"""
+    button_left = True
+    button_left_pressed = button_right_pressed = button_middle_pressed = False
+
+    def __init__(self):
+        self.t = 0.0
+
+    def get_smooth_delta(self):
+        self.t += 0.03
+        return (math.cos(self.t) * 0.6, math.sin(self.t * 0.7) * 0.6)
+
+
+def load_rom(path: Path):
+    """Importa la ROM con le stesse dipendenze iniettate dal motore"""
+    rom_globals = {
+        'MiniGame': main.MiniGame,
+        'TrackballInput': main.TrackballInput,
+        'text_cache': main.TextCache(),
+        'glow_cache': main.GlowCache(),
+        'GlowCache': main.GlowCache,
+        'SpatialHashGrid': main.SpatialHashGrid,
+        'ParticleSystem': main.ParticleSystem,
+        'Camera': main.Camera,
+        'profiler': main.FrameProfiler(),
+        'pygame': pygame,
+        'math': math,
+        'random': random,
+        'sys': sys,
+        'os': os
+    }
+    spec = importlib.util.spec_from_file_location("roms.ZombieRolloutEasy", path)
+    module = importlib.util.module_from_spec(spec)
+    module.__dict__.update(rom_globals)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run(args) -> dict:
+    module = load_rom(ROOT / "roms" / "ZombieRolloutEasy.py")
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+
+    game = module.ZombieRolloutEasy(sound=None)
+    game.weapon_level = args.weapon_level
+    game.piercing_shots = args.pierce
+    game.fire_rate = args.fire_rate
+    game.player_health = game.player_max_health = 10 ** 12  # Niente game over
+    game.xp_to_next_level = 10 ** 12                        # Niente schermata di level-up
+    game.spawn_director.plan(0, 1.0)                        # Gli zombie li rabbocca il benchmark
+    if args.no_grid:
+        game.BROADPHASE_MIN_ZOMBIES = 10 ** 9
+
+    collisions = [0.0]
+    update_collisions = game.update_collisions
+
+    def timed_collisions():
+        start = time.perf_counter()
+        update_collisions()
+        collisions[0] += time.perf_counter() - start
+    game.update_collisions = timed_collisions
+
+    trackball = ScriptedTrackball()
+    total = 0.0
+    bullets = zombies = 0
+    all_kinds = tuple(range(len(module.SpawnDirector.KINDS)))
+    for _ in range(args.frames):
+        missing = args.zombies - len(game.zombies)
+        if missing > 0 and not game.wave_transition:
+            game.spawn_batch(*game.spawn_director.burst(missing, all_kinds))
+        bullets += len(game.bullets)
+        zombies += len(game.zombies)
+        start = time.perf_counter()
+        game.update(1 / 60, trackball)
+        total += time.perf_counter() - start
+
+    return {
+        'update_ms': total / args.frames * 1000,
+        'collisions_ms': collisions[0] / args.frames * 1000,
+        'bullets': bullets / args.frames,
+        'zombies': zombies / args.frames,
+        'score': game.score
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--zombies', type=int, default=150, help="zombie mantenuti a schermo")
+    parser.add_argument('--weapon-level', type=int, default=7, help="proiettili per colpo (multishot)")
+    parser.add_argument('--pierce', type=int, default=2)
+    parser.add_argument('--fire-rate', type=float, default=0.05, help="secondi tra due colpi")
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--no-grid', action='store_true', help="loop diretto al posto della griglia")
+    args = parser.parse_args()
+
+    result = run(args)
+    mode = "list scan" if args.no_grid else "grid"
+    print(f"[Bench] ZombieRolloutEasy ({mode}): update {result['update_ms']:.2f} ms/frame, "
+          f"collisions {result['collisions_ms']:.2f} ms/frame, "
+          f"avg bullets {result['bullets']:.0f}, avg zombies {result['zombies']:.0f}, "
+          f"score {result['score']}")
+
+
+if __name__ == "__main__":
+    main_cli()
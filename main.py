@@ -5,15 +5,20 @@ import numpy as np
 from abc import ABC, abstractmethod
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Callable
 import math
 import random
 import os
 import pygame.gfxdraw
 from dataclasses import dataclass
 from enum import Enum
+from collections import OrderedDict, deque
 import importlib.util
+import threading
+import time
 import inspect 
+import ast
+import re
 romsdir = Path("roms")
 
 
@@ -24,14 +29,132 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)
 
 
+# ============== SFX MIXER ==============
+class ManagedSound:
+    """Sound instradato nel mixer SFX: play() rispetta priorità e limiti di voce"""
+
+    def __init__(self, sound: pygame.mixer.Sound, name: str, mixer: 'SfxMixer'):
+        self.sound = sound
+        self.name = name
+        self.mixer = mixer
+
+    def play(self, loops: int = 0, maxtime: int = 0, fade_ms: int = 0) -> Optional[pygame.mixer.Channel]:
+        return self.mixer.play(self, loops, maxtime, fade_ms)
+
+    def __getattr__(self, attr):
+        # get_length, stop, set_volume, ... vanno direttamente al Sound
+        return getattr(self.sound, attr)
+
+
+class SfxMixer:
+    """Pool di canali con priorità per effetto e limiti di voce a finestra temporale"""
+
+    DEFAULT_PRIORITY = 5
+    PRIORITIES = {
+        'game_start': 10, 'game_over': 10, 'high_score': 10,
+        'select': 8, 'back': 8, 'pause': 8,
+        'powerup': 7, 'combo': 6, 'blip': 5,
+        'target_miss': 4, 'shoot': 3, 'target_hit': 2
+    }
+    # nome -> (massimo play, finestra in secondi)
+    VOICE_LIMITS = {
+        'target_hit': (4, 0.1),
+        'shoot': (4, 0.1),
+        'target_miss': (3, 0.1),
+        'combo': (2, 0.1),
+        'blip': (2, 0.05)
+    }
+
+    def __init__(self, num_channels: int = 16, volume: float = 1.0):
+        self.num_channels = num_channels
+        pygame.mixer.set_num_channels(num_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        self._channel_priority = [0] * num_channels
+        self._channel_started = [0.0] * num_channels
+        self._recent_plays: Dict[str, List[float]] = {}
+        self.volume = max(0.0, min(1.0, volume))
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    def set_volume(self, volume: float):
+        self.volume = max(0.0, min(1.0, volume))
+        for channel in self.channels:
+            channel.set_volume(self.volume)
+
+    def _within_voice_limit(self, name: str, now: float) -> bool:
+        limit = self.VOICE_LIMITS.get(name)
+        if limit is None:
+            return True
+        max_plays, window = limit
+        recent = [t for t in self._recent_plays.get(name, ()) if now - t < window]
+        if len(recent) >= max_plays:
+            self._recent_plays[name] = recent
+            return False
+        recent.append(now)
+        self._recent_plays[name] = recent
+        return True
+
+    def _pick_channel(self, priority: int) -> Optional[int]:
+        victim = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+            # Candidato da rubare: priorità più bassa, poi il più vecchio
+            if self._channel_priority[i] < priority and (
+                    victim is None
+                    or (self._channel_priority[i], self._channel_started[i])
+                    < (self._channel_priority[victim], self._channel_started[victim])):
+                victim = i
+        if victim is not None:
+            self.channels[victim].stop()
+            self.stolen += 1
+        return victim
+
+    def play(self, managed: ManagedSound, loops: int = 0, maxtime: int = 0,
+             fade_ms: int = 0) -> Optional[pygame.mixer.Channel]:
+        now = pygame.time.get_ticks() / 1000.0
+        if self.volume <= 0.0 or not self._within_voice_limit(managed.name, now):
+            self.dropped += 1
+            return None
+
+        priority = self.PRIORITIES.get(managed.name, self.DEFAULT_PRIORITY)
+        index = self._pick_channel(priority)
+        if index is None:
+            self.dropped += 1
+            return None
+
+        channel = self.channels[index]
+        channel.set_volume(self.volume)
+        channel.play(managed.sound, loops, maxtime, fade_ms)
+        self._channel_priority[index] = priority
+        self._channel_started[index] = now
+        self.played += 1
+        return channel
+
+    def get_stats(self) -> Dict[str, int]:
+        return {'played': self.played, 'dropped': self.dropped, 'stolen': self.stolen}
+
+
 # ============== SOUND SYNTHESIZER ==============
 class SoundSynthesizer:
     """Sintetizzatore audio professionale per effetti arcade"""
 
-    def __init__(self, sample_rate: int = 22050):
+    # Incrementare quando cambia la sintesi: invalida la cache su disco
+    SYNTH_VERSION = 1
+    # Spazio parametri pre-sintetizzato al boot (PixelEater arriva al livello 15)
+    COMBO_LEVELS = range(0, 16)
+    BLIP_PITCHES = range(-1, 5)  # Menu/settings: ±1, inserimento high score: 0..4
+
+    def __init__(self, sample_rate: int = 22050, cache_dir: str = "sound_cache",
+                 num_channels: int = 16, volume: float = 1.0):
         pygame.mixer.init(frequency=sample_rate, size=-16, channels=2, buffer=512)
         self.sample_rate = sample_rate
-        self.sounds_cache = {}
+        self.mixer = SfxMixer(num_channels, volume)
+        self.sounds_cache: Dict[str, ManagedSound] = {}
+        self.cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+        self._preload_thread: Optional[threading.Thread] = None
 
     def _generate_wave(self, frequency: float, duration: float, wave_type: str = 'sine') -> np.ndarray:
         num_samples = int(duration * self.sample_rate)
@@ -72,160 +195,240 @@ class SoundSynthesizer:
             envelope[-release_samples:] = np.linspace(sustain, 0, release_samples)
         return wave * envelope
 
-    def _to_pygame_sound(self, wave: np.ndarray, volume: float = 0.3) -> pygame.mixer.Sound:
+    def _to_pcm(self, wave: np.ndarray, volume: float = 0.3) -> np.ndarray:
         wave = wave * volume
         wave = np.clip(wave, -1.0, 1.0)
         stereo_wave = np.column_stack((wave, wave))
-        sound_array = (stereo_wave * 32767).astype(np.int16)
-        return pygame.mixer.Sound(sound_array)
-
-    def create_blip(self, pitch: int = 0) -> pygame.mixer.Sound:
-        cache_key = f"blip_{pitch}"
-        if cache_key in self.sounds_cache:
-            return self.sounds_cache[cache_key]
-        freq = 440 + (pitch * 100)
-        wave = self._generate_wave(freq, 0.05, 'square')
-        wave = self._apply_envelope(wave, 0.01, 0.01, 0.5, 0.03)
-        sound = self._to_pygame_sound(wave, 0.2)
-        self.sounds_cache[cache_key] = sound
-        return sound
-
-    def create_select(self) -> pygame.mixer.Sound:
-        if "select" in self.sounds_cache:
-            return self.sounds_cache["select"]
-        wave1 = self._generate_wave(440, 0.08, 'square')
-        wave2 = self._generate_wave(660, 0.08, 'square')
-        wave = np.concatenate([wave1, wave2])
-        wave = self._apply_envelope(wave, 0.01, 0.02, 0.7, 0.05)
-        sound = self._to_pygame_sound(wave, 0.25)
-        self.sounds_cache["select"] = sound
-        return sound
-
-    def create_back(self) -> pygame.mixer.Sound:
-        if "back" in self.sounds_cache:
-            return self.sounds_cache["back"]
-        wave = self._generate_wave(330, 0.1, 'sine')
-        wave = self._apply_envelope(wave, 0.01, 0.03, 0.5, 0.06)
-        sound = self._to_pygame_sound(wave, 0.2)
-        self.sounds_cache["back"] = sound
-        return sound
-
-    def create_pause(self) -> pygame.mixer.Sound:
+        return (stereo_wave * 32767).astype(np.int16)
+
+    def _to_pygame_sound(self, wave: np.ndarray, volume: float = 0.3) -> pygame.mixer.Sound:
+        return pygame.mixer.Sound(self._to_pcm(wave, volume))
+
+    # ---------- Bank + cache su disco ----------
+    def _pcm_path(self, cache_key: str) -> Path:
+        return self.cache_dir / f"{cache_key}_{self.sample_rate}hz_v{self.SYNTH_VERSION}.npy"
+
+    def _load_pcm(self, cache_key: str) -> Optional[np.ndarray]:
+        path = self._pcm_path(cache_key)
+        if not path.exists():
+            return None
+        try:
+            pcm = np.load(path, allow_pickle=False)
+            if pcm.dtype == np.int16 and pcm.ndim == 2 and pcm.shape[1] == 2:
+                return pcm
+        except (OSError, ValueError) as e:
+            print(f"[SoundBank] Corrupted cache {path.name}: {e}")
+        return None
+
+    def _save_pcm(self, cache_key: str, pcm: np.ndarray):
+        path = self._pcm_path(cache_key)
+        tmp_path = path.with_name(f"{path.stem}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.save(f, pcm, allow_pickle=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[SoundBank] Cannot write {path.name}: {e}")
+
+    def set_volume(self, volume: float):
+        self.mixer.set_volume(volume)
+
+    def _cached_sound(self, cache_key: str, build) -> ManagedSound:
+        """build() -> (wave, volume). Ordine: memoria, cache su disco, sintesi"""
+        sound = self.sounds_cache.get(cache_key)
+        if sound is not None:
+            return sound
+
+        pcm = self._load_pcm(cache_key)
+        if pcm is None:
+            wave, volume = build()
+            pcm = self._to_pcm(wave, volume)
+            self._save_pcm(cache_key, pcm)
+
+        # "combo_3" / "blip_-1" condividono priorità e limiti di "combo" / "blip"
+        name = cache_key.split('_')[0] if cache_key.startswith(('combo_', 'blip_')) else cache_key
+        sound = ManagedSound(pygame.mixer.Sound(array=pcm), name, self.mixer)
+        with self._lock:
+            return self.sounds_cache.setdefault(cache_key, sound)
+
+    def preload(self):
+        """Sintetizza (o carica da disco) l'intero banco suoni"""
+        start = datetime.now()
+        for create in (self.create_select, self.create_back, self.create_pause,
+                       self.create_shoot, self.create_target_hit, self.create_target_miss,
+                       self.create_game_start, self.create_game_over,
+                       self.create_high_score, self.create_powerup):
+            create()
+        for pitch in self.BLIP_PITCHES:
+            self.create_blip(pitch)
+        for level in self.COMBO_LEVELS:
+            self.create_combo(level)
+        elapsed = (datetime.now() - start).total_seconds() * 1000
+        print(f"[SoundBank] {len(self.sounds_cache)} sounds ready in {elapsed:.0f} ms")
+
+    def preload_async(self):
+        """Pre-carica il banco in un thread di background (non blocca il boot)"""
+        if self._preload_thread and self._preload_thread.is_alive():
+            return
+        self._preload_thread = threading.Thread(target=self.preload, name="SoundBank", daemon=True)
+        self._preload_thread.start()
+
+    # ---------- Effetti ----------
+    def create_blip(self, pitch: int = 0) -> ManagedSound:
+        def build():
+            freq = 440 + (pitch * 100)
+            wave = self._generate_wave(freq, 0.05, 'square')
+            wave = self._apply_envelope(wave, 0.01, 0.01, 0.5, 0.03)
+            return wave, 0.2
+        return self._cached_sound(f"blip_{pitch}", build)
+
+    def create_select(self) -> ManagedSound:
+        def build():
+            wave1 = self._generate_wave(440, 0.08, 'square')
+            wave2 = self._generate_wave(660, 0.08, 'square')
+            wave = np.concatenate([wave1, wave2])
+            wave = self._apply_envelope(wave, 0.01, 0.02, 0.7, 0.05)
+            return wave, 0.25
+        return self._cached_sound("select", build)
+
+    def create_back(self) -> ManagedSound:
+        def build():
+            wave = self._generate_wave(330, 0.1, 'sine')
+            wave = self._apply_envelope(wave, 0.01, 0.03, 0.5, 0.06)
+            return wave, 0.2
+        return self._cached_sound("back", build)
+
+    def create_pause(self) -> ManagedSound:
         """Suono menu pausa"""
-        if "pause" in self.sounds_cache:
-            return self.sounds_cache["pause"]
-        wave = self._generate_wave(523, 0.1, 'sine')
-        wave = self._apply_envelope(wave, 0.01, 0.02, 0.6, 0.07)
-        sound = self._to_pygame_sound(wave, 0.22)
-        self.sounds_cache["pause"] = sound
-        return sound
-
-    def create_shoot(self) -> pygame.mixer.Sound:
+        def build():
+            wave = self._generate_wave(523, 0.1, 'sine')
+            wave = self._apply_envelope(wave, 0.01, 0.02, 0.6, 0.07)
+            return wave, 0.22
+        return self._cached_sound("pause", build)
+
+    def create_shoot(self) -> ManagedSound:
         """Suono di sparo laser"""
-        if "shoot" in self.sounds_cache:
-            return self.sounds_cache["shoot"]
-        duration = 0.15
-        num_samples = int(duration * self.sample_rate)
-        t = np.linspace(0, duration, num_samples, False)
-        freq_sweep = 1200 - (900 * t / duration)
-        wave = np.sin(2 * np.pi * freq_sweep * t)
-        wave = self._apply_envelope(wave, 0.001, 0.02, 0.4, 0.127)
-        sound = self._to_pygame_sound(wave, 0.22)
-        self.sounds_cache["shoot"] = sound
-        return sound
-
-    def create_target_hit(self) -> pygame.mixer.Sound:
+        def build():
+            duration = 0.15
+            num_samples = int(duration * self.sample_rate)
+            t = np.linspace(0, duration, num_samples, False)
+            freq_sweep = 1200 - (900 * t / duration)
+            wave = np.sin(2 * np.pi * freq_sweep * t)
+            wave = self._apply_envelope(wave, 0.001, 0.02, 0.4, 0.127)
+            return wave, 0.22
+        return self._cached_sound("shoot", build)
+
+    def create_target_hit(self) -> ManagedSound:
         """Suono di colpo a segno"""
-        if "target_hit" in self.sounds_cache:
-            return self.sounds_cache["target_hit"]
-        wave = self._generate_wave(880, 0.1, 'triangle')
-        harmonic = self._generate_wave(1320, 0.1, 'sine') * 0.3
-        wave = wave + harmonic
-        wave = self._apply_envelope(wave, 0.005, 0.02, 0.6, 0.073)
-        sound = self._to_pygame_sound(wave, 0.28)
-        self.sounds_cache["target_hit"] = sound
-        return sound
-
-    def create_target_miss(self) -> pygame.mixer.Sound:
+        def build():
+            wave = self._generate_wave(880, 0.1, 'triangle')
+            harmonic = self._generate_wave(1320, 0.1, 'sine') * 0.3
+            wave = wave + harmonic
+            wave = self._apply_envelope(wave, 0.005, 0.02, 0.6, 0.073)
+            return wave, 0.28
+        return self._cached_sound("target_hit", build)
+
+    def create_target_miss(self) -> ManagedSound:
         """Suono di bersaglio mancato"""
-        if "target_miss" in self.sounds_cache:
-            return self.sounds_cache["target_miss"]
-        wave = self._generate_wave(200, 0.12, 'sawtooth')
-        wave = self._apply_envelope(wave, 0.01, 0.03, 0.4, 0.08)
-        sound = self._to_pygame_sound(wave, 0.18)
-        self.sounds_cache["target_miss"] = sound
-        return sound
-
-    def create_combo(self, level: int = 1) -> pygame.mixer.Sound:
+        def build():
+            wave = self._generate_wave(200, 0.12, 'sawtooth')
+            wave = self._apply_envelope(wave, 0.01, 0.03, 0.4, 0.08)
+            return wave, 0.18
+        return self._cached_sound("target_miss", build)
+
+    def create_combo(self, level: int = 1) -> ManagedSound:
         """Suono di combo"""
-        cache_key = f"combo_{level}"
-        if cache_key in self.sounds_cache:
-            return self.sounds_cache[cache_key]
-        base_freq = 660 + (level * 110)
-        wave = self._generate_wave(base_freq, 0.08, 'square')
-        wave = self._apply_envelope(wave, 0.005, 0.015, 0.7, 0.06)
-        sound = self._to_pygame_sound(wave, 0.25)
-        self.sounds_cache[cache_key] = sound
-        return sound
-
-    def create_game_start(self) -> pygame.mixer.Sound:
-        if "game_start" in self.sounds_cache:
-            return self.sounds_cache["game_start"]
-        freqs = [262, 330, 392, 523]
-        waves = [self._generate_wave(freq, 0.12, 'sine') for freq in freqs]
-        wave = np.concatenate(waves)
-        wave = self._apply_envelope(wave, 0.01, 0.02, 0.8, 0.1)
-        sound = self._to_pygame_sound(wave, 0.3)
-        self.sounds_cache["game_start"] = sound
-        return sound
-
-    def create_game_over(self) -> pygame.mixer.Sound:
-        if "game_over" in self.sounds_cache:
-            return self.sounds_cache["game_over"]
-        freqs = [440, 370, 311, 233]
-        waves = [self._generate_wave(freq, 0.2, 'sawtooth') for freq in freqs]
-        wave = np.concatenate(waves)
-        wave = self._apply_envelope(wave, 0.02, 0.05, 0.7, 0.2)
-        sound = self._to_pygame_sound(wave, 0.3)
-        self.sounds_cache["game_over"] = sound
-        return sound
-
-    def create_high_score(self) -> pygame.mixer.Sound:
-        if "high_score" in self.sounds_cache:
-            return self.sounds_cache["high_score"]
-        freqs = [523, 659, 784, 1047]
-        waves = []
-        for i, freq in enumerate(freqs):
-            duration = 0.15 if i < 3 else 0.3
-            waves.append(self._generate_wave(freq, duration, 'sine'))
-        wave = np.concatenate(waves)
-        wave = self._apply_envelope(wave, 0.01, 0.03, 0.8, 0.2)
-        sound = self._to_pygame_sound(wave, 0.35)
-        self.sounds_cache["high_score"] = sound
-        return sound
-
-    def create_powerup(self) -> pygame.mixer.Sound:
+        def build():
+            base_freq = 660 + (level * 110)
+            wave = self._generate_wave(base_freq, 0.08, 'square')
+            wave = self._apply_envelope(wave, 0.005, 0.015, 0.7, 0.06)
+            return wave, 0.25
+        return self._cached_sound(f"combo_{level}", build)
+
+    def create_game_start(self) -> ManagedSound:
+        def build():
+            freqs = [262, 330, 392, 523]
+            waves = [self._generate_wave(freq, 0.12, 'sine') for freq in freqs]
+            wave = np.concatenate(waves)
+            wave = self._apply_envelope(wave, 0.01, 0.02, 0.8, 0.1)
+            return wave, 0.3
+        return self._cached_sound("game_start", build)
+
+    def create_game_over(self) -> ManagedSound:
+        def build():
+            freqs = [440, 370, 311, 233]
+            waves = [self._generate_wave(freq, 0.2, 'sawtooth') for freq in freqs]
+            wave = np.concatenate(waves)
+            wave = self._apply_envelope(wave, 0.02, 0.05, 0.7, 0.2)
+            return wave, 0.3
+        return self._cached_sound("game_over", build)
+
+    def create_high_score(self) -> ManagedSound:
+        def build():
+            freqs = [523, 659, 784, 1047]
+            waves = []
+            for i, freq in enumerate(freqs):
+                duration = 0.15 if i < 3 else 0.3
+                waves.append(self._generate_wave(freq, duration, 'sine'))
+            wave = np.concatenate(waves)
+            wave = self._apply_envelope(wave, 0.01, 0.03, 0.8, 0.2)
+            return wave, 0.35
+        return self._cached_sound("high_score", build)
+
+    def create_powerup(self) -> ManagedSound:
         """Suono di power-up"""
-        if "powerup" in self.sounds_cache:
-            return self.sounds_cache["powerup"]
-        freqs = [523, 659, 784, 1047, 1319]
-        waves = []
-        for freq in freqs:
-            wave = self._generate_wave(freq, 0.08, 'sine')
-            harmonic = self._generate_wave(freq * 2, 0.08, 'sine') * 0.3
-            waves.append(wave + harmonic)
-        wave = np.concatenate(waves)
-        wave = self._apply_envelope(wave, 0.005, 0.02, 0.8, 0.1)
-        sound = self._to_pygame_sound(wave, 0.28)
-        self.sounds_cache["powerup"] = sound
-        return sound
+        def build():
+            freqs = [523, 659, 784, 1047, 1319]
+            waves = []
+            for freq in freqs:
+                wave = self._generate_wave(freq, 0.08, 'sine')
+                harmonic = self._generate_wave(freq * 2, 0.08, 'sine') * 0.3
+                waves.append(wave + harmonic)
+            wave = np.concatenate(waves)
+            wave = self._apply_envelope(wave, 0.005, 0.02, 0.8, 0.1)
+            return wave, 0.28
+        return self._cached_sound("powerup", build)
+
+
+class MutedSound:
+    """Suono del banco che ignora play() (usato mentre una ROM si costruisce in background)"""
+
+    def __init__(self, sound: ManagedSound):
+        self.sound = sound
+
+    def play(self, *args, **kwargs) -> None:
+        return None
+
+    def __getattr__(self, attr):
+        return getattr(self.sound, attr)
+
+
+class MutedSynthesizer:
+    """Proxy di SoundSynthesizer: stessi create_*(), ma nessun suono viene riprodotto"""
+
+    def __init__(self, synth: SoundSynthesizer):
+        self._synth = synth
+
+    def __getattr__(self, attr):
+        target = getattr(self._synth, attr)
+        if not attr.startswith('create_'):
+            return target
+
+        def create(*args, **kwargs):
+            return MutedSound(target(*args, **kwargs))
+        return create
 
 
 # ============== TRACKBALL INPUT ==============
 class TrackballInput:
     """Gestione professionale input trackball arcade"""
 
-    def __init__(self, sensitivity: float = 50.0):
+    # Costante di tempo equivalente a smooth_factor=0.3 a 60 FPS
+    DEFAULT_SMOOTHING_TIME = -1.0 / (60.0 * math.log(1.0 - 0.3))
+
+    def __init__(self, sensitivity: float = 50.0, event_mode: bool = False,
+                 smoothing_time: float = DEFAULT_SMOOTHING_TIME):
         self.sensitivity = sensitivity
         self.delta_x = 0
         self.delta_y = 0
@@ -252,14 +455,44 @@ class TrackballInput:
         self.max_speed = 100.0
         self.dead_zone = 0.1
 
+        # Event mode: movimento da MOUSEMOTION (in ordine), filtro a costante di tempo
+        self.event_mode = event_mode
+        self.smoothing_time = smoothing_time
+        self.motion_samples = deque(maxlen=256)  # (timestamp perf_counter, dx, dy)
+        self.frame_samples: List[Tuple[float, float, float]] = []
+        self._last_update_time = time.perf_counter()
+
 
 
 
 
 
 
-    def update(self, events: List[pygame.event.Event]):
+    def _accumulate_motion(self, events: List[pygame.event.Event], now: float) -> Tuple[float, float]:
+        """Somma i MOUSEMOTION del frame e registra un campione per evento.
+        pygame non fornisce timestamp per evento: sono distribuiti uniformemente
+        tra l'update precedente e quello corrente, nell'ordine di arrivo."""
+        self.frame_samples = []
+        motions = [event for event in events if event.type == pygame.MOUSEMOTION]
+        if not motions:
+            return (0, 0)
+
+        scale = self.sensitivity / 50.0
+        start = self._last_update_time
+        span = now - start
+        total_dx = total_dy = 0
+        for i, event in enumerate(motions):
+            dx, dy = event.rel
+            total_dx += dx
+            total_dy += dy
+            sample = (start + span * (i + 1) / len(motions), dx * scale, dy * scale)
+            self.frame_samples.append(sample)
+            self.motion_samples.append(sample)
+        return (total_dx, total_dy)
+
+    def update(self, events: List[pygame.event.Event], dt: Optional[float] = None):
         """Aggiorna stato input"""
+        now = time.perf_counter()
         self.button_left_pressed = False
         self.button_middle_pressed = False
         self.button_right_pressed = False
@@ -268,13 +501,26 @@ class TrackballInput:
         self.button_right_released = False
 
         # Movimento trackball
-        raw_dx, raw_dy = pygame.mouse.get_rel()
+        if self.event_mode:
+            pygame.mouse.get_rel()  # Scarta l'accumulo SDL: il movimento arriva dagli eventi
+            raw_dx, raw_dy = self._accumulate_motion(events, now)
+        else:
+            raw_dx, raw_dy = pygame.mouse.get_rel()
         self.delta_x = raw_dx * (self.sensitivity / 50.0)
         self.delta_y = raw_dy * (self.sensitivity / 50.0)
 
-        # Smoothing
-        self._smooth_dx = self._smooth_dx * (1 - self.smooth_factor) + self.delta_x * self.smooth_factor
-        self._smooth_dy = self._smooth_dy * (1 - self.smooth_factor) + self.delta_y * self.smooth_factor
+        # Smoothing: fattore fisso per frame, oppure dt-correct in event mode
+        if self.event_mode:
+            frame_dt = dt if dt is not None else now - self._last_update_time
+            if self.smoothing_time > 0:
+                factor = 1.0 - math.exp(-max(0.0, frame_dt) / self.smoothing_time)
+            else:
+                factor = 1.0
+        else:
+            factor = self.smooth_factor
+        self._smooth_dx = self._smooth_dx * (1 - factor) + self.delta_x * factor
+        self._smooth_dy = self._smooth_dy * (1 - factor) + self.delta_y * factor
+        self._last_update_time = now
 
         # Calcola velocità e angolo
         self.speed = math.sqrt(self._smooth_dx**2 + self._smooth_dy**2)
@@ -328,6 +574,14 @@ class TrackballInput:
             return (0, 0)
         return (self._smooth_dx, self._smooth_dy)
 
+    def get_motion_samples(self, max_age: Optional[float] = None) -> List[Tuple[float, float, float]]:
+        """Storico (timestamp, dx, dy) in event mode, dal più vecchio al più recente.
+        timestamp è in secondi time.perf_counter(); max_age filtra i campioni recenti"""
+        if max_age is None:
+            return list(self.motion_samples)
+        cutoff = time.perf_counter() - max_age
+        return [sample for sample in self.motion_samples if sample[0] >= cutoff]
+
     def set_sensitivity(self, sensitivity: float):
         self.sensitivity = max(10, min(200, sensitivity))
 
@@ -338,13 +592,646 @@ class TrackballInput:
         self.speed = 0
         self._smooth_dx = 0
         self._smooth_dy = 0
+        self.motion_samples.clear()
+        self.frame_samples = []
+        self._last_update_time = time.perf_counter()
+
+
+
+# ============== TEXT CACHE ==============
+class TextCache:
+    """Cache condivisa di font e testi renderizzati (LRU con limite di memoria)
+
+    Le surface restituite da render() sono condivise: non vanno modificate
+    (render() ripristina l'alpha). Per la trasparenza usare draw(..., alpha=...)."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.fonts: Dict[int, pygame.font.Font] = {}
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_font(self, size: int) -> pygame.font.Font:
+        size = max(1, int(size))
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, text: str, size: int, color: Tuple[int, ...],
+               outline: Optional[Tuple[Tuple[int, int, int], int]] = None) -> pygame.Surface:
+        """outline = (colore, spessore): bordo composto una volta sola nella surface"""
+        color = tuple(max(0, min(255, int(c))) for c in color)
+        if outline is not None:
+            outline = (tuple(max(0, min(255, int(c))) for c in outline[0]), int(outline[1]))
+        key = (str(text), max(1, int(size)), color, outline)
+
+        cached = self.surfaces.get(key)
+        if cached is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            cached.set_alpha(None)
+            return cached
+
+        self.misses += 1
+        font = self.get_font(key[1])
+        text_surface = font.render(key[0], True, color)
+        if outline is not None:
+            outline_color, width = outline
+            outline_surface = font.render(key[0], True, outline_color)
+            w, h = text_surface.get_size()
+            composed = pygame.Surface((w + width * 2, h + width * 2), pygame.SRCALPHA)
+            for offset_x in range(-width, width + 1):
+                for offset_y in range(-width, width + 1):
+                    if offset_x != 0 or offset_y != 0:
+                        composed.blit(outline_surface, (width + offset_x, width + offset_y))
+            composed.blit(text_surface, (width, width))
+            text_surface = composed
+
+        self.surfaces[key] = text_surface
+        self.memory_bytes += self._surface_bytes(text_surface)
+        self._evict()
+        return text_surface
+
+    def draw(self, surface: pygame.Surface, text: str, size: int, color: Tuple[int, ...],
+             center: Tuple[float, float], outline: Optional[Tuple[Tuple[int, int, int], int]] = None,
+             alpha: int = 255) -> pygame.Rect:
+        text_surface = self.render(text, size, color, outline)
+        text_surface.set_alpha(None if alpha >= 255 else max(0, int(alpha)))
+        rect = text_surface.get_rect(center=(int(center[0]), int(center[1])))
+        surface.blit(text_surface, rect)
+        return rect
+
+    def _surface_bytes(self, surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _evict(self):
+        while self.memory_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, old_surface = self.surfaces.popitem(last=False)
+            self.memory_bytes -= self._surface_bytes(old_surface)
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.surfaces),
+            'fonts': len(self.fonts),
+            'memory_bytes': self.memory_bytes
+        }
+
+    def clear(self):
+        self.surfaces.clear()
+        self.memory_bytes = 0
+
+
+# ============== GLOW CACHE ==============
+class GlowCache:
+    """Cache condivisa di sprite circolari SRCALPHA (glow, aloni, anelli) - LRU
+
+    Chiave = (raggio a bucket, colore, alpha a bucket, strati): invece di
+    allocare una Surface per entità e per frame si blitta uno sprite già pronto.
+    Le surface restituite sono condivise: non vanno modificate (niente set_alpha)."""
+
+    ALPHA_STEP = 8         # 32 livelli di trasparenza...
+    EXACT_ALPHA = 32       # ...ma esatta sotto 32 (nebulose e aloni molto tenui)
+    EXACT_RADIUS = 128     # Oltre, il bucket cresce col raggio (errore < 2%)
+    DISC = ((1.0, 1.0, 0),)
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def bucket_radius(cls, radius: float) -> int:
+        radius = int(radius)
+        if radius < cls.EXACT_RADIUS:
+            return radius
+        step = 1 << (radius.bit_length() - 7)
+        return radius - radius % step
+
+    @classmethod
+    def bucket_alpha(cls, alpha: float) -> int:
+        if alpha >= 255:
+            return 255
+        if alpha < cls.EXACT_ALPHA:
+            return max(0, int(alpha))
+        return min(255, int(alpha / cls.ALPHA_STEP + 0.5) * cls.ALPHA_STEP)
+
+    def circle(self, radius: float, color: Tuple[int, ...], alpha: float = 255,
+               width: int = 0) -> Optional[pygame.Surface]:
+        """Cerchio pieno (o anello se width > 0) in una surface 2r x 2r"""
+        return self.glow(radius, color, alpha, ((1.0, 1.0, width),) if width else self.DISC)
+
+    def glow(self, radius: float, color: Tuple[int, ...], alpha: float = 255,
+             layers: Tuple[tuple, ...] = DISC) -> Optional[pygame.Surface]:
+        """layers = (scala raggio, scala alpha[, spessore]) disegnati in ordine:
+        come più draw.circle sulla stessa surface SRCALPHA, l'ultimo sovrascrive.
+        None se lo sprite sarebbe invisibile (raggio o alpha nulli)."""
+        radius = int(radius)
+        if radius >= self.EXACT_RADIUS:
+            radius = self.bucket_radius(radius)
+        if alpha < self.EXACT_ALPHA:
+            alpha = int(alpha)
+        else:
+            alpha = self.bucket_alpha(alpha)
+        if radius <= 0 or alpha <= 0:
+            return None
+        if type(color) is not tuple or len(color) != 3:
+            color = (int(color[0]), int(color[1]), int(color[2]))
+        key = (radius, color, alpha, layers)
+
+        cached = self.surfaces.get(key)
+        if cached is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        color = (int(color[0]), int(color[1]), int(color[2]))
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        for layer in layers:
+            layer_radius = int(radius * layer[0])
+            layer_alpha = min(255, int(alpha * layer[1]))
+            width = layer[2] if len(layer) > 2 else 0
+            if layer_radius > 0 and layer_alpha > 0:
+                pygame.draw.circle(sprite, (*color, layer_alpha), (radius, radius), layer_radius, width)
+
+        self._store(key, sprite)
+        return sprite
+
+    def sprite(self, key: tuple, size: Tuple[int, int],
+               paint: Callable[[pygame.Surface], None]) -> pygame.Surface:
+        """Sprite SRCALPHA arbitrario: paint(surface) viene chiamato solo al primo uso.
+        key deve iniziare con un nome (es. ("wind", lunghezza)) per non collidere coi glow."""
+        cached = self.surfaces.get(key)
+        if cached is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        sprite = pygame.Surface(size, pygame.SRCALPHA)
+        paint(sprite)
+        self._store(key, sprite)
+        return sprite
+
+    def draw(self, surface: pygame.Surface, center: Tuple[float, float], radius: float,
+             color: Tuple[int, ...], alpha: float = 255, width: int = 0,
+             layers: Optional[Tuple[tuple, ...]] = None, special_flags: int = 0):
+        """Blit centrato; special_flags=pygame.BLEND_ADD per gli aloni additivi"""
+        if layers is None:
+            layers = ((1.0, 1.0, width),) if width else self.DISC
+        sprite = self.glow(radius, color, alpha, layers)
+        if sprite is None:
+            return
+        half = sprite.get_width() >> 1
+        if special_flags:
+            surface.blit(sprite, (int(center[0]) - half, int(center[1]) - half), None, special_flags)
+        else:
+            surface.blit(sprite, (int(center[0]) - half, int(center[1]) - half))
+
+    def _store(self, key: tuple, sprite: pygame.Surface):
+        self.surfaces[key] = sprite
+        self.memory_bytes += sprite.get_width() * sprite.get_height() * 4
+        while self.memory_bytes > self.max_bytes and len(self.surfaces) > 1:
+            _, old_sprite = self.surfaces.popitem(last=False)
+            self.memory_bytes -= old_sprite.get_width() * old_sprite.get_height() * 4
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self.surfaces),
+            'memory_bytes': self.memory_bytes
+        }
+
+    def clear(self):
+        self.surfaces.clear()
+        self.memory_bytes = 0
+
+
+# ============== SPATIAL GRID ==============
+class SpatialHashGrid:
+    """Indice a griglia uniforme per query di vicinanza (ricostruito una volta per frame)
+
+    Gli oggetti si inseriscono con la posizione del centro e un raggio; le query
+    restituiscono candidati nell'ordine di inserimento, così chi le usa al posto
+    di un loop sulla lista ottiene gli stessi risultati."""
+
+    def __init__(self, cell_size: float = 128):
+        self.cell_size = float(cell_size)
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self.items: List[object] = []
+        self.positions: List[Tuple[float, float]] = []
+        self.max_radius = 0.0
+        self._bounds = [0, 0, -1, -1]  # min_cx, min_cy, max_cx, max_cy delle celle occupate
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+        self.positions.clear()
+        self.max_radius = 0.0
+        self._bounds = [0, 0, -1, -1]
+
+    def insert(self, item, x: float, y: float, radius: float = 0.0):
+        cx = int(x // self.cell_size)
+        cy = int(y // self.cell_size)
+        index = len(self.items)
+        self.items.append(item)
+        self.positions.append((x, y))
+        cell = self.cells.get((cx, cy))
+        if cell is None:
+            self.cells[(cx, cy)] = [index]
+        else:
+            cell.append(index)
+        if radius > self.max_radius:
+            self.max_radius = radius
+        bounds = self._bounds
+        if index == 0:
+            bounds[:] = (cx, cy, cx, cy)
+        else:
+            if cx < bounds[0]:
+                bounds[0] = cx
+            elif cx > bounds[2]:
+                bounds[2] = cx
+            if cy < bounds[1]:
+                bounds[1] = cy
+            elif cy > bounds[3]:
+                bounds[3] = cy
+
+    def query(self, x: float, y: float, radius: float) -> List[object]:
+        """Candidati il cui cerchio (centro + raggio d'inserimento) può toccare
+        il cerchio della query. Il test esatto resta a carico del chiamante."""
+        if not self.items:
+            return []
+        reach = radius + self.max_radius
+        size = self.cell_size
+        min_cx = int((x - reach) // size)
+        max_cx = int((x + reach) // size)
+        min_cy = int((y - reach) // size)
+        max_cy = int((y + reach) // size)
+        b_min_cx, b_min_cy, b_max_cx, b_max_cy = self._bounds
+        min_cx, max_cx = max(min_cx, b_min_cx), min(max_cx, b_max_cx)
+        min_cy, max_cy = max(min_cy, b_min_cy), min(max_cy, b_max_cy)
+
+        cells = self.cells
+        found: List[int] = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.extend(cell)
+        if not found:
+            return []
+        found.sort()
+        items = self.items
+        return [items[i] for i in found]
+
+    def nearest(self, x: float, y: float, max_dist: float = float('inf'),
+                accept: Optional[Callable[[object], bool]] = None) -> Optional[object]:
+        """Oggetto più vicino (per centro) entro max_dist, a parità vince il primo inserito.
+        Ricerca ad anelli di celle crescenti: si ferma quando nessun anello più
+        esterno può contenere un oggetto più vicino."""
+        if not self.items:
+            return None
+        size = self.cell_size
+        qx = int(x // size)
+        qy = int(y // size)
+        b_min_cx, b_min_cy, b_max_cx, b_max_cy = self._bounds
+        max_ring = max(qx - b_min_cx, b_max_cx - qx, qy - b_min_cy, b_max_cy - qy)
+        if max_dist != float('inf'):
+            max_ring = min(max_ring, int(max_dist // size) + 1)
+        limit_sq = max_dist * max_dist
+
+        cells = self.cells
+        positions = self.positions
+        items = self.items
+        best = None
+        best_key = None
+        for ring in range(max(0, max_ring) + 1):
+            if ring == 0:
+                ring_cells = [(qx, qy)]
+            else:
+                ring_cells = [(qx + dx, qy - ring) for dx in range(-ring, ring + 1)]
+                ring_cells += [(qx + dx, qy + ring) for dx in range(-ring, ring + 1)]
+                ring_cells += [(qx - ring, qy + dy) for dy in range(-ring + 1, ring)]
+                ring_cells += [(qx + ring, qy + dy) for dy in range(-ring + 1, ring)]
+            for key in ring_cells:
+                cell = cells.get(key)
+                if not cell:
+                    continue
+                for index in cell:
+                    px, py = positions[index]
+                    dx = px - x
+                    dy = py - y
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq >= limit_sq:
+                        continue
+                    candidate_key = (dist_sq, index)
+                    if (best_key is None or candidate_key < best_key) and (accept is None or accept(items[index])):
+                        best_key = candidate_key
+                        best = items[index]
+            # Gli anelli successivi distano almeno ring * cell_size dal punto
+            reach = ring * size
+            if best_key is not None and best_key[0] < reach * reach:
+                break
+        return best
+
+    def __len__(self) -> int:
+        return len(self.items)
+
 
+# ============== PARTICLE SYSTEM ==============
+class ParticleSystem:
+    """Particelle in array NumPy preallocati (una riga per particella)
+
+    Integrazione vettoriale (drag, gravità, posizione, vita), rimozione con
+    swap-remove e disegno a blocchi. Lo stile è del sistema, non della singola
+    particella: "solid" = cerchio pieno col colore che sfuma verso il nero,
+    "alpha" = cerchio semitrasparente (sprite da GlowCache + surface.blits)."""
+
+    X, Y, VX, VY, LIFE, MAX_LIFE, SIZE, GRAVITY, R, G, B, ALPHA, GLOW = range(13)
+    COLUMNS = 13
+    ALPHA_LEVELS = 32      # Quantizzazione della dissolvenza per gli sprite
+    MAX_SPRITES = 2048
+
+    def __init__(self, capacity: int = 1024, style: str = "solid", fade: str = "linear",
+                 size_fade: bool = True, drag: Tuple[float, float] = (1.0, 1.0),
+                 shrink: float = 1.0, min_radius: int = 0, intensity: float = 1.0,
+                 sprites: Optional[GlowCache] = None):
+        self.capacity = capacity
+        self.style = style
+        self.fade = fade
+        self.size_fade = size_fade
+        self.drag = drag
+        self.shrink = shrink
+        self.min_radius = min_radius
+        self.intensity = intensity
+        self.data = np.zeros((capacity, self.COLUMNS), dtype=np.float64)
+        self.count = 0
+        self.dropped = 0
+        self.sprites = sprites if sprites is not None else GlowCache(4 * 1024 * 1024)
+        self._sprites: Dict[tuple, pygame.Surface] = {}     # Indice locale sugli sprite condivisi
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    # ---------- Emissione ----------
+    def emit(self, x: float, y: float, vx: float, vy: float, life: float,
+             color: Tuple[int, int, int], size: float, gravity: float = 0.0,
+             max_life: Optional[float] = None, glow: bool = False, alpha: float = 255) -> bool:
+        """Una particella; False se il pool è pieno (come i vecchi tetti [:N])"""
+        if self.count >= self.capacity:
+            self.dropped += 1
+            return False
+        self.data[self.count] = (x, y, vx, vy, life, max_life or life, size, gravity,
+                                 color[0], color[1], color[2], alpha, glow)
+        self.count += 1
+        return True
+
+    def emit_burst(self, x: float, y: float, count: int, speed, life, size, color,
+                   angle=(0.0, 2 * math.pi), gravity: float = 0.0, max_life: Optional[float] = None,
+                   glow: bool = False, alpha: float = 255,
+                   base_velocity: Tuple[float, float] = (0.0, 0.0)) -> int:
+        """Esplosione radiale. speed/life/size/angle: valore o (min, max);
+        color: RGB oppure (RGB_min, RGB_max) per canale. Ritorna le particelle emesse."""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return 0
+        rows = self.data[self.count:self.count + count]
+        angles = self._sample(angle, count)
+        speeds = self._sample(speed, count)
+        rows[:, self.X] = x
+        rows[:, self.Y] = y
+        rows[:, self.VX] = np.cos(angles) * speeds + base_velocity[0]
+        rows[:, self.VY] = np.sin(angles) * speeds + base_velocity[1]
+        rows[:, self.LIFE] = self._sample(life, count)
+        rows[:, self.MAX_LIFE] = rows[:, self.LIFE] if max_life is None else max_life
+        rows[:, self.SIZE] = self._sample(size, count)
+        rows[:, self.GRAVITY] = gravity
+        if len(color) == 2:
+            low, high = np.array(color[0], dtype=np.float64), np.array(color[1], dtype=np.float64)
+            rows[:, self.R:self.B + 1] = np.floor(np.random.uniform(
+                np.minimum(low, high), np.maximum(low, high) + 1, (count, 3)))
+        else:
+            rows[:, self.R:self.B + 1] = color
+        rows[:, self.ALPHA] = alpha
+        rows[:, self.GLOW] = glow
+        self.count += count
+        return count
+
+    @staticmethod
+    def _sample(value, count: int):
+        if isinstance(value, tuple):
+            return np.random.uniform(value[0], value[1], count)
+        return value
+
+    # ---------- Simulazione ----------
+    def update(self, dt: float, life_dt: Optional[float] = None):
+        """life_dt: tempo di invecchiamento se diverso dal dt di movimento (slow-motion)"""
+        n = self.count
+        if n == 0:
+            return
+        data = self.data[:n]
+        drag_x, drag_y = self.drag
+        if drag_x != 1.0:
+            data[:, self.VX] *= drag_x
+        if drag_y != 1.0:
+            data[:, self.VY] *= drag_y
+        data[:, self.VY] += data[:, self.GRAVITY] * dt
+        data[:, self.X] += data[:, self.VX] * dt
+        data[:, self.Y] += data[:, self.VY] * dt
+        if self.shrink != 1.0:
+            data[:, self.SIZE] *= self.shrink
+        data[:, self.LIFE] -= dt if life_dt is None else life_dt
+
+        dead = np.flatnonzero(data[:, self.LIFE] <= 0)
+        if dead.size:
+            self._swap_remove(dead)
+
+    def _swap_remove(self, dead: np.ndarray):
+        """I buchi sotto il nuovo count vengono riempiti dalle vive in coda"""
+        n = self.count
+        new_count = n - dead.size
+        holes = dead[dead < new_count]
+        if holes.size:
+            tail = np.arange(new_count, n)
+            movers = tail[self.data[new_count:n, self.LIFE] > 0]
+            self.data[holes] = self.data[movers]
+        self.count = new_count
+
+    # ---------- Disegno ----------
+    def draw(self, surface: pygame.Surface, offset_x: float = 0.0, offset_y: float = 0.0,
+             bounds: Optional[Tuple[int, int, int, int]] = None):
+        """offset = camera/shake; bounds = (x0, y0, x1, y1) in schermo, estremi inclusi"""
+        n = self.count
+        if n == 0:
+            return
+        data = self.data[:n]
+        ratio = np.clip(data[:, self.LIFE] / data[:, self.MAX_LIFE], 0.0, 1.0)
+        fade = ratio * ratio if self.fade == "quadratic" else ratio
+        sizes = data[:, self.SIZE] * fade if self.size_fade else data[:, self.SIZE]
+        screen_x = data[:, self.X] + offset_x
+        screen_y = data[:, self.Y] + offset_y
+
+        visible = sizes > 0
+        if bounds is not None:
+            x0, y0, x1, y1 = bounds
+            visible &= (screen_x >= x0) & (screen_x <= x1) & (screen_y >= y0) & (screen_y <= y1)
+        rows = np.flatnonzero(visible)
+        if rows.size == 0:
+            return
+        fade = fade[rows]
+        sizes = sizes[rows]
+        xs = screen_x[rows].astype(np.int64)
+        ys = screen_y[rows].astype(np.int64)
+        radii = np.maximum(sizes.astype(np.int64), self.min_radius)
+        rgb = data[rows, self.R:self.B + 1]
+        levels = np.rint(fade * self.ALPHA_LEVELS).astype(np.int64)
+
+        if self.style == "solid":
+            glow = np.flatnonzero(data[rows, self.GLOW] > 0)
+            if glow.size:
+                glow_radii = (sizes[glow] * 2.0).astype(np.int64)
+                self._blit_sprites(surface, xs[glow], ys[glow], glow_radii,
+                                   rgb[glow], levels[glow], 150.0, premultiply=True)
+            colors = np.clip(rgb * (fade * self.intensity)[:, None], 0, 255).astype(np.int64)
+            draw_circle = pygame.draw.circle
+            for color, x, y, radius in zip(colors.tolist(), xs.tolist(), ys.tolist(), radii.tolist()):
+                draw_circle(surface, color, (x, y), radius)
+        else:
+            self._blit_sprites(surface, xs, ys, radii, rgb, levels, data[rows, self.ALPHA])
+
+    def _blit_sprites(self, surface: pygame.Surface, xs, ys, radii, rgb, levels, alpha,
+                      premultiply: bool = False):
+        sprites = self._sprites
+        if len(sprites) > self.MAX_SPRITES:
+            sprites.clear()
+        alpha = np.broadcast_to(alpha, radii.shape)
+        blits = []
+        for x, y, radius, color, level, base_alpha in zip(xs.tolist(), ys.tolist(), radii.tolist(),
+                                                         rgb.astype(np.int64).tolist(),
+                                                         levels.tolist(), alpha.tolist()):
+            if radius <= 0 or level <= 0:
+                continue
+            key = (radius, color[0], color[1], color[2], level, base_alpha, premultiply)
+            sprite = sprites.get(key)
+            if sprite is None:
+                fade = level / self.ALPHA_LEVELS
+                if premultiply:
+                    color = [c * fade for c in color]
+                sprite = self.sprites.circle(radius, color, base_alpha * fade)
+                if sprite is None:
+                    continue
+                sprites[key] = sprite
+            blits.append((sprite, (x - radius, y - radius)))
+        surface.blits(blits, doreturn=False)
+
+
+# ============== CAMERA ==============
+class Camera:
+    """Viewport delle ROM a mondo scorrevole: mondo→schermo (camera + shake)
+    e culling sul rettangolo di vista allargato di un margine.
+
+    begin() una volta per draw, poi visible() per layer: i conteggi degli
+    scartati finiscono nei counter del profiler (overlay P) come culled_<layer>."""
+
+    def __init__(self, width: int = 1280, height: int = 720, margin: float = 50.0,
+                 profiler: Optional["FrameProfiler"] = None):
+        self.width = width
+        self.height = height
+        self.margin = margin
+        self.profiler = profiler
+        self.x = 0.0            # Angolo in alto a sinistra della vista, nel mondo
+        self.y = 0.0
+        self.offset_x = 0.0     # Da sommare alle coordinate mondo (shake - camera)
+        self.offset_y = 0.0
+        self.culled: Dict[str, int] = {}
+
+    def begin(self, x: float, y: float, shake_x: float = 0.0, shake_y: float = 0.0):
+        self.x = x
+        self.y = y
+        self.offset_x = shake_x - x
+        self.offset_y = shake_y - y
+
+    def to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        return x + self.offset_x, y + self.offset_y
+
+    def bounds(self, extent: Optional[float] = None) -> Tuple[float, float, float, float]:
+        """Rettangolo visibile in coordinate schermo (x0, y0, x1, y1), estremi inclusi"""
+        extent = self.margin if extent is None else extent
+        return -extent, -extent, self.width + extent, self.height + extent
+
+    def is_visible(self, x: float, y: float, extent: Optional[float] = None) -> bool:
+        extent = self.margin if extent is None else extent
+        screen_x = x + self.offset_x
+        screen_y = y + self.offset_y
+        return (-extent <= screen_x <= self.width + extent and
+                -extent <= screen_y <= self.height + extent)
+
+    def visible(self, layer: str, items, extent=None) -> list:
+        """Entità di items (con .x/.y nel mondo) dentro la vista.
+        extent: margine in pixel, numero oppure funzione dell'entità (es. raggio)."""
+        if extent is None:
+            extent = self.margin
+        if callable(extent):
+            result = [item for item in items if self.is_visible(item.x, item.y, extent(item))]
+        else:
+            x0 = -extent - self.offset_x
+            y0 = -extent - self.offset_y
+            x1 = self.width + extent - self.offset_x
+            y1 = self.height + extent - self.offset_y
+            result = [item for item in items if x0 <= item.x <= x1 and y0 <= item.y <= y1]
+        self._report(layer, len(items) - len(result))
+        return result
+
+    def visible_mask(self, layer: str, xs: np.ndarray, ys: np.ndarray,
+                     extent: Optional[float] = None) -> np.ndarray:
+        """Come visible() per entità in array NumPy (SoA): maschera booleana"""
+        extent = self.margin if extent is None else extent
+        screen_x = xs + self.offset_x
+        screen_y = ys + self.offset_y
+        mask = ((screen_x >= -extent) & (screen_x <= self.width + extent) &
+                (screen_y >= -extent) & (screen_y <= self.height + extent))
+        self._report(layer, int(mask.size - np.count_nonzero(mask)))
+        return mask
+
+    def _report(self, layer: str, culled: int):
+        self.culled[layer] = culled
+        if self.profiler is not None:
+            self.profiler.set_counter("culled_" + layer, culled)
 
 
 # ============== ANIMATED BACKGROUND ==============
 class AnimatedBackground:
     """Sfondo animato professionale stile arcade"""
 
+    WIDTH = 1280
+    HEIGHT = 720
+    GRADIENT_FPS = 15        # Rebuild del gradiente al massimo 15 volte al secondo
+    STAR_LEVELS = 32         # Livelli di luminosità pre-renderizzati per le stelle
+    LINE_COLOR = (100, 120, 200)
+    MAX_LINE_LENGTH = 150
+
     def __init__(self):
         self.stars = []
         self.time = 0.0
@@ -368,6 +1255,58 @@ class AnimatedBackground:
                 'thickness': random.randint(1, 3)
             })
 
+        # Gradiente: colonna NumPy 1xH scalata in una surface persistente
+        self._gradient_factor = np.arange(self.HEIGHT, dtype=np.float64) / self.HEIGHT
+        self._gradient_column = pygame.Surface((1, self.HEIGHT))
+        self._gradient_surface = pygame.Surface((self.WIDTH, self.HEIGHT))
+        self._gradient_bucket = None
+
+        self._build_sprite_atlas()
+
+    def _build_sprite_atlas(self):
+        """Pre-renderizza stelle (size x luminosità) e speed line in un unico atlas"""
+        cell = 8
+        line_rows = 3
+        atlas_w = max(cell * self.STAR_LEVELS, self.MAX_LINE_LENGTH)
+        atlas_h = cell * 3 + line_rows * cell
+        self.atlas = pygame.Surface((atlas_w, atlas_h), pygame.SRCALPHA)
+        self.atlas.fill((0, 0, 0, 0))
+
+        # Stelle: riga = size (1..3), colonna = livello luminosità
+        self._star_rects = {}
+        for size in (1, 2, 3):
+            row_y = (size - 1) * cell
+            for level in range(self.STAR_LEVELS):
+                color_val = int(255 * level / (self.STAR_LEVELS - 1))
+                color = (color_val, color_val, min(255, color_val + 50))
+                cx = level * cell + cell // 2
+                cy = row_y + cell // 2
+                if size > 1:
+                    pygame.draw.circle(self.atlas, color, (cx, cy), size)
+                    rect = pygame.Rect(cx - size, cy - size, size * 2 + 1, size * 2 + 1)
+                else:
+                    self.atlas.set_at((cx, cy), color)
+                    rect = pygame.Rect(cx, cy, 1, 1)
+                self._star_rects[(size, level)] = (rect, cx - rect.x, cy - rect.y)
+
+        # Speed line: una riga per spessore, lunghezza massima (si ritaglia con area)
+        self._line_rects = {}
+        for thickness in (1, 2, 3):
+            row_y = cell * 3 + (thickness - 1) * cell
+            cy = row_y + cell // 2
+            pygame.draw.line(self.atlas, self.LINE_COLOR, (0, cy), (self.MAX_LINE_LENGTH, cy), thickness)
+            self._line_rects[thickness] = (row_y, cy - row_y)
+
+    def _rebuild_gradient(self):
+        t = self._gradient_bucket / self.GRADIENT_FPS
+        factor = self._gradient_factor
+        column = np.empty((1, self.HEIGHT, 3), dtype=np.uint8)
+        column[0, :, 0] = (5 + np.sin(t * 0.5 + factor) * 3).astype(np.uint8)
+        column[0, :, 1] = (8 + np.sin(t * 0.3 + factor * 1.5) * 3).astype(np.uint8)
+        column[0, :, 2] = (25 + np.sin(t * 0.4 + factor * 2) * 5).astype(np.uint8)
+        pygame.surfarray.blit_array(self._gradient_column, column)
+        pygame.transform.scale(self._gradient_column, (self.WIDTH, self.HEIGHT), self._gradient_surface)
+
     def update(self, dt: float):
         self.time += dt
 
@@ -384,47 +1323,50 @@ class AnimatedBackground:
                 line['y'] = random.randint(0, 720)
 
     def draw(self, surface: pygame.Surface):
-        for y in range(720):
-            factor = y / 720
-            r = int(5 + math.sin(self.time * 0.5 + factor) * 3)
-            g = int(8 + math.sin(self.time * 0.3 + factor * 1.5) * 3)
-            b = int(25 + math.sin(self.time * 0.4 + factor * 2) * 5)
-            pygame.draw.line(surface, (r, g, b), (0, y), (1280, y))
-
+        bucket = int(self.time * self.GRADIENT_FPS)
+        if bucket != self._gradient_bucket:
+            self._gradient_bucket = bucket
+            self._rebuild_gradient()
+        surface.blit(self._gradient_surface, (0, 0))
+
+        atlas = self.atlas
+        top_level = self.STAR_LEVELS - 1
+        blits = []
         for star in self.stars:
-            brightness = int(star['brightness'] * 255)
             twinkle = abs(math.sin(self.time * 2 + star['x'] * 0.01)) * 0.3 + 0.7
-            color_val = int(brightness * twinkle)
-            color = (color_val, color_val, min(255, color_val + 50))
-
-            if star['size'] > 1:
-                pygame.draw.circle(surface, color, (int(star['x']), int(star['y'])), star['size'])
-            else:
-                try:
-                    surface.set_at((int(star['x']), int(star['y'])), color)
-                except:
-                    pass
+            level = int(star['brightness'] * twinkle * top_level)
+            rect, cx, cy = self._star_rects[(star['size'], level)]
+            blits.append((atlas, (int(star['x']) - cx, int(star['y']) - cy), rect))
 
         for line in self.speed_lines:
-            color = (100, 120, 200)
-            start_pos = (int(line['x']), int(line['y']))
-            end_pos = (int(line['x'] + line['length']), int(line['y']))
-            pygame.draw.line(surface, color, start_pos, end_pos, line['thickness'])
+            row_y, cy = self._line_rects[line['thickness']]
+            area = pygame.Rect(0, row_y, line['length'] + 1, cy * 2)
+            blits.append((atlas, (int(line['x']), int(line['y']) - cy), area))
+
+        surface.blits(blits, False)
 
 
 # ============== MENU CAROUSEL ==============
 class CarouselItem:
     """Elemento del carousel con animazioni"""
 
-    def __init__(self, name: str, description: str, image_surface: pygame.Surface):
+    def __init__(self, name: str, description: str, image_loader: Callable[[], pygame.Surface],
+                 text_cache: TextCache):
         self.name = name
         self.description = description
-        self.image = image_surface
-        self.font_title = pygame.font.Font(None, 75)
-        self.font_desc = pygame.font.Font(None, 38)
-
-    def draw(self, surface: pygame.Surface, x: int, y: int, alpha: float = 1.0, offset_x: float = 0):
-        draw_x = int(x + offset_x)
+        self._image_loader = image_loader
+        self._image: Optional[pygame.Surface] = None
+        self.text_cache = text_cache
+        self._composed = None  # Card statica: composta una volta sola
+
+    @property
+    def image(self) -> pygame.Surface:
+        """PNG caricato alla prima visualizzazione della card"""
+        if self._image is None:
+            self._image = self._image_loader()
+        return self._image
+
+    def _compose(self) -> pygame.Surface:
         temp_surface = pygame.Surface((900, 550), pygame.SRCALPHA)
         temp_surface.fill((0, 0, 0, 0))
 
@@ -435,26 +1377,27 @@ class CarouselItem:
 
         # Titolo con outline
         text_y = 390
-        for offset in [(0, 4), (4, 0), (0, -4), (-4, 0), (3, 3), (-3, 3), (3, -3), (-3, -3)]:
-            outline = self.font_title.render(self.name, True, (0, 0, 0))
-            temp_surface.blit(outline, outline.get_rect(center=(450 + offset[0], text_y + offset[1])))
-
-        title = self.font_title.render(self.name, True, (255, 230, 0))
+        title = self.text_cache.render(self.name, 75, (255, 230, 0), ((0, 0, 0), 3))
         temp_surface.blit(title, title.get_rect(center=(450, text_y)))
 
         # Descrizione
-        desc = self.font_desc.render(self.description, True, (230, 240, 255))
+        desc = self.text_cache.render(self.description, 38, (230, 240, 255))
         temp_surface.blit(desc, desc.get_rect(center=(450, text_y + 60)))
+        return temp_surface
 
-        if alpha < 1.0:
-            temp_surface.set_alpha(int(alpha * 255))
-        surface.blit(temp_surface, (draw_x, y))
+    def draw(self, surface: pygame.Surface, x: int, y: int, alpha: float = 1.0, offset_x: float = 0):
+        if self._composed is None:
+            self._composed = self._compose()
+        draw_x = int(x + offset_x)
+        self._composed.set_alpha(None if alpha >= 1.0 else int(alpha * 255))
+        surface.blit(self._composed, (draw_x, y))
 
 
 class MenuCarousel:
     """Carousel menu professionale - carica PNG dal nome del gioco"""
 
-    def __init__(self, images_dir: str = "menu_images"):
+    def __init__(self, images_dir: str = "menu_images", text_cache: Optional[TextCache] = None):
+        self.text_cache = text_cache or TextCache()
         self.images_dir = Path(resource_path(images_dir))
         self.images_dir.mkdir(exist_ok=True)
         self.items: List[CarouselItem] = []
@@ -466,8 +1409,13 @@ class MenuCarousel:
         self.target_index = 0
 
     def add_item(self, name: str, description: str):
-        image = self._load_or_create_image(name)
-        self.items.append(CarouselItem(name, description, image))
+        loader = lambda: self._load_or_create_image(name)
+        self.items.append(CarouselItem(name, description, loader, self.text_cache))
+
+    def replace_item(self, index: int, name: str, description: str):
+        """Sostituisce la card (hot-reload): stessa posizione, card ricomposta"""
+        loader = lambda: self._load_or_create_image(name)
+        self.items[index] = CarouselItem(name, description, loader, self.text_cache)
 
     def _load_or_create_image(self, item_name: str) -> pygame.Surface:
         """Carica PNG con il nome del gioco o crea placeholder"""
@@ -565,6 +1513,7 @@ class Config:
 
     CONFIG_FILE = "trackball_arcade_config.json"
     VALID_RESOLUTIONS = [(1280, 720), (1920, 1080)]
+    VALID_SCALING_FILTERS = ["fast", "quality"]
 
     def __init__(self):
         self.trackball_sensitivity = 50
@@ -573,6 +1522,12 @@ class Config:
         self.smooth_movement = True
         self.music_volume = 0.7
         self.sfx_volume = 0.8
+        self.scaling_filter = "fast"  # "fast" = transform.scale, "quality" = smoothscale
+        self.dirty_rects = False      # Aggiorna solo le regioni cambiate nelle schermate statiche
+        self.sfx_channels = 16        # Canali del mixer effetti
+        self.trackball_event_mode = False  # Input da MOUSEMOTION con smoothing dt-correct
+        self.profiler_dump = ""       # Dump del profiler all'uscita: "", "csv" o "json"
+        self.rom_hot_reload = True    # Ricarica le ROM modificate in roms/ senza riavvio
         self.load()
 
     def load(self):
@@ -586,6 +1541,14 @@ class Config:
                 self.smooth_movement = bool(data.get('smooth_movement', True))
                 self.music_volume = max(0.0, min(1.0, data.get('music_volume', 0.7)))
                 self.sfx_volume = max(0.0, min(1.0, data.get('sfx_volume', 0.8)))
+                scaling_filter = data.get('scaling_filter', "fast")
+                self.scaling_filter = scaling_filter if scaling_filter in self.VALID_SCALING_FILTERS else "fast"
+                self.dirty_rects = bool(data.get('dirty_rects', False))
+                self.sfx_channels = max(8, min(64, int(data.get('sfx_channels', 16))))
+                self.trackball_event_mode = bool(data.get('trackball_event_mode', False))
+                profiler_dump = data.get('profiler_dump', "")
+                self.profiler_dump = profiler_dump if profiler_dump in ("", "csv", "json") else ""
+                self.rom_hot_reload = bool(data.get('rom_hot_reload', True))
         except (FileNotFoundError, json.JSONDecodeError):
             self.save()
 
@@ -597,7 +1560,13 @@ class Config:
                 'fullscreen': self.fullscreen,
                 'smooth_movement': self.smooth_movement,
                 'music_volume': self.music_volume,
-                'sfx_volume': self.sfx_volume
+                'sfx_volume': self.sfx_volume,
+                'scaling_filter': self.scaling_filter,
+                'dirty_rects': self.dirty_rects,
+                'sfx_channels': self.sfx_channels,
+                'trackball_event_mode': self.trackball_event_mode,
+                'profiler_dump': self.profiler_dump,
+                'rom_hot_reload': self.rom_hot_reload
             }, f, indent=2)
 
 
@@ -652,6 +1621,145 @@ class HighScoreManager:
         return scores[0]['score'] if scores else 0
 
 
+# ============== FRAME PROFILER ==============
+class FrameProfiler:
+    """Profiler per fase del frame (ring buffer perf_counter_ns) con overlay e dump"""
+
+    PHASES = ('events', 'trackball', 'update', 'draw', 'present')
+    COLUMNS = PHASES + ('frame', 'latency')
+
+    def __init__(self, capacity: int = 1024, dump_format: str = ""):
+        self.capacity = capacity
+        self.dump_format = dump_format  # "", "csv" o "json"
+        self.samples = np.zeros((capacity, len(self.COLUMNS)), dtype=np.int64)
+        self.labels = np.zeros(capacity, dtype=np.int32)
+        self.label_names: List[str] = []
+        self._label_index: Dict[str, int] = {}
+        self.count = 0       # Frame totali registrati
+        self.counters: Dict[str, int] = {}
+
+        self.show_overlay = False
+        self.font = None
+        self._overlay_surface = None
+        self._overlay_refresh = 0
+
+        self._row = np.zeros(len(self.COLUMNS), dtype=np.int64)
+        self.frame_start_ns = 0
+        self._last_mark = 0
+        self._label = 0
+
+    def begin_frame(self, label: str):
+        self.frame_start_ns = self._last_mark = time.perf_counter_ns()
+        self._row[:] = 0
+        self._row[self.COLUMNS.index('latency')] = -1
+        index = self._label_index.get(label)
+        if index is None:
+            index = self._label_index[label] = len(self.label_names)
+            self.label_names.append(label)
+        self._label = index
+
+    def mark(self, phase: str):
+        """Attribuisce a phase il tempo trascorso dall'ultimo mark"""
+        now = time.perf_counter_ns()
+        self._row[self.PHASES.index(phase)] += now - self._last_mark
+        self._last_mark = now
+
+    def set_counter(self, name: str, value: int):
+        self.counters[name] = value
+
+    def end_frame(self, input_time_ns: Optional[int] = None):
+        """input_time_ns: istante del primo movimento trackball del frame (se c'è)"""
+        now = time.perf_counter_ns()
+        self._row[self.COLUMNS.index('frame')] = now - self.frame_start_ns
+        if input_time_ns is not None:
+            self._row[self.COLUMNS.index('latency')] = now - input_time_ns
+        slot = self.count % self.capacity
+        self.samples[slot] = self._row
+        self.labels[slot] = self._label
+        self.count += 1
+
+    def _filled(self) -> Tuple[np.ndarray, np.ndarray]:
+        n = min(self.count, self.capacity)
+        return self.samples[:n], self.labels[:n]
+
+    def percentiles(self, label: Optional[str] = None) -> Dict[str, Tuple[float, float, float]]:
+        """p50/p95/p99 in millisecondi per colonna"""
+        samples, labels = self._filled()
+        if label is not None:
+            samples = samples[labels == self._label_index.get(label, -1)]
+        result = {}
+        for i, column in enumerate(self.COLUMNS):
+            values = samples[:, i]
+            if column == 'latency':
+                values = values[values >= 0]
+            if len(values) == 0:
+                result[column] = (0.0, 0.0, 0.0)
+            else:
+                p50, p95, p99 = np.percentile(values, (50, 95, 99)) / 1e6
+                result[column] = (float(p50), float(p95), float(p99))
+        return result
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        self._overlay_refresh = 0
+        if self.show_overlay and not self.font:
+            self.font = pygame.font.Font(None, 22)
+
+    def draw_overlay(self, surface: pygame.Surface):
+        # Percentili ricalcolati ogni 15 frame: il testo cambia poco e costa
+        if self._overlay_surface is None or self.count >= self._overlay_refresh:
+            self._overlay_refresh = self.count + 15
+            stats = self.percentiles()
+            label = self.label_names[self._label] if self.label_names else "-"
+            lines = [f"PROFILER [{label}]  ms   p50    p95    p99"]
+            for column in self.COLUMNS:
+                p50, p95, p99 = stats[column]
+                lines.append(f"{column:<10} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+            for name, value in self.counters.items():
+                lines.append(f"{name}: {value}")
+
+            rendered = [self.font.render(line, True, (200, 255, 200)) for line in lines]
+            width = max(r.get_width() for r in rendered) + 16
+            height = sum(r.get_height() for r in rendered) + 12
+            self._overlay_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            self._overlay_surface.fill((0, 0, 0, 180))
+            y = 6
+            for r in rendered:
+                self._overlay_surface.blit(r, (8, y))
+                y += r.get_height()
+        surface.blit(self._overlay_surface, (10, 40))
+
+    def dump(self, directory: str = "profiles") -> Optional[Path]:
+        if self.dump_format not in ("csv", "json") or self.count == 0:
+            return None
+        out_dir = Path(directory)
+        out_dir.mkdir(exist_ok=True)
+        path = out_dir / f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{self.dump_format}"
+        samples, labels = self._filled()
+        # Ordine cronologico anche dopo il wrap del ring buffer
+        start = self.count % self.capacity if self.count > self.capacity else 0
+        order = np.roll(np.arange(len(samples)), -start)
+
+        if self.dump_format == "csv":
+            with open(path, 'w') as f:
+                f.write("label," + ",".join(f"{c}_us" for c in self.COLUMNS) + "\n")
+                for i in order:
+                    values = ",".join(str(v // 1000) if v >= 0 else "" for v in samples[i])
+                    f.write(f"{self.label_names[labels[i]]},{values}\n")
+        else:
+            def as_dict(stats):
+                return {column: dict(zip(('p50', 'p95', 'p99'), values)) for column, values in stats.items()}
+            with open(path, 'w') as f:
+                json.dump({
+                    'frames': int(len(samples)),
+                    'overall': as_dict(self.percentiles()),
+                    'by_label': {name: as_dict(self.percentiles(name)) for name in self.label_names},
+                    'counters': self.counters
+                }, f, indent=2)
+        print(f"[Profiler] Dump saved: {path}")
+        return path
+
+
 # ============== DISPLAY MANAGER ==============
 class DisplayManager:
     """Gestione display professionale con scaling"""
@@ -666,6 +1774,10 @@ class DisplayManager:
         self.scale = 1.0
         self.offset_x = 0
         self.offset_y = 0
+        self.render_mode = "direct"  # "direct" | "scale" | "smooth"
+        self.scaled_surface = None   # Destinazione pre-allocata per lo scaling
+        self.has_letterbox = False
+        self.force_full_update = True  # Il prossimo frame aggiorna tutto lo schermo
 
         self.show_fps = False
         self.fps_font = None
@@ -682,11 +1794,12 @@ class DisplayManager:
             self.screen = pygame.display.set_mode((1280, 720), 0)
 
         self.calculate_letterbox()
+        self.force_full_update = True
         if self.show_fps:
             self.fps_font = pygame.font.Font(None, 24)
 
     def calculate_letterbox(self):
-        screen_w, screen_h = self.config.resolution
+        screen_w, screen_h = self.screen.get_size() if self.screen else self.config.resolution
         scale_x = screen_w / self.VIRTUAL_WIDTH
         scale_y = screen_h / self.VIRTUAL_HEIGHT
         self.scale = min(scale_x, scale_y)
@@ -696,24 +1809,100 @@ class DisplayManager:
 
         self.offset_x = (screen_w - scaled_w) // 2
         self.offset_y = (screen_h - scaled_h) // 2
+        self.has_letterbox = self.offset_x > 0 or self.offset_y > 0
+
+        # Scelta modalità: blit diretto a scala 1:1, altrimenti scale/smoothscale
+        # verso una surface allocata una sola volta
+        if (scaled_w, scaled_h) == (self.VIRTUAL_WIDTH, self.VIRTUAL_HEIGHT):
+            self.render_mode = "direct"
+            self.scaled_surface = None
+        else:
+            self.render_mode = "smooth" if self.config.scaling_filter == "quality" else "scale"
+            self.scaled_surface = pygame.Surface((scaled_w, scaled_h)).convert(self.virtual_surface)
+
+    def render(self, fps: float = 0.0, dirty_rects: Optional[List[pygame.Rect]] = None,
+               profiler: Optional[FrameProfiler] = None):
+        """Presenta il frame. dirty_rects (coordinate virtuali): None = frame completo,
+        lista vuota = nessun aggiornamento"""
+        show_profiler = profiler is not None and profiler.show_overlay
+        if (dirty_rects is not None and not self.show_fps and not show_profiler
+                and not self.force_full_update):
+            self._render_dirty(dirty_rects)
+            return
+        self.force_full_update = False
 
-    def render(self, fps: float = 0.0):
-        self.screen.fill((0, 0, 0))
+        if self.has_letterbox:
+            self.screen.fill((0, 0, 0))
 
-        scaled = pygame.transform.smoothscale(self.virtual_surface,
-                                             (int(self.VIRTUAL_WIDTH * self.scale),
-                                              int(self.VIRTUAL_HEIGHT * self.scale)))
-        self.screen.blit(scaled, (self.offset_x, self.offset_y))
+        if self.render_mode == "direct":
+            self.screen.blit(self.virtual_surface, (self.offset_x, self.offset_y))
+        else:
+            size = self.scaled_surface.get_size()
+            if self.render_mode == "smooth":
+                pygame.transform.smoothscale(self.virtual_surface, size, self.scaled_surface)
+            else:
+                pygame.transform.scale(self.virtual_surface, size, self.scaled_surface)
+            self.screen.blit(self.scaled_surface, (self.offset_x, self.offset_y))
 
         if self.show_fps and self.fps_font and fps > 0:
             color = (0, 255, 0) if fps >= 58 else (255, 255, 0) if fps >= 45 else (255, 0, 0)
             fps_text = self.fps_font.render(f"FPS: {fps:.1f}", True, color)
             self.screen.blit(fps_text, (10, 10))
+        if show_profiler:
+            profiler.draw_overlay(self.screen)
 
         pygame.display.flip()
 
+    def _render_dirty(self, dirty_rects: List[pygame.Rect]):
+        if not dirty_rects:
+            return
+
+        bounds = self.virtual_surface.get_rect()
+        if self.render_mode == "smooth":
+            # Il filtro per singola regione lascerebbe giunture ai bordi dei rect:
+            # si filtra l'intero frame e si presentano solo le zone sporche
+            pygame.transform.smoothscale(self.virtual_surface, self.scaled_surface.get_size(),
+                                         self.scaled_surface)
+        scaled_bounds = self.scaled_surface.get_rect() if self.scaled_surface else None
+        screen_rects = []
+        for rect in dirty_rects:
+            rect = pygame.Rect(rect)
+            if self.render_mode == "scale":
+                # Un pixel di margine: il campionamento della sola regione non coincide
+                # con quello del frame intero proprio sul bordo del rect
+                rect.inflate_ip(2, 2)
+            rect = rect.clip(bounds)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+
+            if self.render_mode == "direct":
+                dest = rect.move(self.offset_x, self.offset_y)
+                self.screen.blit(self.virtual_surface, dest, rect)
+            else:
+                left = int(rect.left * self.scale)
+                top = int(rect.top * self.scale)
+                area = pygame.Rect(left, top, int(rect.right * self.scale) - left,
+                                   int(rect.bottom * self.scale) - top)
+                if self.render_mode == "smooth":
+                    # Il filtro sconfina di un pixel oltre la regione scalata
+                    area = area.inflate(4, 4).clip(scaled_bounds)
+                else:
+                    area = area.clip(scaled_bounds)
+                    if area.width <= 0 or area.height <= 0:
+                        continue
+                    # Scala dentro la surface preallocata, niente Surface nuove per rect
+                    pygame.transform.scale(self.virtual_surface.subsurface(rect), area.size,
+                                           self.scaled_surface.subsurface(area))
+                dest = area.move(self.offset_x, self.offset_y)
+                self.screen.blit(self.scaled_surface, dest, area)
+            screen_rects.append(dest)
+
+        if screen_rects:
+            pygame.display.update(screen_rects)
+
     def toggle_fps_display(self):
         self.show_fps = not self.show_fps
+        self.force_full_update = True
         if self.show_fps and not self.fps_font:
             self.fps_font = pygame.font.Font(None, 24)
 
@@ -780,12 +1969,19 @@ class MusicManager:
 class MiniGame(ABC):
     """Classe base astratta per minigiochi"""
 
+    # Opt-in passo fisso: se impostato (es. 1/120) il motore chiama update() con
+    # dt costante, al massimo max_substeps volte per frame, e draw(surface, alpha)
+    fixed_timestep: Optional[float] = None
+    max_substeps: int = 5
+
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
         self.score = 0
         self.is_game_over = False
         self.is_paused = False
+        self.time_accumulator = 0.0
+        self.interpolation_alpha = 1.0
 
     @abstractmethod
     def reset(self):
@@ -808,6 +2004,51 @@ class MiniGame(ABC):
     def get_score(self) -> int:
         return self.score
 
+# ============== ROM ENTRY ==============
+class RomEntry:
+    """ROM nota al carousel: metadati subito, istanza caricata on-demand"""
+
+    def __init__(self, path: Path, class_name: str, name: str, description: str):
+        self.path = path
+        self.class_name = class_name
+        self.name = name
+        self.description = description
+        self.instance: Optional[MiniGame] = None
+        self.failed = False
+        self.mtime = path.stat().st_mtime_ns  # Per l'hot-reload
+        self.code = None  # (mtime_ns, bytecode) compilato dal prefetch in background
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.instance is not None
+
+
+ROM_CLASS_PATTERN = re.compile(r'^class\s+(\w+)\s*\([^)]*\bMiniGame\b[^)]*\)\s*:', re.MULTILINE)
+ROM_SUPER_PATTERN = re.compile(
+    r'super\(\)\.__init__\(\s*((?:\'[^\'\n]*\'|"[^"\n]*"))\s*,\s*((?:\'[^\'\n]*\'|"[^"\n]*"))')
+
+
+def read_rom_metadata(py_file: Path) -> Optional[Tuple[str, str, str]]:
+    """Scansione testuale senza eseguire il modulo: (classe, nome, descrizione) dalla
+    chiamata super().__init__("Nome", "Descrizione", ...) della sottoclasse MiniGame.
+    Un ast.parse completo di VampireBall costa più dell'import da .pyc: qui si
+    valutano solo i due letterali."""
+    source = py_file.read_text(encoding='utf-8')
+    class_match = ROM_CLASS_PATTERN.search(source)
+    if not class_match:
+        return None
+    next_class = source.find('\nclass ', class_match.end())
+    body = source[class_match.end():next_class if next_class != -1 else len(source)]
+    super_match = ROM_SUPER_PATTERN.search(body)
+    if not super_match:
+        return None
+    try:
+        name, description = (ast.literal_eval(group) for group in super_match.groups())
+    except (ValueError, SyntaxError):
+        return None
+    return (class_match.group(1), name, description)
+
+
 # ============== GAME STATE ==============
 class GameState(Enum):
     MENU = "menu"
@@ -821,16 +2062,28 @@ class GameState(Enum):
 class TrackballArcadeSystem:
     """Sistema principale arcade professionale con caricamento dinamico ROMs"""
 
+    BUTTON_EDGE_FLAGS = (
+        'button_left_pressed', 'button_middle_pressed', 'button_right_pressed',
+        'button_left_released', 'button_middle_released', 'button_right_released'
+    )
+    ROM_WATCH_INTERVAL = 0.5  # Secondi tra due controlli degli mtime in roms/
+
     def __init__(self):
         pygame.init()
 
         self.config = Config()
         self.display = DisplayManager(self.config)
-        self.trackball = TrackballInput(self.config.trackball_sensitivity)
-        self.sound = SoundSynthesizer()
+        self.trackball = TrackballInput(self.config.trackball_sensitivity,
+                                        event_mode=self.config.trackball_event_mode)
+        self.sound = SoundSynthesizer(num_channels=self.config.sfx_channels,
+                                      volume=self.config.sfx_volume)
         self.music = MusicManager()
         self.high_scores = HighScoreManager()
         self.background = AnimatedBackground()
+        self.text_cache = TextCache()
+        self.glow_cache = GlowCache()
+        self._glow_misses = 0
+        self.profiler = FrameProfiler(dump_format=self.config.profiler_dump)
         self.highscore_input_active = False
         self.highscore_boxes = ['A', 'A', 'A']
         self.highscore_current_box = 0
@@ -839,17 +2092,22 @@ class TrackballArcadeSystem:
         self._setup_mouse_capture()
 
         self.state = GameState.MENU
-        self.carousel = MenuCarousel("roms")  # Passa cartella roms per immagini
+        self.carousel = MenuCarousel("roms", self.text_cache)  # Passa cartella roms per immagini
         self.clock = pygame.time.Clock()
         self.running = True
 
-        self.games: List[MiniGame] = []
+        self.games: List[RomEntry] = []
+        self._rom_reloads: deque = deque()  # (entry, mtime) cambiate, da ricaricare nel main loop
+        self._prefetch_queue: deque = deque()  # ROM da istanziare nel main loop a menu idle
+        self._prefetch_compiled = False        # Il thread di prefetch ha finito di compilare
         self.current_game: Optional[MiniGame] = None
 
         self.font_large = pygame.font.Font(None, 80)
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 36)
         self.highscore_entered_this_game = False
+        self._screen_signature = None  # Ultimo contenuto presentato (dirty-rect)
+        self._pending_button_flags: Dict[str, bool] = {}  # Click rinviati (passo fisso)
         self.settings_selected = 0
         self.settings_options = [
             "Trackball Sensitivity",
@@ -860,6 +2118,9 @@ class TrackballArcadeSystem:
 
         self._load_roms()  # 🔧 NUOVO: Carica giochi dinamicamente da roms/
         self._setup_sounds()
+        self._start_rom_prefetch()
+        if self.config.rom_hot_reload:
+            self._start_rom_watcher()
 
         self.music.set_volume(self.config.music_volume)
         self.music.play_menu_music()
@@ -876,16 +2137,24 @@ class TrackballArcadeSystem:
 
 
     def _load_roms(self):
+        """Fase 1: scansione metadati (nessun import). Le ROM si istanziano alla
+        prima selezione o nel prefetch in background mentre il menu è idle."""
         roms_dir = Path("roms")
         roms_dir.mkdir(exist_ok=True)
         
         print("[ROMS] Scanning roms/ directory...")
-        loaded_count = 0
         
         # 🔧 FIX: Prepara le dipendenze da iniettare
-        shared_globals = {
+        self._rom_globals = {
             'MiniGame': MiniGame,
             'TrackballInput': TrackballInput,
+            'text_cache': self.text_cache,
+            'glow_cache': self.glow_cache,
+            'GlowCache': GlowCache,
+            'SpatialHashGrid': SpatialHashGrid,
+            'ParticleSystem': ParticleSystem,
+            'Camera': Camera,
+            'profiler': self.profiler,
             'pygame': pygame,
             'math': math,
             'random': random,
@@ -893,88 +2162,238 @@ class TrackballArcadeSystem:
             'os': os
         }
         
-        for py_file in roms_dir.glob("*.py"):
+        for py_file in sorted(roms_dir.glob("*.py")):
             if py_file.name.startswith("__"):
                 continue
-                
-            module_name = f"roms.{py_file.stem}"
-            class_name = py_file.stem  # Usa il nome originale senza .title()
-            
+
             try:
-                # Pulisci namespace precedente
-                if module_name in sys.modules:
-                    del sys.modules[module_name]
-                
-                # 🔧 FIX: Carica con namespace condiviso
-                spec = importlib.util.spec_from_file_location(module_name, py_file)
-                module = importlib.util.module_from_spec(spec)
-                
-                # ✅ INIETTA LE DIPENDENZE nel __dict__ del modulo
-                module.__dict__.update(shared_globals)
-                
-                sys.modules[module_name] = module
-                spec.loader.exec_module(module)
-                
-                # Cerca la classe del gioco
-                game_class = None
-                for attr_name in dir(module):
-                    candidate = getattr(module, attr_name)
-                    if (inspect.isclass(candidate) and 
-                        issubclass(candidate, MiniGame) and 
-                        candidate is not MiniGame):  # Escludi la classe base
-                        game_class = candidate
-                        break
-                
-                if game_class:
-                    try:
-                        # 🔧 ULTRA-FIX: Crea istanza con parametri flessibili/compatibili
-                        # Prova prima con solo sound (per ROM vecchi)
-                        try:
-                            game_instance = game_class(sound=self.sound)
-                        except TypeError as te:
-                            if "missing" in str(te).lower() or "args" in str(te).lower():
-                                # Fallback: passa args=None + sound + kwargs vuoti
-                                game_instance = game_class(args=None, sound=self.sound)
-                            else:
-                                raise  # Altro errore TypeError
-                        
-                        # Verifica istanza valida post-init
-                        if not hasattr(game_instance, 'name') or not hasattr(game_instance, 'description'):
-                            raise ValueError("MiniGame mancante name/description dopo __init__")
-                        if not hasattr(game_instance, 'reset') or not callable(game_instance.reset):
-                            raise ValueError("MiniGame mancante metodo reset()")
-                        
-                        self.games.append(game_instance)
-                        self.carousel.add_item(game_instance.name, game_instance.description)
-                        loaded_count += 1
-                        print(f"[ROMS] ✓ Loaded: {game_class.__name__} ({game_instance.name})")
-                    
-                    except (TypeError, ValueError) as init_error:
-                        print(f"[ROMS] ✗ Init failed {game_class.__name__}: {str(init_error)}")
-                        print("   💡 Fix ROM: def __init__(self, args, sound=None, **kwargs)")
-                    except Exception as e:
-                        print(f"[ROMS] ✗ Unexpected error {game_class.__name__}: {str(e)}")
-                        import traceback
-                        traceback.print_exc()
-                else:
-                    print(f"[ROMS] ✗ Invalid: {py_file.name} (no MiniGame subclass found)")
+                metadata = read_rom_metadata(py_file)
+            except (UnicodeDecodeError, OSError) as e:
+                print(f"[ROMS] ✗ Error scanning {py_file.name}: {str(e)}")
+                continue
 
-                    
-            except Exception as e:
-                print(f"[ROMS] ✗ Error loading {py_file.name}: {str(e)}")
-                import traceback
-                traceback.print_exc()
+            if metadata:
+                entry = RomEntry(py_file, *metadata)
+            else:
+                # Nome/descrizione non letterali: serve l'import per conoscerli
+                instance = self._instantiate_rom(py_file)
+                if instance is None:
+                    continue
+                entry = RomEntry(py_file, type(instance).__name__, instance.name, instance.description)
+                entry.instance = instance
+
+            self.games.append(entry)
+            self.carousel.add_item(entry.name, entry.description)
+            print(f"[ROMS] ✓ Found: {entry.class_name} ({entry.name})")
         
         # Aggiungi opzioni sistema
         self.carousel.add_item("Settings", "Configura trackball, audio e video")
         self.carousel.add_item("Exit", "Chiudi Trackball Arcade System")
         
-        print(f"[ROMS] Loaded {loaded_count} games (+2 built-in)")
-        if loaded_count == 0:
+        print(f"[ROMS] Found {len(self.games)} games (+2 built-in)")
+        if not self.games:
             print("[ROMS] ⚠️ No ROMs! Place .py files in roms/ with class inheriting MiniGame")
 
+    def _instantiate_rom(self, py_file: Path, class_name: Optional[str] = None,
+                         code=None) -> Optional[MiniGame]:
+        """Fase 2: import del modulo con i globals condivisi e creazione dell'istanza.
+        Il costruttore riceve un synth muto (reset() non deve suonare fuori gioco).
+        class_name (dai metadati) sceglie la classe; senza, la prima sottoclasse
+        MiniGame in ordine di sorgente, la stessa regola di read_rom_metadata.
+        code: bytecode già compilato dal prefetch (evita lettura e compilazione).
+        Usa text_cache/glow_cache condivise: va chiamato solo dal main thread."""
+        module_name = f"roms.{py_file.stem}"
+        
+        try:
+            # Pulisci namespace precedente
+            if module_name in sys.modules:
+                del sys.modules[module_name]
+            
+            # 🔧 FIX: Carica con namespace condiviso
+            spec = importlib.util.spec_from_file_location(module_name, py_file)
+            module = importlib.util.module_from_spec(spec)
+            
+            # ✅ INIETTA LE DIPENDENZE nel __dict__ del modulo
+            module.__dict__.update(self._rom_globals)
+            
+            sys.modules[module_name] = module
+            if code is not None:
+                exec(code, module.__dict__)
+            else:
+                spec.loader.exec_module(module)
+            
+            # Cerca la classe del gioco: il __dict__ del modulo segue l'ordine del sorgente
+            game_class = None
+            candidates = [candidate for candidate in module.__dict__.values()
+                          if inspect.isclass(candidate) and issubclass(candidate, MiniGame)
+                          and candidate is not MiniGame]  # Escludi la classe base
+            for candidate in candidates:
+                if candidate.__name__ == class_name:
+                    game_class = candidate
+                    break
+            else:
+                if candidates:
+                    game_class = candidates[0]
+            
+            if not game_class:
+                print(f"[ROMS] ✗ Invalid: {py_file.name} (no MiniGame subclass found)")
+                return None
 
+            muted_sound = MutedSynthesizer(self.sound)
+            try:
+                # 🔧 ULTRA-FIX: Crea istanza con parametri flessibili/compatibili
+                # Prova prima con solo sound (per ROM vecchi)
+                try:
+                    game_instance = game_class(sound=muted_sound)
+                except TypeError as te:
+                    if "missing" in str(te).lower() or "args" in str(te).lower():
+                        # Fallback: passa args=None + sound + kwargs vuoti
+                        game_instance = game_class(args=None, sound=muted_sound)
+                    else:
+                        raise  # Altro errore TypeError
+                
+                # Verifica istanza valida post-init
+                if not hasattr(game_instance, 'name') or not hasattr(game_instance, 'description'):
+                    raise ValueError("MiniGame mancante name/description dopo __init__")
+                if not hasattr(game_instance, 'reset') or not callable(game_instance.reset):
+                    raise ValueError("MiniGame mancante metodo reset()")
+                
+                game_instance.sound = self.sound
+                print(f"[ROMS] ✓ Loaded: {game_class.__name__} ({game_instance.name})")
+                return game_instance
+            
+            except (TypeError, ValueError) as init_error:
+                print(f"[ROMS] ✗ Init failed {game_class.__name__}: {str(init_error)}")
+                print("   💡 Fix ROM: def __init__(self, args, sound=None, **kwargs)")
+            except Exception as e:
+                print(f"[ROMS] ✗ Unexpected error {game_class.__name__}: {str(e)}")
+                import traceback
+                traceback.print_exc()
+                
+        except Exception as e:
+            print(f"[ROMS] ✗ Error loading {py_file.name}: {str(e)}")
+            import traceback
+            traceback.print_exc()
+        return None
+
+    def _get_game(self, entry: RomEntry) -> Optional[MiniGame]:
+        """Istanza della ROM, caricandola ora se il prefetch non è ancora arrivato"""
+        if entry.instance is None and not entry.failed:
+            prefetched = entry.code
+            code = prefetched[1] if prefetched and prefetched[0] == entry.mtime else None
+            entry.instance = self._instantiate_rom(entry.path, entry.class_name, code)
+            entry.failed = entry.instance is None
+            entry.code = None
+        return entry.instance
+
+    def _start_rom_prefetch(self):
+        self._prefetch_queue.extend(entry for entry in self.games if not entry.is_loaded)
+        threading.Thread(target=self._prefetch_roms, name="RomPrefetch", daemon=True).start()
+
+    def _prefetch_roms(self):
+        """Background: solo lettura e compilazione dei sorgenti, a menu idle.
+        Import e costruttori toccano le cache condivise del rendering (LRU non
+        thread-safe) e restano al main thread, in _prefetch_step()."""
+        for entry in list(self._prefetch_queue):
+            while self.running and (self.state != GameState.MENU or self.carousel.is_transitioning):
+                time.sleep(0.1)
+            if not self.running:
+                return
+            try:
+                mtime = entry.path.stat().st_mtime_ns
+                source = entry.path.read_bytes()
+                entry.code = (mtime, compile(source, str(entry.path), 'exec', dont_inherit=True))
+            except (OSError, SyntaxError, ValueError):
+                pass  # L'errore verrà riportato dall'import normale nel main thread
+        self._prefetch_compiled = True
+
+    def _prefetch_step(self):
+        """Main thread, a menu idle: istanzia al più una ROM per frame, quando il
+        suo bytecode è pronto (o la compilazione in background è finita)"""
+        queue = self._prefetch_queue
+        while queue and (queue[0].is_loaded or queue[0].failed):
+            queue.popleft()
+        if not queue:
+            return
+        entry = queue[0]
+        if entry.code is None and not self._prefetch_compiled:
+            return
+        queue.popleft()
+        self._get_game(entry)
+        if not queue:
+            print("[ROMS] Background prefetch complete")
+
+    # ---------- Hot-reload ----------
+    def _start_rom_watcher(self):
+        threading.Thread(target=self._watch_roms, name="RomWatcher", daemon=True).start()
+
+    def _watch_roms(self):
+        """Polling degli mtime di roms/*.py: nessuna dipendenza esterna.
+        Il thread rileva e accoda soltanto; import e costruttore della nuova
+        versione girano nel main thread (le cache condivise non sono thread-safe)."""
+        seen = {entry.path: entry.mtime for entry in self.games}
+        while self.running:
+            time.sleep(self.ROM_WATCH_INTERVAL)
+            for entry in list(self.games):
+                try:
+                    mtime = entry.path.stat().st_mtime_ns
+                except OSError:
+                    continue  # File rimosso o in scrittura: si riprova al prossimo giro
+                if mtime != seen.get(entry.path):
+                    seen[entry.path] = mtime
+                    self._rom_reloads.append((entry, mtime))
+
+    def _apply_rom_reloads(self):
+        """Main loop: ricarica le ROM accodate dal watcher"""
+        while self._rom_reloads:
+            entry, mtime = self._rom_reloads.popleft()
+            entry.mtime = mtime
+            self._reload_rom(entry)
+
+    def _reload_rom(self, entry: RomEntry):
+        """Riesegue il solo modulo cambiato con gli stessi globals condivisi e
+        aggiorna carousel e gioco in corso. Se la nuova versione fallisce resta
+        in uso l'istanza precedente."""
+        print(f"[ROMS] ↻ Change detected: {entry.path.name}")
+        try:
+            metadata = read_rom_metadata(entry.path)
+        except (UnicodeDecodeError, OSError) as e:
+            print(f"[ROMS] ✗ Reload failed {entry.path.name}: {str(e)}")
+            return
 
+        old_instance = entry.instance
+        if old_instance is None and not entry.failed and metadata:
+            # Mai caricata: basta aggiornare i metadati, l'import avverrà on-demand
+            new_instance = None
+        else:
+            # Il .pyc valida solo mtime al secondo + dimensione: due salvataggi
+            # ravvicinati della stessa lunghezza riuserebbero il bytecode vecchio
+            try:
+                os.remove(importlib.util.cache_from_source(str(entry.path)))
+            except OSError:
+                pass
+            new_instance = self._instantiate_rom(entry.path,
+                                                 metadata[0] if metadata else entry.class_name)
+            if new_instance is None:
+                print(f"[ROMS] ✗ Reload failed {entry.path.name}: keeping previous version")
+                return
+            metadata = (type(new_instance).__name__, new_instance.name, new_instance.description)
+        if metadata:
+            entry.class_name, entry.name, entry.description = metadata
+        entry.instance = new_instance
+        entry.failed = False
+
+        self.carousel.replace_item(self.games.index(entry), entry.name, entry.description)
+        self._screen_signature = None
+        if old_instance is not None and self.current_game is old_instance:
+            if self.state == GameState.PLAYING:
+                # Riparte subito con la nuova versione
+                self.current_game = entry.instance
+                self.current_game.reset()
+                self.current_game.time_accumulator = 0.0
+            elif self.state != GameState.GAME_OVER:
+                self.current_game = entry.instance
+        print(f"[ROMS] ✓ Reloaded: {entry.class_name} ({entry.name})")
 
     def _setup_mouse_capture(self):
         pygame.mouse.set_visible(False)
@@ -989,7 +2408,7 @@ class TrackballArcadeSystem:
         print("\n" + "="*60)
         print("  TRACKBALL ARCADE SYSTEM - Professional ROM Edition")
         print("="*60)
-        print("\nROMs loaded:", len(self.games))
+        print("\nROMs found:", len(self.games))
         print("\nControls:")
         print("  🎯 Trackball (Mouse): Aim / Navigate")
         print("  🔴 Left Button: Fire / Select / Start ROM")
@@ -997,51 +2416,81 @@ class TrackballArcadeSystem:
         print("  🔵 Right Button: High Scores / Back / Exit Menu")
         print("  ⌨️  ESC: Exit / Return to Menu")
         print("  ⌨️  F: Toggle FPS Display")
+        print("  ⌨️  P: Toggle Profiler Overlay")
         print("\n📁 ROMs in 'roms/' folder (*.py files)")
         print("\n" + "="*60 + "\n")
 
     def _setup_sounds(self):
-        self.sound.create_select()
-        self.sound.create_back()
-        self.sound.create_blip()
-        self.sound.create_pause()
-        self.sound.create_shoot()
-        self.sound.create_target_hit()
-        self.sound.create_target_miss()
-        self.sound.create_game_start()
-        self.sound.create_game_over()
-        self.sound.create_powerup()
+        # Banco completo in background: i suoni mancanti si sintetizzano on-demand
+        self.sound.preload_async()
 
     def run(self):
         while self.running:
             dt = self.clock.tick(60) / 1000.0
             fps = self.clock.get_fps()
+            profiler = self.profiler
+            state = self.state
+            profiler.begin_frame(self.current_game.name if state == GameState.PLAYING and self.current_game
+                                 else state.value)
 
             events = pygame.event.get()
-            self.trackball.update(events)
+            profiler.mark('events')
+            self.trackball.update(events, dt)
+            profiler.mark('trackball')
+            input_time_ns = self._input_time_ns(profiler)
 
             self._handle_global_events(events)
+            if self._rom_reloads:
+                self._apply_rom_reloads()
+            if (self._prefetch_queue and state == GameState.MENU
+                    and not self.carousel.is_transitioning):
+                self._prefetch_step()
 
-            if self.state == GameState.MENU:
+            if state == GameState.MENU:
                 self._update_menu(dt)
-                self._draw_menu()
-            elif self.state == GameState.PLAYING:
+            elif state == GameState.PLAYING:
                 self._update_game(dt)
-                self._draw_game()
-            elif self.state == GameState.HIGH_SCORES:
+            elif state == GameState.HIGH_SCORES:
                 self._update_high_scores(dt)
-                self._draw_high_scores()
-            elif self.state == GameState.SETTINGS:
+            elif state == GameState.SETTINGS:
                 self._update_settings(dt)
-                self._draw_settings()
-            elif self.state == GameState.GAME_OVER:
+            elif state == GameState.GAME_OVER:
                 self._update_game_over(dt)
-                self._draw_game_over()
+            profiler.mark('update')
 
-            self.display.render(fps)
+            dirty_rects = None
+            if state == GameState.MENU:
+                dirty_rects = self._draw_menu()
+            elif state == GameState.PLAYING:
+                self._draw_game()
+            elif state == GameState.HIGH_SCORES:
+                dirty_rects = self._draw_high_scores()
+            elif state == GameState.SETTINGS:
+                dirty_rects = self._draw_settings()
+            elif state == GameState.GAME_OVER:
+                dirty_rects = self._draw_game_over()
+            profiler.mark('draw')
+            # Sprite glow allocati in questo frame (a regime ~0)
+            profiler.set_counter('glow_allocs', self.glow_cache.misses - self._glow_misses)
+            self._glow_misses = self.glow_cache.misses
+
+            if dirty_rects is None:
+                self._screen_signature = None
+            self.display.render(fps, dirty_rects, profiler)
+            profiler.mark('present')
+            profiler.end_frame(input_time_ns)
 
         self._cleanup()
 
+    def _input_time_ns(self, profiler: FrameProfiler) -> Optional[int]:
+        """Istante del primo movimento trackball del frame, per la latenza input→flip.
+        In event mode è il timestamp del primo campione, altrimenti il poll eventi."""
+        if self.trackball.frame_samples:
+            return int(self.trackball.frame_samples[0][0] * 1e9)
+        if self.trackball.delta_x or self.trackball.delta_y:
+            return profiler.frame_start_ns
+        return None
+
     def _handle_global_events(self, events):
         """Eventi globali (chiamato PRIMA di trackball.update per catturare pressed)"""
         for event in events:
@@ -1060,10 +2509,28 @@ class TrackballArcadeSystem:
                         self.running = False
                 elif event.key == pygame.K_f:
                     self.display.toggle_fps_display()
-
+                elif event.key == pygame.K_p:
+                    self.profiler.toggle_overlay()
+                    self.display.force_full_update = True
+
+
+    def _dirty_regions(self, signature: tuple, regions: List[pygame.Rect]) -> Optional[List[pygame.Rect]]:
+        """Dirty-rect: None = frame completo (pipeline disattiva),
+        [] = schermata invariata, altrimenti le regioni da ridisegnare"""
+        if not self.config.dirty_rects:
+            return None
+        previous = self._screen_signature
+        self._screen_signature = signature
+        if previous is None or previous[0] != signature[0]:
+            return [self.display.virtual_surface.get_rect()]
+        if previous == signature:
+            return []
+        return regions
 
     def _update_menu(self, dt: float):
-        self.background.update(dt)
+        # In modalità dirty-rect lo sfondo resta fermo: la schermata idle non cambia
+        if not self.config.dirty_rects:
+            self.background.update(dt)
         self.carousel.update(dt)
 
         dx, dy = self.trackball.get_delta()
@@ -1083,8 +2550,13 @@ class TrackballArcadeSystem:
                 # Avvia gioco
                 self.highscore_entered_this_game = False  # <-- RESET CRITICO
                 self.highscore_input_active = False       # <-- PULISCI ANCHE INPUT
-                self.current_game = self.games[idx]
+                game = self._get_game(self.games[idx])
+                if game is None:
+                    self.sound.create_target_miss().play()
+                    return
+                self.current_game = game
                 self.current_game.reset()
+                self.current_game.time_accumulator = 0.0
                 self.state = GameState.PLAYING
                 self.sound.create_game_start().play()
                 self.music.stop()
@@ -1113,15 +2585,18 @@ class TrackballArcadeSystem:
 
 
 
-    def _draw_menu(self):
+    def _draw_menu(self) -> Optional[List[pygame.Rect]]:
+        dirty = self._dirty_regions(
+            (GameState.MENU, self.carousel.current_index, self.carousel.target_index,
+             self.carousel.transition_progress),
+            [pygame.Rect(0, 120, 1280, 550)])
+        if dirty == []:
+            return dirty
+
         surface = self.display.virtual_surface
         self.background.draw(surface)
 
-        title = self.font_large.render("TRACKBALL ARCADE", True, (255, 230, 0))
-        for offset in [(0, 3), (3, 0), (0, -3), (-3, 0)]:
-            outline = self.font_large.render("TRACKBALL ARCADE", True, (0, 0, 0))
-            surface.blit(outline, outline.get_rect(center=(640 + offset[0], 60 + offset[1])))
-        surface.blit(title, title.get_rect(center=(640, 60)))
+        self.text_cache.draw(surface, "TRACKBALL ARCADE", 80, (255, 230, 0), (640, 60), ((0, 0, 0), 3))
 
         self.carousel.draw(surface, 190, 120)
 
@@ -1133,9 +2608,9 @@ class TrackballArcadeSystem:
         ]
         y = 605
         for instr in instructions:
-            text = self.font_small.render(instr, True, (200, 220, 255))
-            surface.blit(text, text.get_rect(center=(640, y)))
+            self.text_cache.draw(surface, instr, 36, (200, 220, 255), (640, y))
             y += 28
+        return dirty
 
 
     # ✅ FIX: Right button in _update_game (già corretto precedentemente)
@@ -1163,7 +2638,10 @@ class TrackballArcadeSystem:
         
         # Aggiorna solo se non pausato
         if not self.current_game.is_paused:
-            self.current_game.update(dt, self.trackball)
+            if self.current_game.fixed_timestep:
+                self._update_fixed_step(self.current_game, dt)
+            else:
+                self.current_game.update(dt, self.trackball)
         
         # Game over
         if self.current_game.is_game_over:
@@ -1172,16 +2650,60 @@ class TrackballArcadeSystem:
 
 
 
+    def _update_fixed_step(self, game: MiniGame, dt: float):
+        """N substep a dt fisso con clamp del catch-up: un hitch non produce più
+        un dt enorme. I pulsanti "pressed/released" arrivano solo al primo substep;
+        se il frame non ne esegue nessuno vengono rinviati al frame successivo."""
+        step = game.fixed_timestep
+        trackball = self.trackball
+        for flag, value in self._pending_button_flags.items():
+            if value:
+                setattr(trackball, flag, True)
+        frame_flags = {flag: getattr(trackball, flag) for flag in self.BUTTON_EDGE_FLAGS}
+
+        game.time_accumulator += dt
+        steps = 0
+        while game.time_accumulator >= step and steps < game.max_substeps:
+            game.update(step, trackball)
+            game.time_accumulator -= step
+            steps += 1
+            if steps == 1:
+                for flag in self.BUTTON_EDGE_FLAGS:
+                    setattr(trackball, flag, False)
+            if game.is_game_over or game.is_paused:
+                game.time_accumulator = 0.0
+                break
+
+        # Catch-up esaurito: il tempo in eccesso si scarta invece di accumularsi
+        if steps >= game.max_substeps:
+            game.time_accumulator = min(game.time_accumulator, step)
+        game.interpolation_alpha = min(1.0, game.time_accumulator / step)
+
+        for flag, value in frame_flags.items():
+            setattr(trackball, flag, value)
+        self._pending_button_flags = frame_flags if steps == 0 else {}
+
+    def _draw_current_game(self, surface: pygame.Surface):
+        if self.current_game.fixed_timestep:
+            self.current_game.draw(surface, self.current_game.interpolation_alpha)
+        else:
+            self.current_game.draw(surface)
+
     def _draw_game(self):
         if self.current_game:
-            self.current_game.draw(self.display.virtual_surface)
+            self._draw_current_game(self.display.virtual_surface)
 
     def _update_high_scores(self, dt: float):
         if self.trackball.button_right_pressed or self.trackball.button_left_pressed:
             self.state = GameState.MENU
             self.sound.create_back().play()
 
-    def _draw_high_scores(self):
+    def _draw_high_scores(self) -> Optional[List[pygame.Rect]]:
+        game_name = self.current_game.name if self.current_game else (self.games[0].name if self.games else None)
+        dirty = self._dirty_regions((GameState.HIGH_SCORES, game_name), [])
+        if dirty == []:
+            return dirty
+
         surface = self.display.virtual_surface
         self.background.draw(surface)
 
@@ -1226,6 +2748,7 @@ class TrackballArcadeSystem:
 
         back_text = self.font_small.render("Press any button to return", True, (180, 200, 220))
         surface.blit(back_text, back_text.get_rect(center=(640, 680)))
+        return dirty
 
 
 
@@ -1258,6 +2781,7 @@ class TrackballArcadeSystem:
             elif self.settings_selected == 2:
                 self.config.sfx_volume += 0.05 if dx > 0 else -0.05
                 self.config.sfx_volume = max(0.0, min(1.0, self.config.sfx_volume))
+                self.sound.set_volume(self.config.sfx_volume)
 
         if self.trackball.button_left_pressed or self.trackball.button_right_pressed:
             if self.settings_selected == 3 or self.trackball.button_right_pressed:
@@ -1265,7 +2789,14 @@ class TrackballArcadeSystem:
                 self.state = GameState.MENU
                 self.sound.create_back().play()
 
-    def _draw_settings(self):
+    def _draw_settings(self) -> Optional[List[pygame.Rect]]:
+        dirty = self._dirty_regions(
+            (GameState.SETTINGS, self.settings_selected, self.config.trackball_sensitivity,
+             self.config.music_volume, self.config.sfx_volume),
+            [pygame.Rect(0, 160, 1280, 320)])
+        if dirty == []:
+            return dirty
+
         surface = self.display.virtual_surface
         self.background.draw(surface)
 
@@ -1302,6 +2833,7 @@ class TrackballArcadeSystem:
 
         help_text = self.font_small.render("Move trackball to adjust values", True, (180, 200, 220))
         surface.blit(help_text, help_text.get_rect(center=(640, 640)))
+        return dirty
 
     def _update_game_over(self, dt: float):
         dx, dy = self.trackball.get_smooth_delta()
@@ -1352,15 +2884,35 @@ class TrackballArcadeSystem:
             self.highscore_input_active = False
             if self.current_game:
                 self.current_game.reset()
+                self.current_game.time_accumulator = 0.0
                 self.state = GameState.PLAYING
                 self.sound.create_game_start().play()
 
 
-    def _draw_game_over(self):
+    def _draw_game_over(self) -> Optional[List[pygame.Rect]]:
         surface = self.display.virtual_surface
 
         if self.current_game:
-            self.current_game.draw(surface)
+            score = self.current_game.get_score()
+            is_new_hs = self.high_scores.is_high_score(self.current_game.name, score)
+
+            if is_new_hs and not self.highscore_input_active and not self.highscore_entered_this_game:
+                self.highscore_input_active = True
+                self.highscore_entered_this_game = True
+                self.highscore_boxes = ['A', 'A', 'A']
+                self.highscore_current_box = 0
+                self.highscore_char_index = [0, 0, 0]
+                self.sound.create_high_score().play()
+
+            # Sotto c'è il frame della ROM: ogni cambiamento ridisegna tutto
+            dirty = self._dirty_regions(
+                (GameState.GAME_OVER, id(self.current_game), self.highscore_input_active,
+                 tuple(self.highscore_boxes), self.highscore_current_box),
+                [surface.get_rect()])
+            if dirty == []:
+                return dirty
+
+            self._draw_current_game(surface)
 
             overlay = pygame.Surface((1280, 720))
             overlay.fill((0, 0, 0))
@@ -1374,18 +2926,6 @@ class TrackballArcadeSystem:
                                                 True, (255, 255, 255))
             surface.blit(score_text, score_text.get_rect(center=(640, 340)))
 
-            score = self.current_game.get_score()
-            is_new_hs = self.high_scores.is_high_score(self.current_game.name, score)
-
-            if is_new_hs and not self.highscore_input_active and not self.highscore_entered_this_game:
-                self.highscore_input_active = True
-                self.highscore_entered_this_game = True
-                self.highscore_boxes = ['A', 'A', 'A']
-                self.highscore_current_box = 0
-                self.highscore_char_index = [0, 0, 0]
-                self.sound.create_high_score().play()
-
-
             if self.highscore_input_active:
                 # Disegna input high score
                 input_title = self.font_medium.render("ENTER YOUR INITIALS", True, (255, 215, 0))
@@ -1413,12 +2953,25 @@ class TrackballArcadeSystem:
                 menu = self.font_small.render("Left Button: MENU", True, (200, 220, 255))
                 surface.blit(retry, retry.get_rect(center=(640, 520)))
                 surface.blit(menu, menu.get_rect(center=(640, 560)))
+            return dirty
+        return None
 
 
 
 
 
     def _cleanup(self):
+        stats = self.text_cache.get_stats()
+        print(f"[TextCache] hits={stats['hits']} misses={stats['misses']} "
+              f"hit_rate={stats['hit_rate']:.1%} entries={stats['entries']} "
+              f"memory={stats['memory_bytes'] // 1024} KB")
+        stats = self.glow_cache.get_stats()
+        print(f"[GlowCache] hits={stats['hits']} misses={stats['misses']} "
+              f"hit_rate={stats['hit_rate']:.1%} evictions={stats['evictions']} "
+              f"memory={stats['memory_bytes'] // 1024} KB")
+        stats = self.sound.mixer.get_stats()
+        print(f"[SfxMixer] played={stats['played']} dropped={stats['dropped']} stolen={stats['stolen']}")
+        self.profiler.dump()
         self.config.save()
         self.music.stop()
         pygame.event.set_grab(False)
@@ -1,4 +1,227 @@
 # roms/PixelEater.py - BLOB ORGANIC + FIXED COLORS + ULTRA OPTIMIZED
+import numpy as np
+
+
+class PixelSwarm:
+    """Sciame di pixel in array NumPy (una riga per pixel, ordine di spawn):
+    random walk, fuga dal blob e fusione degli aggro in un passo vettoriale.
+    Gli aggro affamati cercano le prede su una griglia uniforme (celle da
+    MERGE_DIST), il blob mangia con un solo test di distanza."""
+
+    NORMAL, FLEE, AGGRO = 0, 1, 2
+    COLORS = ((160, 210, 255), (255, 190, 130), (255, 130, 160))
+    POINTS = np.array([10, 20, 30])
+    FIELDS = ('x', 'y', 'vx', 'vy', 'size', 'hunger', 'flee_timer', 'pulse_phase')
+    MERGE_DIST = 22.0
+    GRID_COLS = int(1280 // MERGE_DIST) + 1
+    GRID_ROWS = int(720 // MERGE_DIST) + 1
+    NEIGHBOR_DX = np.repeat([-1, 0, 1], 3)
+    NEIGHBOR_DY = np.tile([-1, 0, 1], 3)
+
+    def __init__(self, capacity: int = 256):
+        self.count = 0
+        # (tipo, lato pixel, lato glow) -> argomenti di glow_cache.sprite: le surface
+        # restano solo nella LRU condivisa, qui niente che ne blocchi l'eviction
+        self._sprite_args = {}
+        self._allocate_arrays(max(1, capacity))
+
+    def _allocate_arrays(self, capacity: int):
+        old = {name: getattr(self, name) for name in self.FIELDS + ('kind',)} if self.count else {}
+        self.capacity = capacity
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        for name, array in old.items():
+            getattr(self, name)[:self.count] = array[:self.count]
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, count: int, avoid_x: float, avoid_y: float, avoid_radius: float):
+        """count pixel in posizioni intere casuali, fuori dal cerchio da evitare"""
+        if self.count + count > self.capacity:
+            self._allocate_arrays(max(self.count + count, self.capacity * 2))
+        px = np.random.randint(20, 1261, count).astype(np.float64)
+        py = np.random.randint(20, 701, count).astype(np.float64)
+        while True:
+            retry = np.flatnonzero(np.hypot(px - avoid_x, py - avoid_y) <= avoid_radius)
+            if retry.size == 0:
+                break
+            px[retry] = np.random.randint(20, 1261, retry.size)
+            py[retry] = np.random.randint(20, 701, retry.size)
+
+        rows = slice(self.count, self.count + count)
+        self.x[rows] = px
+        self.y[rows] = py
+        self.vx[rows] = np.random.uniform(-35, 35, count)
+        self.vy[rows] = np.random.uniform(-35, 35, count)
+        self.kind[rows] = np.random.randint(0, 3, count)
+        self.size[rows] = np.random.uniform(2.5, 4.5, count)
+        self.hunger[rows] = 0
+        self.flee_timer[rows] = np.random.uniform(0, 1.5, count)
+        self.pulse_phase[rows] = np.random.uniform(0, math.pi * 2, count)
+        self.count += count
+
+    def _keep(self, keep: np.ndarray):
+        """Compatta le righe tenute, nel loro ordine"""
+        slots = np.flatnonzero(keep)
+        for name in self.FIELDS + ('kind',):
+            array = getattr(self, name)
+            array[:slots.size] = array[slots]
+        self.count = slots.size
+
+    def update(self, dt: float, blob_x: float, blob_y: float) -> list:
+        """Ritorna le posizioni delle fusioni aggro avvenute nel frame"""
+        n = self.count
+        if n == 0:
+            return []
+        kind = self.kind[:n]
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+
+        # Normal: random walk smorzato
+        normal = kind == self.NORMAL
+        noise = np.random.uniform(-20, 20, (2, n)) * dt
+        vx[:] = np.where(normal, (vx + noise[0]) * 0.95, vx)
+        vy[:] = np.where(normal, (vy + noise[1]) * 0.95, vy)
+
+        # Flee: scappa dal blob entro 160 px, scatto casuale allo scadere del timer
+        flee = kind == self.FLEE
+        dx = blob_x - x
+        dy = blob_y - y
+        dist = np.hypot(dx, dy)
+        near = flee & (dist < 160) & (dist > 0)
+        dist = np.where(near, dist, 1.0)
+        vx -= np.where(near, dx / dist * 100 * dt, 0.0)
+        vy -= np.where(near, dy / dist * 100 * dt, 0.0)
+        timer = self.flee_timer[:n]
+        timer -= np.where(flee, dt, 0.0)
+        kick = np.flatnonzero(flee & (timer < 0))
+        if kick.size:
+            vx[kick] += np.random.uniform(-30, 30, kick.size)
+            vy[kick] += np.random.uniform(-30, 30, kick.size)
+            timer[kick] = np.random.uniform(0.8, 2, kick.size)
+
+        # Aggro: la fame cresce, oltre 1.2 assorbe il primo vicino entro MERGE_DIST
+        aggro = kind == self.AGGRO
+        hunger = self.hunger[:n]
+        hunger += np.where(aggro, dt * 2.5, 0.0)
+        hungry = np.flatnonzero(aggro & (hunger > 1.2))
+        merges = self._merge(hungry) if hungry.size else []
+
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        x += vx * dt
+        y += vy * dt
+        vx *= np.where((x < 0) | (x > 1280), -0.85, 1.0)
+        vy *= np.where((y < 0) | (y > 720), -0.85, 1.0)
+        self.pulse_phase[:n] += dt * 5
+        return merges
+
+    def _candidate_pairs(self, queries: np.ndarray):
+        """Coppie (query, altro) nelle 3x3 celle attorno a ogni query"""
+        n = self.count
+        cols, rows = self.GRID_COLS, self.GRID_ROWS
+        # Celle limitate ai bordi: chi esce dallo schermo finisce nelle celle esterne
+        cx = np.clip((self.x[:n] // self.MERGE_DIST).astype(np.int64), 0, cols - 1)
+        cy = np.clip((self.y[:n] // self.MERGE_DIST).astype(np.int64), 0, rows - 1)
+        keys = cx * rows + cy
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+
+        # Le 9 celle vicine di tutte le query in un colpo solo
+        qcx = (cx[queries] + self.NEIGHBOR_DX[:, None]).ravel()
+        qcy = (cy[queries] + self.NEIGHBOR_DY[:, None]).ravel()
+        valid = (qcx >= 0) & (qcx < cols) & (qcy >= 0) & (qcy < rows)
+        qkeys = qcx * rows + qcy
+        start = np.searchsorted(sorted_keys, qkeys, 'left')
+        counts = np.where(valid, np.searchsorted(sorted_keys, qkeys, 'right') - start, 0)
+        total = int(counts.sum())
+        if total == 0:
+            return None, None
+        # Indici dentro le run di ogni cella: start ripetuto + posizione nella run
+        run_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        query_ids = np.tile(queries, 9)
+        return np.repeat(query_ids, counts), order[np.repeat(start, counts) + run_offsets]
+
+    def _merge(self, hungry: np.ndarray) -> list:
+        eaters, others = self._candidate_pairs(hungry)
+        if eaters is None:
+            return []
+        x, y = self.x, self.y
+        close = (others != eaters) & (np.hypot(x[others] - x[eaters], y[others] - y[eaters]) < self.MERGE_DIST)
+        if not close.any():
+            return []
+        eaters, others = eaters[close], others[close]
+        # Come il loop originale: aggro in ordine, ognuno prende il primo vicino ancora vivo
+        pairs = np.lexsort((others, eaters))
+        removed = set()
+        fed = set()
+        merges = []
+        size, hunger = self.size, self.hunger
+        for eater, other in zip(eaters[pairs].tolist(), others[pairs].tolist()):
+            if eater in fed or eater in removed or other in removed:
+                continue
+            size[eater] += size[other] * 0.4
+            hunger[eater] = 0
+            removed.add(other)
+            fed.add(eater)
+            merges.append((x[eater], y[eater]))
+        if removed:
+            keep = np.ones(self.count, dtype=bool)
+            keep[list(removed)] = False
+            self._keep(keep)
+        return merges
+
+    def eat(self, blob_x: float, blob_y: float, radius: float):
+        """Rimuove i pixel dentro il blob, ritorna (tipi, dimensioni) dei mangiati"""
+        n = self.count
+        eaten = np.hypot(self.x[:n] - blob_x, self.y[:n] - blob_y) < radius + self.size[:n]
+        if not eaten.any():
+            return None
+        result = (self.kind[:n][eaten].tolist(), self.size[:n][eaten])
+        self._keep(~eaten)
+        return result
+
+    def draw(self, surface: pygame.Surface, shake_x: float, shake_y: float):
+        """Glow + pixel bordato in un unico sprite opaco per (tipo, lati), un solo blits"""
+        n = self.count
+        if n == 0:
+            return
+        pulse = 0.75 + 0.25 * np.sin(self.pulse_phase[:n])
+        glow = (self.size[:n] * pulse * 1.8).astype(np.int64)
+        pix = self.size[:n].astype(np.int64)
+        # Un glow non più grande del pixel viene coperto del tutto: sprite del solo pixel
+        glow = np.where((glow > 1) & (glow > pix), glow, 0)
+        side = np.maximum(glow, pix)
+        left = (self.x[:n] + shake_x - side // 2).astype(np.int64)
+        top = (self.y[:n] + shake_y - side // 2).astype(np.int64)
+
+        sprite_args = self._sprite_args
+        get_sprite = glow_cache.sprite
+        batch = []
+        for key in zip(self.kind[:n].tolist(), pix.tolist(), glow.tolist()):
+            args = sprite_args.get(key)
+            if args is None:
+                args = sprite_args[key] = self._sprite_request(*key)
+            batch.append(get_sprite(*args))
+        surface.blits(list(zip(batch, zip(left.tolist(), top.tolist()))), False)
+
+    def _sprite_request(self, kind: int, pix: int, glow: int) -> tuple:
+        """(chiave, dimensioni, paint) per glow_cache.sprite"""
+        color = self.COLORS[kind]
+        side = max(glow, pix)
+
+        def paint(sprite):
+            if glow:
+                sprite.fill(tuple(int(c * 0.5) for c in color))
+            offset = side // 2 - pix // 2
+            sprite.fill((255, 255, 255), (offset, offset, pix, pix))
+            sprite.fill(color, (offset + 1, offset + 1, pix - 2, pix - 2))
+        return ("pixel", kind, pix, glow), (side, side), paint
+
+
 class PixelEater(MiniGame):
     def __init__(self, *args, sound=None, **kwargs):
         super().__init__("PixelEater", "Organic Blob Evolution!", *args, **kwargs)
@@ -6,8 +229,6 @@ class PixelEater(MiniGame):
         self.level = 1
         self.target_pixels_per_level = 40
         self.pixels_eaten_this_level = 0
-        self.particles = []
-        self.trail_particles = []
         self.screen_shake = 0
         self.time_scale = 1.0
         self.explode_timer = 0
@@ -28,18 +249,19 @@ class PixelEater(MiniGame):
         self.level = 1
         self.target_pixels_per_level = 40
         self.pixels_eaten_this_level = 0
-        self.particles = []
-        self.trail_particles = []
+        self.particles = ParticleSystem(2048, drag=(0.96, 0.96), shrink=0.99, min_radius=1)
+        self.trail_particles = ParticleSystem(256, shrink=0.98, min_radius=1, intensity=1.5)
         self.screen_shake = 0
         self.time_scale = 1.0
         self.explode_timer = 0
         self.level_up_flash = 0
         self.blob_time = 0.0
         self.blob_pulse = 1.0
+        self.swarm = PixelSwarm(256)
         self._generate_pixels()
-        self.font = pygame.font.Font(None, 42)
-        self.font_big = pygame.font.Font(None, 72)
-        self.font_huge = pygame.font.Font(None, 120)
+        self.font = text_cache.get_font(42)
+        self.font_big = text_cache.get_font(72)
+        self.font_huge = text_cache.get_font(120)
 
     def _safe_color(self, r, g, b):
         """🔧 FIXED: Sempre colori validi"""
@@ -49,64 +271,17 @@ class PixelEater(MiniGame):
             max(0, min(255, int(b)))
         )
 
-    def _safe_randint(self, low, high):
-        return random.randint(max(0, min(low, high)), min(255, max(low, high)))
-
     def _spawn_particles(self, x, y, count, color_range):
-        min_r, min_g, min_b = color_range[0]
-        max_r, max_g, max_b = color_range[1]
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(150, 400)
-            self.particles.append({
-                'x': x, 'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 1.0,
-                'max_life': 0.7,
-                'size': random.uniform(2, 7),
-                'color': (
-                    self._safe_randint(min_r, max_r),
-                    self._safe_randint(min_g, max_g),
-                    self._safe_randint(min_b, max_b)
-                )
-            })
+        self.particles.emit_burst(x, y, count, speed=(150, 400), life=0.7, size=(2, 7),
+                                  color=(self._safe_color(*color_range[0]), self._safe_color(*color_range[1])))
 
     def _spawn_trail(self, x, y):
-        self.trail_particles.append({
-            'x': x, 'y': y,
-            'life': 0.6,
-            'max_life': 0.6,
-            'size': self.radius * 0.3,
-            'color': self._safe_color(80, 160, 240)
-        })
+        self.trail_particles.emit(x, y, 0, 0, 0.6, self._safe_color(80, 160, 240), self.radius * 0.3)
 
     def _generate_pixels(self):
         num_pixels = self.target_pixels_per_level + (self.level * 8)
-        self.pixels = []
-        for _ in range(num_pixels):
-            while True:
-                px = random.randint(20, 1260)
-                py = random.randint(20, 700)
-                if math.hypot(px - self.center_x, py - self.center_y) > self.radius * 3:
-                    p_type = random.choice([
-                        {'type': 'normal', 'color': (160, 210, 255), 'points': 10},
-                        {'type': 'flee', 'color': (255, 190, 130), 'points': 20},
-                        {'type': 'aggro', 'color': (255, 130, 160), 'points': 30}
-                    ])
-                    self.pixels.append({
-                        'x': float(px), 'y': float(py),
-                        'vx': random.uniform(-35, 35),
-                        'vy': random.uniform(-35, 35),
-                        'type': p_type['type'],
-                        'color': p_type['color'],
-                        'size': random.uniform(2.5, 4.5),
-                        'hunger': 0,
-                        'flee_timer': random.uniform(0, 1.5),
-                        'pulse_phase': random.uniform(0, math.pi * 2),
-                        'points': p_type['points']
-                    })
-                    break
+        self.swarm.clear()
+        self.swarm.spawn(num_pixels, self.center_x, self.center_y, self.radius * 3)
 
     def _level_up(self):
         self.level += 1
@@ -144,16 +319,18 @@ class PixelEater(MiniGame):
         
         self._spawn_trail(self.center_x, self.center_y)
         
-        # Pixels update (ottimizzato - meno loop annidati)
-        self.pixels[:] = [p for p in self.pixels if self._update_pixel(p, dt)]
+        # Pixels update (sciame vettoriale)
+        for merge_x, merge_y in self.swarm.update(dt, self.center_x, self.center_y):
+            self._spawn_particles(merge_x, merge_y, 8, ((255,140,140), (255,220,220)))
         
         # Eat + MASSIVE GROW
-        self.pixels[:] = [p for p in self.pixels if not self._eat_pixel(p)]
+        self._eat_pixels()
         
         if self.pixels_eaten_this_level >= self.target_pixels_per_level:
             self._level_up()
         
-        if not self.pixels and self.pixels_eaten_this_level >= self.target_pixels_per_level:
+        # Sciame esaurito (mangiato o fuso dagli aggro): nuova ondata o finale
+        if self.swarm.count == 0 and self.explode_timer <= 0:
             if self.level < 15:  # 15 livelli!
                 self._generate_pixels()
             else:
@@ -164,20 +341,9 @@ class PixelEater(MiniGame):
                 if self.sound:
                     self.sound.create_game_over().play()
         
-        # Particles optimized
-        self.particles[:] = [p for p in self.particles if p['life'] > 0]
-        for p in self.particles:
-            p['life'] -= real_dt / p['max_life']
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vx'] *= 0.96
-            p['vy'] *= 0.96
-            p['size'] *= 0.99
-        
-        self.trail_particles[:] = [p for p in self.trail_particles if p['life'] > 0]
-        for t in self.trail_particles:
-            t['life'] -= real_dt / t['max_life']
-            t['size'] *= 0.98
+        # Particelle: movimento col tempo rallentato, invecchiamento col tempo reale
+        self.particles.update(dt, real_dt)
+        self.trail_particles.update(dt, real_dt)
         
         self.screen_shake *= 0.87
         if self.level_up_flash > 0:
@@ -188,59 +354,19 @@ class PixelEater(MiniGame):
                 self.is_game_over = True
                 self.time_scale = 1.0
 
-    def _update_pixel(self, p, dt):
-        """Ottimizzato pixel update"""
-        if p['type'] == 'normal':
-            p['vx'] += random.uniform(-20, 20) * dt
-            p['vy'] += random.uniform(-20, 20) * dt
-            p['vx'] *= 0.95
-            p['vy'] *= 0.95
-        elif p['type'] == 'flee':
-            dx_p = self.center_x - p['x']
-            dy_p = self.center_y - p['y']
-            dist = math.hypot(dx_p, dy_p)
-            if dist < 160:
-                p['vx'] -= (dx_p / dist) * 100 * dt
-                p['vy'] -= (dy_p / dist) * 100 * dt
-            p['flee_timer'] -= dt
-            if p['flee_timer'] < 0:
-                p['vx'] += random.uniform(-30, 30)
-                p['vy'] += random.uniform(-30, 30)
-                p['flee_timer'] = random.uniform(0.8, 2)
-        elif p['type'] == 'aggro':
-            p['hunger'] += dt * 2.5
-            if p['hunger'] > 1.2:
-                for i, other in enumerate(self.pixels):
-                    if other is p: continue
-                    odx = other['x'] - p['x']
-                    ody = other['y'] - p['y']
-                    odist = math.hypot(odx, ody)
-                    if odist < 22:
-                        p['size'] += other['size'] * 0.4
-                        p['hunger'] = 0
-                        self._spawn_particles(p['x'], p['y'], 8, ((255,140,140), (255,220,220)))
-                        del self.pixels[i]
-                        break
-        
-        p['x'] += p['vx'] * dt
-        p['y'] += p['vy'] * dt
-        if p['x'] < 0 or p['x'] > 1280: p['vx'] *= -0.85
-        if p['y'] < 0 or p['y'] > 720: p['vy'] *= -0.85
-        p['pulse_phase'] += dt * 5
-        return True
-
-    def _eat_pixel(self, p):
-        dist = math.hypot(p['x'] - self.center_x, p['y'] - self.center_y)
-        if dist < self.radius + p['size']:
-            self.score += p['points']
-            self.pixels_eaten_this_level += 1
-            self.radius = min(100, self.radius + p['size'] * 0.35)  # MASSIVE GROW!
-            self._spawn_particles(self.center_x, self.center_y, 25, (p['color'], (255,255,255)))
-            self.screen_shake = max(15, self.screen_shake + 10)
-            if self.sound:
-                self.sound.create_target_hit().play()
-            return True  # Rimuovi
-        return False
+    def _eat_pixels(self):
+        eaten = self.swarm.eat(self.center_x, self.center_y, self.radius)
+        if eaten is None:
+            return
+        kinds, sizes = eaten
+        self.score += int(PixelSwarm.POINTS[kinds].sum())
+        self.pixels_eaten_this_level += len(kinds)
+        self.radius = min(100, self.radius + float(sizes.sum()) * 0.35)  # MASSIVE GROW!
+        for kind in kinds:
+            self._spawn_particles(self.center_x, self.center_y, 25, (PixelSwarm.COLORS[kind], (255,255,255)))
+        self.screen_shake = max(15, self.screen_shake + 10) + 10 * (len(kinds) - 1)
+        if self.sound:
+            self.sound.create_target_hit().play()
 
     def _get_shake_offset(self):
         if self.screen_shake > 0:
@@ -307,41 +433,13 @@ class PixelEater(MiniGame):
             pygame.draw.line(temp_surf, (r, g, b), (int(shake_x), y), (int(1280 + shake_x), y))
         
         # Trail FIXED
-        for t in self.trail_particles:
-            alpha = t['life']
-            size = max(1, int(t['size'] * alpha))
-            trail_color = self._safe_color(t['color'][0] * alpha * 1.5, 
-                                         t['color'][1] * alpha * 1.5, 
-                                         t['color'][2] * alpha * 1.5)
-            pygame.draw.circle(temp_surf, trail_color, 
-                             (int(t['x'] + shake_x), int(t['y'] + shake_y)), size)
-        
-        # Pixels (invariato)
-        for p in self.pixels:
-            pulse = 0.75 + 0.25 * math.sin(p['pulse_phase'])
-            glow_size = int(p['size'] * pulse * 1.8)
-            color_glow = tuple(max(0, min(255, int(c * 0.5))) for c in p['color'])
-            
-            if glow_size > 1:
-                pygame.draw.rect(temp_surf, color_glow, 
-                               (int(p['x'] + shake_x - glow_size//2), int(p['y'] + shake_y - glow_size//2),
-                                glow_size, glow_size))
-            
-            pix_size = int(p['size'])
-            rect = pygame.Rect(int(p['x'] + shake_x - pix_size//2), 
-                             int(p['y'] + shake_y - pix_size//2), pix_size, pix_size)
-            pygame.draw.rect(temp_surf, p['color'], rect)
-            pygame.draw.rect(temp_surf, (255,255,255), rect, 1)
+        self.trail_particles.draw(temp_surf, shake_x, shake_y)
+        
+        # Pixels (sprite glow + pixel, un solo blits)
+        self.swarm.draw(temp_surf, shake_x, shake_y)
         
         # Particelle FIXED
-        for p in self.particles:
-            alpha = p['life']
-            size = max(1, int(p['size'] * alpha))
-            part_color = self._safe_color(p['color'][0] * alpha, 
-                                        p['color'][1] * alpha, 
-                                        p['color'][2] * alpha)
-            pygame.draw.circle(temp_surf, part_color, 
-                             (int(p['x'] + shake_x), int(p['y'] + shake_y)), size)
+        self.particles.draw(temp_surf, shake_x, shake_y)
         
         # 🔴 BLOB ORGANIC MESSA NERA SFUMATA
         self._draw_blob(temp_surf, shake_x, shake_y)
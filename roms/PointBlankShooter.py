@@ -1,11 +1,181 @@
 import pygame
 import math
 import random
+import numpy as np
+
+
+class TargetPool:
+    """Bersagli in array NumPy (una riga per bersaglio, ordine di spawn):
+    timer degli stati, rimbalzi e orbite avanzano in un passo vettoriale,
+    il colpo cerca il bersaglio vivo più vicino con un solo test di distanza.
+    Le righe finite vengono compattate una volta per frame."""
+
+    KINDS = ('static', 'moving', 'orbiting', 'fast', 'bonus')
+    STATIC, MOVING, ORBITING, FAST, BONUS = range(5)
+    SPAWNING, ALIVE, DYING, MISSED = range(4)
+    KIND_ROLL = (0.5, 0.7, 0.85, 0.95)  # Soglie del tiro che sceglie il tipo
+    SIZE_MIN = np.array([40, 35, 30, 25, 50])
+    SIZE_MAX = np.array([60, 50, 45, 35, 70])
+    COLORS = ((255, 80, 80), (80, 150, 255), (150, 80, 255), (255, 150, 50), (255, 255, 50))
+    POINTS = (100, 150, 200, 300, 500)
+    LIFETIMES = np.array([3.0, 4.0, 5.0, 1.5, 2.0])
+    TYPE_MULTIPLIERS = (1.0, 1.0, 1.0, 1.5, 2.0)
+    SPAWN_DURATION = 0.2
+    DYING_DURATION = 0.3
+    MISSED_DURATION = 0.5
+    FIELDS = ('x', 'y', 'vx', 'vy', 'size', 'lifetime', 'timer',
+              'orbit_x', 'orbit_y', 'orbit_radius', 'orbit_angle', 'orbit_speed')
+
+    def __init__(self, capacity: int = 16):
+        self.count = 0
+        self._allocate_arrays(max(1, capacity))
+
+    def _allocate_arrays(self, capacity: int):
+        old = {name: getattr(self, name) for name in self.FIELDS + ('kind', 'state')} if self.count else {}
+        self.capacity = capacity
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.state = np.zeros(capacity, dtype=np.int8)
+        for name, array in old.items():
+            getattr(self, name)[:self.count] = array[:self.count]
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, count: int, size_scale: float = 1.0):
+        """count bersagli di tipo casuale in posizioni intere casuali"""
+        if count <= 0:
+            return
+        if self.count + count > self.capacity:
+            self._allocate_arrays(max(self.count + count, self.capacity * 2))
+        kind = np.searchsorted(self.KIND_ROLL, np.random.random(count), 'right')
+        px = np.random.randint(100, 1181, count).astype(np.float64)
+        py = np.random.randint(100, 621, count).astype(np.float64)
+        size = np.random.randint(self.SIZE_MIN[kind], self.SIZE_MAX[kind] + 1)
+        angle = np.random.uniform(0, math.pi * 2, count)
+        speed = np.where(kind == self.MOVING, np.random.uniform(100, 200, count), 0.0)
+
+        rows = slice(self.count, self.count + count)
+        self.x[rows] = px
+        self.y[rows] = py
+        self.vx[rows] = np.cos(angle) * speed
+        self.vy[rows] = np.sin(angle) * speed
+        self.size[rows] = np.maximum(1, (size * size_scale).astype(np.int64))
+        self.lifetime[rows] = self.LIFETIMES[kind]
+        self.timer[rows] = 0
+        self.orbit_x[rows] = px
+        self.orbit_y[rows] = py
+        self.orbit_radius[rows] = np.random.uniform(50, 100, count)
+        self.orbit_angle[rows] = np.random.uniform(0, math.pi * 2, count)
+        self.orbit_speed[rows] = np.random.uniform(2, 4, count)
+        self.kind[rows] = kind
+        self.state[rows] = self.SPAWNING
+        self.count += count
+
+    def _keep(self, keep: np.ndarray):
+        """Compatta le righe tenute, nel loro ordine"""
+        slots = np.flatnonzero(keep)
+        for name in self.FIELDS + ('kind', 'state'):
+            array = getattr(self, name)
+            array[:slots.size] = array[slots]
+        self.count = slots.size
+
+    def update(self, dt: float):
+        """Avanza la macchina a stati; ritorna (xs, ys) dei bersagli scaduti nel
+        frame (diventati 'missed') oppure None"""
+        n = self.count
+        if n == 0:
+            return None
+        state, timer, kind = self.state[:n], self.timer[:n], self.kind[:n]
+        x, y = self.x[:n], self.y[:n]
+        timer += dt
+        # Gli stati letti a inizio frame: un bersaglio appena nato non si muove ancora
+        alive = state == self.ALIVE
+        spawned = (state == self.SPAWNING) & (timer >= self.SPAWN_DURATION)
+
+        moving = np.flatnonzero(alive & (kind == self.MOVING))
+        if moving.size:
+            mx = x[moving] + self.vx[moving] * dt
+            my = y[moving] + self.vy[moving] * dt
+            x[moving] = mx
+            y[moving] = my
+            self.vx[moving[(mx < 50) | (mx > 1230)]] *= -1
+            self.vy[moving[(my < 50) | (my > 670)]] *= -1
+
+        orbiting = np.flatnonzero(alive & (kind == self.ORBITING))
+        if orbiting.size:
+            angle = self.orbit_angle[orbiting] + self.orbit_speed[orbiting] * dt
+            self.orbit_angle[orbiting] = angle
+            radius = self.orbit_radius[orbiting]
+            x[orbiting] = self.orbit_x[orbiting] + np.cos(angle) * radius
+            y[orbiting] = self.orbit_y[orbiting] + np.sin(angle) * radius
+
+        missed = alive & (timer >= self.lifetime[:n])
+        done = (((state == self.DYING) & (timer >= self.DYING_DURATION)) |
+                ((state == self.MISSED) & (timer >= self.MISSED_DURATION)))
+        state[spawned] = self.ALIVE
+        timer[spawned] = 0
+        state[missed] = self.MISSED
+        timer[missed] = 0
+
+        result = (x[missed].tolist(), y[missed].tolist()) if missed.any() else None
+        if done.any():
+            self._keep(~done)
+        return result
+
+    def hit_test(self, px: float, py: float, reach: float):
+        """Bersaglio vivo più vicino entro size + reach: (indice, distanza) o None"""
+        n = self.count
+        if n == 0:
+            return None
+        dist_sq = (self.x[:n] - px) ** 2 + (self.y[:n] - py) ** 2
+        hit_radius = self.size[:n] + reach
+        hit = (self.state[:n] == self.ALIVE) & (dist_sq < hit_radius * hit_radius)
+        if not hit.any():
+            return None
+        index = int(np.argmin(np.where(hit, dist_sq, np.inf)))
+        return index, math.sqrt(dist_sq[index])
+
+    def hit_test_many(self, pxs: np.ndarray, pys: np.ndarray, reach: float) -> list:
+        """Come hit_test per più pallini insieme (matrice pallini x bersagli);
+        ogni bersaglio va al primo pallino che lo prende. Lista di (indice, distanza)"""
+        n = self.count
+        if n == 0:
+            return []
+        dist_sq = (self.x[:n] - pxs[:, None]) ** 2 + (self.y[:n] - pys[:, None]) ** 2
+        hit_radius = self.size[:n] + reach
+        hit = (self.state[:n] == self.ALIVE) & (dist_sq < hit_radius * hit_radius)
+        hits = []
+        for pellet in np.flatnonzero(hit.any(axis=1)).tolist():
+            row = np.where(hit[pellet], dist_sq[pellet], np.inf)
+            index = int(np.argmin(row))
+            if row[index] == np.inf:
+                continue
+            hits.append((index, math.sqrt(row[index])))
+            hit[:, index] = False
+        return hits
+
+    def kill(self, index: int):
+        self.state[index] = self.DYING
+        self.timer[index] = 0
+
 
 class PointBlankShooter(MiniGame):
-    def __init__(self, *args, sound=None, **kwargs):
+    # Gallery rush: round unico a tempo con 100+ bersagli a raffiche e colpi a pallini
+    RUSH_MAX_TARGETS = 120
+    RUSH_SPAWN_INTERVAL = 0.2
+    RUSH_VOLLEY = 8
+    RUSH_DURATION = 60.0
+    RUSH_SIZE_SCALE = 0.6
+    RUSH_PELLETS = 6
+    PELLET_SPREAD = 30
+    PELLET_REACH = 6
+    
+    def __init__(self, *args, sound=None, gallery_rush=False, **kwargs):
         super().__init__("Point Blank Shooter", "Colpisci i bersagli prima che spariscano!", *args, **kwargs)
         self.sound = sound
+        self.gallery_rush = gallery_rush
         self.reset()
 
     def reset(self):
@@ -19,8 +189,8 @@ class PointBlankShooter(MiniGame):
         self.crosshair_angle = 0
         self.crosshair_pulse = 0
         
-        self.targets = []
-        self.particles = []
+        self.targets = TargetPool(self.RUSH_MAX_TARGETS if self.gallery_rush else 16)
+        self.particles = ParticleSystem(512, style="alpha", min_radius=1, sprites=glow_cache)
         self.floating_texts = []
         
         self.level = 1
@@ -34,12 +204,13 @@ class PointBlankShooter(MiniGame):
         self.combo_max_time = 1.5
         
         self.level_timer = 0
-        self.level_duration = 30.0
+        self.level_duration = self.RUSH_DURATION if self.gallery_rush else 30.0
         
         self.spawn_timer = 0
         self.spawn_interval = 1.5
         
         self.flash_timer = 0
+        self.flash_surface = None
         self.screen_shake_x = 0
         self.screen_shake_y = 0
         self.shake_intensity = 0
@@ -94,6 +265,13 @@ class PointBlankShooter(MiniGame):
         self.crosshair_pulse = math.sin(pygame.time.get_ticks() / 200) * 5
 
     def update_shooting(self, trackball):
+        # Tasto destro: gallery rush on/off finché non si è colpito né mancato nulla
+        if (trackball.button_right_pressed and self.level == 1
+                and self.targets_hit_in_level == 0 and self.targets_missed == 0):
+            self.gallery_rush = not self.gallery_rush
+            self.reset()
+            return
+        
         if trackball.button_left_pressed:
             self.handle_shot()
 
@@ -104,46 +282,37 @@ class PointBlankShooter(MiniGame):
         self.create_muzzle_flash()
         self.shake_screen(5)
         
-        hit_target = None
-        min_distance = float('inf')
-        
-        for target in self.targets:
-            if target['state'] != 'alive':
-                continue
-            
-            distance = math.sqrt(
-                (self.crosshair_x - target['x'])**2 + 
-                (self.crosshair_y - target['y'])**2
-            )
-            
-            hit_radius = target['size'] + self.crosshair_size / 2
-            
-            if distance < hit_radius and distance < min_distance:
-                hit_target = target
-                min_distance = distance
-        
-        if hit_target:
-            self.hit_target(hit_target, min_distance)
+        if self.gallery_rush:
+            # Rosa di pallini attorno al mirino, un bersaglio al massimo per pallino
+            angle = np.random.uniform(0, math.pi * 2, self.RUSH_PELLETS)
+            spread = self.PELLET_SPREAD * np.sqrt(np.random.random(self.RUSH_PELLETS))
+            hits = self.targets.hit_test_many(self.crosshair_x + np.cos(angle) * spread,
+                                              self.crosshair_y + np.sin(angle) * spread,
+                                              self.PELLET_REACH)
         else:
+            hit = self.targets.hit_test(self.crosshair_x, self.crosshair_y, self.crosshair_size / 2)
+            hits = [hit] if hit else []
+        
+        for index, distance in hits:
+            self.hit_target(index, distance)
+        if not hits:
             self.create_miss_effect()
 
-    def hit_target(self, target, distance):
-        target['state'] = 'dying'
-        target['death_timer'] = 0
+    def hit_target(self, index, distance):
+        targets = self.targets
+        targets.kill(index)
+        kind = int(targets.kind[index])
+        size = float(targets.size[index])
+        x, y = float(targets.x[index]), float(targets.y[index])
+        color = TargetPool.COLORS[kind]
         
-        accuracy_bonus = max(0, 1.0 - (distance / target['size']))
+        accuracy_bonus = max(0, 1.0 - (distance / size))
         
-        base_points = target['points']
+        base_points = TargetPool.POINTS[kind]
         accuracy_multiplier = 1.0 + accuracy_bonus
         combo_multiplier = 1.0 + (self.combo * 0.1)
         level_multiplier = 1.0 + (self.level * 0.2)
-        
-        if target['type'] == 'bonus':
-            type_multiplier = 2.0
-        elif target['type'] == 'fast':
-            type_multiplier = 1.5
-        else:
-            type_multiplier = 1.0
+        type_multiplier = TargetPool.TYPE_MULTIPLIERS[kind]
         
         total_points = int(base_points * accuracy_multiplier * combo_multiplier * level_multiplier * type_multiplier)
         
@@ -159,13 +328,13 @@ class PointBlankShooter(MiniGame):
             else:
                 self.sound.create_target_hit().play()
         
-        self.create_hit_particles(target['x'], target['y'], target['color'])
-        self.create_floating_text(target['x'], target['y'], f"+{total_points}", (255, 255, 100))
+        self.create_hit_particles(x, y, color)
+        self.create_floating_text(x, y, f"+{total_points}", (255, 255, 100))
         
         if self.combo > 1:
             self.create_floating_text(
-                target['x'], 
-                target['y'] - 30, 
+                x, 
+                y - 30, 
                 f"COMBO x{self.combo}!", 
                 (255, 100, 255)
             )
@@ -178,55 +347,15 @@ class PointBlankShooter(MiniGame):
         self.combo = 0
 
     def update_targets(self, dt):
-        for target in self.targets[:]:
-            if target['state'] == 'spawning':
-                target['spawn_timer'] += dt
-                if target['spawn_timer'] >= target['spawn_duration']:
-                    target['state'] = 'alive'
-                    target['alive_timer'] = 0
-            
-            elif target['state'] == 'alive':
-                target['alive_timer'] += dt
-                
-                if target['type'] == 'moving':
-                    target['x'] += target['vel_x'] * dt
-                    target['y'] += target['vel_y'] * dt
-                    
-                    if target['x'] < 50 or target['x'] > 1230:
-                        target['vel_x'] *= -1
-                    if target['y'] < 50 or target['y'] > 670:
-                        target['vel_y'] *= -1
-                
-                elif target['type'] == 'orbiting':
-                    target['orbit_angle'] += target['orbit_speed'] * dt
-                    target['x'] = target['orbit_center_x'] + math.cos(target['orbit_angle']) * target['orbit_radius']
-                    target['y'] = target['orbit_center_y'] + math.sin(target['orbit_angle']) * target['orbit_radius']
-                
-                if target['alive_timer'] >= target['lifetime']:
-                    target['state'] = 'missed'
-                    self.targets_missed += 1
-                    self.combo = 0
-                    self.create_floating_text(target['x'], target['y'], "MISS!", (255, 50, 50))
-            
-            elif target['state'] == 'dying':
-                target['death_timer'] += dt
-                if target['death_timer'] >= 0.3:
-                    self.targets.remove(target)
-            
-            elif target['state'] == 'missed':
-                target['death_timer'] += dt
-                if target['death_timer'] >= 0.5:
-                    self.targets.remove(target)
+        missed = self.targets.update(dt)
+        if missed:
+            for x, y in zip(*missed):
+                self.targets_missed += 1
+                self.combo = 0
+                self.create_floating_text(x, y, "MISS!", (255, 50, 50))
 
     def update_particles(self, dt):
-        for particle in self.particles[:]:
-            particle['lifetime'] += dt
-            particle['x'] += particle['vel_x'] * dt
-            particle['y'] += particle['vel_y'] * dt
-            particle['vel_y'] += 300 * dt
-            
-            if particle['lifetime'] > particle['max_lifetime']:
-                self.particles.remove(particle)
+        self.particles.update(dt)
 
     def update_floating_texts(self, dt):
         for text in self.floating_texts[:]:
@@ -247,6 +376,14 @@ class PointBlankShooter(MiniGame):
     def update_spawning(self, dt):
         self.spawn_timer += dt
         
+        if self.gallery_rush:
+            # A tempo scaduto niente più raffiche: il round finisce quando lo schermo si svuota
+            if self.spawn_timer >= self.RUSH_SPAWN_INTERVAL and self.level_timer < self.level_duration:
+                self.spawn_timer = 0
+                room = self.RUSH_MAX_TARGETS - len(self.targets)
+                self.targets.spawn(min(self.RUSH_VOLLEY, room), self.RUSH_SIZE_SCALE)
+            return
+        
         adjusted_interval = max(0.3, self.spawn_interval - (self.level * 0.1))
         
         if self.spawn_timer >= adjusted_interval:
@@ -256,79 +393,7 @@ class PointBlankShooter(MiniGame):
     def spawn_target(self):
         if len(self.targets) >= 8 + self.level:
             return
-        
-        target_type_roll = random.random()
-        
-        if target_type_roll < 0.5:
-            target_type = 'static'
-        elif target_type_roll < 0.7:
-            target_type = 'moving'
-        elif target_type_roll < 0.85:
-            target_type = 'orbiting'
-        elif target_type_roll < 0.95:
-            target_type = 'fast'
-        else:
-            target_type = 'bonus'
-        
-        x = random.randint(100, 1180)
-        y = random.randint(100, 620)
-        
-        if target_type == 'static':
-            size = random.randint(40, 60)
-            color = (255, 80, 80)
-            points = 100
-            lifetime = 3.0
-        elif target_type == 'moving':
-            size = random.randint(35, 50)
-            color = (80, 150, 255)
-            points = 150
-            lifetime = 4.0
-        elif target_type == 'orbiting':
-            size = random.randint(30, 45)
-            color = (150, 80, 255)
-            points = 200
-            lifetime = 5.0
-        elif target_type == 'fast':
-            size = random.randint(25, 35)
-            color = (255, 150, 50)
-            points = 300
-            lifetime = 1.5
-        else:
-            size = random.randint(50, 70)
-            color = (255, 255, 50)
-            points = 500
-            lifetime = 2.0
-        
-        target = {
-            'x': x,
-            'y': y,
-            'size': size,
-            'color': color,
-            'points': points,
-            'lifetime': lifetime,
-            'type': target_type,
-            'state': 'spawning',
-            'spawn_timer': 0,
-            'spawn_duration': 0.2,
-            'alive_timer': 0,
-            'death_timer': 0,
-            'pulse': 0
-        }
-        
-        if target_type == 'moving':
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(100, 200)
-            target['vel_x'] = math.cos(angle) * speed
-            target['vel_y'] = math.sin(angle) * speed
-        
-        elif target_type == 'orbiting':
-            target['orbit_center_x'] = x
-            target['orbit_center_y'] = y
-            target['orbit_radius'] = random.uniform(50, 100)
-            target['orbit_angle'] = random.uniform(0, math.pi * 2)
-            target['orbit_speed'] = random.uniform(2, 4)
-        
-        self.targets.append(target)
+        self.targets.spawn(1)
 
     def update_screen_effects(self, dt):
         if self.flash_timer > 0:
@@ -347,7 +412,8 @@ class PointBlankShooter(MiniGame):
             self.level += 1
             self.targets_hit_in_level = 0
             self.targets_needed_for_level += 5
-            self.level_timer = 0
+            if not self.gallery_rush:
+                self.level_timer = 0
             
             self.score += 1000 * self.level
             
@@ -356,7 +422,7 @@ class PointBlankShooter(MiniGame):
             if self.sound:
                 self.sound.create_combo(9).play()
         
-        if self.targets_missed >= self.max_misses:
+        if self.targets_missed >= self.max_misses and not self.gallery_rush:
             self.is_game_over = True
             self.score += 5000
             return
@@ -370,49 +436,16 @@ class PointBlankShooter(MiniGame):
         self.shake_intensity = intensity
 
     def create_muzzle_flash(self):
-        for _ in range(8):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(50, 150)
-            self.particles.append({
-                'x': self.crosshair_x,
-                'y': self.crosshair_y,
-                'vel_x': math.cos(angle) * speed,
-                'vel_y': math.sin(angle) * speed,
-                'color': (255, 255, 200),
-                'size': random.randint(2, 5),
-                'lifetime': 0,
-                'max_lifetime': 0.2
-            })
+        self.particles.emit_burst(self.crosshair_x, self.crosshair_y, 8, speed=(50, 150),
+                                  life=0.2, size=(2, 5), color=(255, 255, 200), gravity=300)
 
     def create_hit_particles(self, x, y, color):
-        for _ in range(20):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(100, 300)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vel_x': math.cos(angle) * speed,
-                'vel_y': math.sin(angle) * speed - 100,
-                'color': color,
-                'size': random.randint(3, 8),
-                'lifetime': 0,
-                'max_lifetime': random.uniform(0.3, 0.6)
-            })
+        self.particles.emit_burst(x, y, 20, speed=(100, 300), life=(0.3, 0.6), size=(3, 8),
+                                  color=color, gravity=300, base_velocity=(0, -100))
 
     def create_impact_particles(self, x, y):
-        for _ in range(5):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(50, 100)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vel_x': math.cos(angle) * speed,
-                'vel_y': math.sin(angle) * speed,
-                'color': (150, 150, 150),
-                'size': random.randint(2, 4),
-                'lifetime': 0,
-                'max_lifetime': 0.3
-            })
+        self.particles.emit_burst(x, y, 5, speed=(50, 100), life=0.3, size=(2, 4),
+                                  color=(150, 150, 150), gravity=300)
 
     def create_floating_text(self, x, y, text, color):
         self.floating_texts.append({
@@ -437,10 +470,11 @@ class PointBlankShooter(MiniGame):
         
         if self.flash_timer > 0:
             flash_alpha = int((self.flash_timer / 0.1) * 100)
-            flash_surface = pygame.Surface((1280, 720))
-            flash_surface.fill((255, 255, 255))
-            flash_surface.set_alpha(flash_alpha)
-            surface.blit(flash_surface, (0, 0))
+            if self.flash_surface is None:
+                self.flash_surface = pygame.Surface((1280, 720))
+                self.flash_surface.fill((255, 255, 255))
+            self.flash_surface.set_alpha(flash_alpha)
+            surface.blit(self.flash_surface, (0, 0))
         
         if not self.game_started:
             self.draw_ready_screen(surface)
@@ -463,29 +497,34 @@ class PointBlankShooter(MiniGame):
             pygame.draw.line(surface, grid_color, (shake_x, y + shake_y), (1280 + shake_x, y + shake_y), 1)
 
     def draw_targets(self, surface, shake_x, shake_y):
-        for target in self.targets:
-            x = int(target['x']) + shake_x
-            y = int(target['y']) + shake_y
-            size = target['size']
-            color = target['color']
+        targets = self.targets
+        n = len(targets)
+        if n == 0:
+            return
+        # Dissolvenze dagli sprite di glow_cache invece di una Surface per bersaglio
+        rows = zip(targets.x[:n].astype(np.int64).tolist(), targets.y[:n].astype(np.int64).tolist(),
+                   targets.size[:n].astype(np.int64).tolist(), targets.kind[:n].tolist(),
+                   targets.state[:n].tolist(), targets.timer[:n].tolist(), targets.lifetime[:n].tolist())
+        for x, y, size, kind, state, timer, lifetime in rows:
+            x += shake_x
+            y += shake_y
+            color = TargetPool.COLORS[kind]
             
-            if target['state'] == 'spawning':
-                progress = target['spawn_timer'] / target['spawn_duration']
+            if state == TargetPool.SPAWNING:
+                progress = min(1.0, timer / TargetPool.SPAWN_DURATION)
                 size = int(size * progress)
                 alpha = int(255 * progress)
                 
-                temp_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(temp_surface, (*color, alpha), (size, size), size)
-                pygame.draw.circle(temp_surface, (255, 255, 255, alpha), (size, size), size, 3)
-                surface.blit(temp_surface, (x - size, y - size))
+                glow_cache.draw(surface, (x, y), size, color, alpha)
+                glow_cache.draw(surface, (x, y), size, (255, 255, 255), alpha, width=3)
             
-            elif target['state'] == 'alive':
-                pulse = math.sin(target['alive_timer'] * 10) * 5
+            elif state == TargetPool.ALIVE:
+                pulse = math.sin(timer * 10) * 5
                 draw_size = size + int(pulse)
                 
-                lifetime_ratio = target['alive_timer'] / target['lifetime']
+                lifetime_ratio = timer / lifetime
                 if lifetime_ratio > 0.7:
-                    blink = int(math.sin(target['alive_timer'] * 20) * 128 + 127)
+                    blink = int(math.sin(timer * 20) * 128 + 127)
                     warning_color = (255, blink, blink)
                 else:
                     warning_color = color
@@ -500,7 +539,7 @@ class PointBlankShooter(MiniGame):
                 
                 pygame.draw.circle(surface, (255, 255, 255), (x, y), 5)
                 
-                if target['type'] == 'bonus':
+                if kind == TargetPool.BONUS:
                     star_points = []
                     for i in range(5):
                         angle = (i * math.pi * 2 / 5) - math.pi / 2
@@ -509,40 +548,25 @@ class PointBlankShooter(MiniGame):
                         star_points.append((px, py))
                     pygame.draw.lines(surface, (255, 255, 255), True, star_points, 2)
             
-            elif target['state'] == 'dying':
-                progress = target['death_timer'] / 0.3
+            elif state == TargetPool.DYING:
+                progress = min(1.0, timer / TargetPool.DYING_DURATION)
                 size = int(size * (1 - progress))
                 alpha = int(255 * (1 - progress))
                 
                 if size > 0:
-                    temp_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(temp_surface, (*color, alpha), (size, size), size)
-                    surface.blit(temp_surface, (x - size, y - size))
+                    glow_cache.draw(surface, (x, y), size, color, alpha)
             
-            elif target['state'] == 'missed':
-                progress = target['death_timer'] / 0.5
+            else:
+                progress = min(1.0, timer / TargetPool.MISSED_DURATION)
                 alpha = int(255 * (1 - progress))
                 y_offset = int(progress * 50)
                 
-                temp_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(temp_surface, (*color, alpha), (size, size), size)
-                surface.blit(temp_surface, (x - size, y - size + y_offset))
+                glow_cache.draw(surface, (x, y + y_offset), size, color, alpha)
 
     def draw_particles(self, surface, shake_x, shake_y):
-        for particle in self.particles:
-            x = int(particle['x']) + shake_x
-            y = int(particle['y']) + shake_y
-            
-            lifetime_ratio = particle['lifetime'] / particle['max_lifetime']
-            alpha = int(255 * (1 - lifetime_ratio))
-            size = max(1, int(particle['size'] * (1 - lifetime_ratio)))
-            
-            temp_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surface, (*particle['color'], alpha), (size, size), size)
-            surface.blit(temp_surface, (x - size, y - size))
+        self.particles.draw(surface, shake_x, shake_y)
 
     def draw_floating_texts(self, surface, shake_x, shake_y):
-        font = pygame.font.Font(None, 48)
         for text_obj in self.floating_texts:
             x = int(text_obj['x']) + shake_x
             y = int(text_obj['y']) + shake_y
@@ -550,11 +574,7 @@ class PointBlankShooter(MiniGame):
             lifetime_ratio = text_obj['lifetime'] / text_obj['max_lifetime']
             alpha = int(255 * (1 - lifetime_ratio))
             
-            text_surface = font.render(text_obj['text'], True, text_obj['color'])
-            text_surface.set_alpha(alpha)
-            
-            text_rect = text_surface.get_rect(center=(x, y))
-            surface.blit(text_surface, text_rect)
+            text_cache.draw(surface, text_obj['text'], 48, text_obj['color'], (x, y), alpha=alpha)
 
     def draw_crosshair(self, surface, shake_x, shake_y):
         x = int(self.crosshair_x) + shake_x
@@ -584,9 +604,9 @@ class PointBlankShooter(MiniGame):
             pygame.draw.circle(surface, color, (int(dot_x), int(dot_y)), 4)
 
     def draw_ui(self, surface):
-        font_large = pygame.font.Font(None, 64)
-        font_medium = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 36)
+        font_large = text_cache.get_font(64)
+        font_medium = text_cache.get_font(48)
+        font_small = text_cache.get_font(36)
         
         score_text = font_large.render(f"SCORE: {self.score}", True, (255, 255, 255))
         surface.blit(score_text, (20, 20))
@@ -597,7 +617,11 @@ class PointBlankShooter(MiniGame):
         progress_text = font_small.render(f"Targets: {self.targets_hit_in_level}/{self.targets_needed_for_level}", True, (200, 200, 200))
         surface.blit(progress_text, (20, 140))
         
-        for i in range(self.max_misses):
+        if self.gallery_rush:
+            rush_text = font_small.render("GALLERY RUSH", True, (255, 150, 50))
+            surface.blit(rush_text, (20, 180))
+        
+        for i in range(0 if self.gallery_rush else self.max_misses):
             x = 1150 + (i * 30)
             y = 30
             if i < self.targets_missed:
@@ -631,8 +655,8 @@ class PointBlankShooter(MiniGame):
         overlay.fill((0, 0, 0, 180))
         surface.blit(overlay, (0, 0))
         
-        font_huge = pygame.font.Font(None, 128)
-        font_medium = pygame.font.Font(None, 48)
+        font_huge = text_cache.get_font(128)
+        font_medium = text_cache.get_font(48)
         
         ready_text = font_huge.render("GET READY!", True, (255, 255, 100))
         ready_rect = ready_text.get_rect(center=(640, 300))
@@ -647,7 +671,7 @@ class PointBlankShooter(MiniGame):
         overlay.fill((0, 0, 0, 128))
         surface.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 96)
+        font = text_cache.get_font(96)
         pause_text = font.render("PAUSED", True, (255, 255, 255))
         pause_rect = pause_text.get_rect(center=(640, 360))
         surface.blit(pause_text, pause_rect)
@@ -36,8 +36,8 @@ class PongAI(MiniGame):
         self.ball_trail = []
         self.shake = 0
         
-        self.font_score = pygame.font.Font(None, 92)
-        self.font_label = pygame.font.Font(None, 48)
+        self.font_score = text_cache.get_font(92)
+        self.font_label = text_cache.get_font(48)
         
         if self.sound:
             self.sound.create_game_start().play()
@@ -1,11 +1,65 @@
 import pygame
 import math
 import random
+from collections import deque
+
+
+class BoardIndex:
+    """Occupazione della griglia aggiornata a ogni passo: bitmap per le collisioni
+    e indice delle celle libere (swap-remove) per spawnare il cibo in O(1).
+    L'indice copre solo le celle interne, dove può comparire il cibo."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.occupied = bytearray(width * height)
+        self.free = [y * width + x for y in range(1, height - 1) for x in range(1, width - 1)]
+        self.free_pos = [-1] * (width * height)
+        for pos, cell in enumerate(self.free):
+            self.free_pos[cell] = pos
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        return self.occupied[y * self.width + x] == 1
+
+    def occupy(self, x: int, y: int):
+        cell = y * self.width + x
+        self.occupied[cell] = 1
+        pos = self.free_pos[cell]
+        if pos >= 0:
+            last = self.free.pop()
+            if last != cell:
+                self.free[pos] = last
+                self.free_pos[last] = pos
+            self.free_pos[cell] = -1
+
+    def release(self, x: int, y: int):
+        cell = y * self.width + x
+        self.occupied[cell] = 0
+        if 0 < x < self.width - 1 and 0 < y < self.height - 1 and self.free_pos[cell] < 0:
+            self.free_pos[cell] = len(self.free)
+            self.free.append(cell)
+
+    def random_free(self):
+        """Cella interna libera a caso, None se la griglia è piena"""
+        if not self.free:
+            return None
+        return divmod(self.free[random.randrange(len(self.free))], self.width)[::-1]
+
 
 class SnakeGame(MiniGame):
-    def __init__(self, *args, sound=None, **kwargs):
+    # Tabellone standard (1280x720 / 30 = 42x24) e "big board" (128x72 celle da 10 px)
+    BOARDS = ((30, 42, 24), (10, 128, 72))
+    
+    # Sfondo: tile da 40 px che scorrono, onda di luminosità in keyframe di palette
+    BG_TILE = 40
+    BG_KEYFRAMES = 64
+    BG_GAP_COLOR = (6, 8, 12)
+    GRID_COLOR = (40, 50, 70)
+
+    def __init__(self, *args, sound=None, big_board=False, **kwargs):
         super().__init__("Snake", "Classic snake: eat apples, grow longer!", *args, **kwargs)
         self.sound = sound
+        self.big_board = big_board
         self.reset()
     
     def reset(self):
@@ -13,17 +67,17 @@ class SnakeGame(MiniGame):
         self.is_game_over = False
         self.is_paused = False
         
-        # Grid settings (1280x720 / 30 = 42x24 grid)
-        self.grid_size = 30
-        self.grid_width = 42
-        self.grid_height = 24
+        # Grid settings
+        self.grid_size, self.grid_width, self.grid_height = self.BOARDS[1 if self.big_board else 0]
+        self.scale = self.grid_size / 30
         
-        # Snake inizia al centro
-        self.snake_segments = [
-            {'x': 21, 'y': 12},
-            {'x': 20, 'y': 12},
-            {'x': 19, 'y': 12}
-        ]
+        # Snake inizia al centro (testa a sinistra della deque)
+        cx, cy = self.grid_width // 2, self.grid_height // 2
+        self.snake_segments = deque([(cx, cy), (cx - 1, cy), (cx - 2, cy)])
+        self.board = BoardIndex(self.grid_width, self.grid_height)
+        for x, y in self.snake_segments:
+            self.board.occupy(x, y)
+        self.build_background()
         
         # Direzione iniziale (1=right, -1=left, 2=down, -2=up)
         self.direction = 1
@@ -31,14 +85,14 @@ class SnakeGame(MiniGame):
         
         # Timer per movimento a grid
         self.move_timer = 0
-        self.move_interval = 0.15  # Secondi tra movimenti
+        self.move_interval = 0.15 * self.scale  # Secondi tra movimenti
         
         # Food (mela)
         self.spawn_food()
         
         # Effetti visivi
         self.shake = 0
-        self.particles = []
+        self.particles = ParticleSystem(256, style="alpha", min_radius=1, sprites=glow_cache)
         self.eat_animation = 0
         
         # Background animato
@@ -46,23 +100,47 @@ class SnakeGame(MiniGame):
         
         self.sound.create_game_start().play()
     
+    def build_background(self):
+        """Pre-render dello sfondo, una volta per reset(): tile in una surface 8 bit
+        sovradimensionata di un tile (indice di palette = diagonale del tile), una
+        palette per keyframe della fase dell'onda, griglia statica in overlay RLE."""
+        tile = self.BG_TILE
+        cols, rows = 1280 // tile + 1, 720 // tile + 1
+        layer = pygame.Surface((cols * tile, rows * tile), 0, 8)
+        layer.fill(0)
+        for a in range(cols):
+            for b in range(rows):
+                layer.fill(1 + a + b, (a * tile, b * tile, tile - 2, tile - 2))
+        self.bg_layer = layer
+        self.bg_keyframe = -1
+        
+        # Keyframe dell'onda sin((i + j + bg_offset) * 0.02): fase quantizzata su un giro
+        self.bg_palettes = []
+        for k in range(self.BG_KEYFRAMES):
+            phase = 2 * math.pi * k / self.BG_KEYFRAMES
+            palette = [self.BG_GAP_COLOR]
+            for diagonal in range(cols + rows - 1):
+                brightness = 15 + int(math.sin(diagonal * tile * 0.02 + phase) * 5)
+                palette.append((brightness, brightness + 5, brightness + 10))
+            self.bg_palettes.append(palette)
+        
+        # Griglia decorativa: fissa a schermo, un solo blit con colorkey RLE
+        grid = pygame.Surface((1280, 720))
+        grid.fill((0, 0, 0))
+        for i in range(self.grid_width + 1):
+            grid.fill(self.GRID_COLOR, (i * self.grid_size, 0, 1, 720))
+        for j in range(self.grid_height + 1):
+            grid.fill(self.GRID_COLOR, (0, j * self.grid_size, 1280, 1))
+        grid.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        self.grid_layer = grid
+    
     def spawn_food(self):
-        # Spawn food in posizione libera
-        while True:
-            fx = random.randint(1, self.grid_width - 2)
-            fy = random.randint(1, self.grid_height - 2)
-            
-            # Verifica che non sia sulla snake
-            occupied = False
-            for segment in self.snake_segments:
-                if segment['x'] == fx and segment['y'] == fy:
-                    occupied = True
-                    break
-            
-            if not occupied:
-                self.food_x = fx
-                self.food_y = fy
-                break
+        # Spawn food in una cella interna libera (None se il serpente riempie il tabellone)
+        cell = self.board.random_free()
+        if cell is None:
+            self.food_x = self.food_y = None
+        else:
+            self.food_x, self.food_y = cell
     
     def update(self, dt, trackball):
         if self.is_paused or self.is_game_over:
@@ -71,6 +149,12 @@ class SnakeGame(MiniGame):
         # Background animato
         self.bg_offset += dt * 20
         
+        # Tasto sinistro: cambia tabellone finché non si è mangiata la prima mela
+        if trackball.button_left_pressed and len(self.snake_segments) == 3:
+            self.big_board = not self.big_board
+            self.reset()
+            return
+        
         # Input trackball per direzione
         dx, dy = trackball.get_smooth_delta()
         
@@ -87,12 +171,7 @@ class SnakeGame(MiniGame):
                 self.next_direction = -2  # Su
         
         # Update particelle
-        for particle in self.particles[:]:
-            particle['life'] -= dt
-            particle['y'] -= particle['vy'] * dt
-            particle['x'] += particle['vx'] * dt
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        self.particles.update(dt)
         
         self.eat_animation = max(0, self.eat_animation - dt * 3)
         
@@ -107,37 +186,31 @@ class SnakeGame(MiniGame):
         self.direction = self.next_direction
         
         # Calcola nuova posizione testa
-        head = self.snake_segments[0].copy()
+        head_x, head_y = self.snake_segments[0]
         
         if self.direction == 1:  # Destra
-            head['x'] += 1
+            head_x += 1
         elif self.direction == -1:  # Sinistra
-            head['x'] -= 1
+            head_x -= 1
         elif self.direction == 2:  # Giù
-            head['y'] += 1
+            head_y += 1
         elif self.direction == -2:  # Su
-            head['y'] -= 1
+            head_y -= 1
         
-        # Collision detection con muri
-        if head['x'] < 0 or head['x'] >= self.grid_width or head['y'] < 0 or head['y'] >= self.grid_height:
+        # Collision detection con muri e con se stesso (coda inclusa, come prima)
+        if (head_x < 0 or head_x >= self.grid_width or head_y < 0 or head_y >= self.grid_height
+                or self.board.is_occupied(head_x, head_y)):
             self.is_game_over = True
             self.score += 5000
             self.sound.create_target_miss().play()
             return
         
-        # Collision detection con se stesso
-        for segment in self.snake_segments:
-            if head['x'] == segment['x'] and head['y'] == segment['y']:
-                self.is_game_over = True
-                self.score += 5000
-                self.sound.create_target_miss().play()
-                return
-        
         # Inserisce nuova testa
-        self.snake_segments.insert(0, head)
+        self.snake_segments.appendleft((head_x, head_y))
+        self.board.occupy(head_x, head_y)
         
         # Check se mangia food
-        if head['x'] == self.food_x and head['y'] == self.food_y:
+        if head_x == self.food_x and head_y == self.food_y:
             # Cresce (non rimuove coda)
             self.score += 100
             self.shake = 12
@@ -145,37 +218,37 @@ class SnakeGame(MiniGame):
             
             # Effetto particelle
             for _ in range(15):
-                self.particles.append({
-                    'x': self.food_x * self.grid_size + self.grid_size // 2,
-                    'y': self.food_y * self.grid_size + self.grid_size // 2,
-                    'vx': random.uniform(-100, 100),
-                    'vy': random.uniform(-150, -50),
-                    'life': random.uniform(0.3, 0.6),
-                    'color': (random.randint(200, 255), random.randint(50, 100), random.randint(50, 100))
-                })
+                # Dimensione e opacità seguono la vita residua in secondi (8 px, 255 per secondo)
+                life = random.uniform(0.3, 0.6)
+                self.particles.emit(
+                    self.food_x * self.grid_size + self.grid_size // 2,
+                    self.food_y * self.grid_size + self.grid_size // 2,
+                    random.uniform(-100, 100), random.uniform(50, 150), life,
+                    (random.randint(200, 255), random.randint(50, 100), random.randint(50, 100)),
+                    life * 8, alpha=life * 255)
             
             self.sound.create_target_hit().play()
             self.spawn_food()
             
             # Aumenta velocità progressivamente
             if len(self.snake_segments) % 5 == 0:
-                self.move_interval = max(0.08, self.move_interval - 0.01)
+                self.move_interval = max(0.08 * self.scale, self.move_interval - 0.01 * self.scale)
                 self.sound.create_combo(len(self.snake_segments) // 5).play()
         else:
             # Non mangia, rimuove coda
-            self.snake_segments.pop()
+            self.board.release(*self.snake_segments.pop())
         
         # Punto per sopravvivenza
         self.score += 1
     
     def draw(self, surface):
-        # Background con pattern animato
-        for i in range(0, 1280, 40):
-            for j in range(0, 720, 40):
-                offset = int(self.bg_offset) % 40
-                brightness = 15 + int(math.sin((i + j + self.bg_offset) * 0.02) * 5)
-                pygame.draw.rect(surface, (brightness, brightness + 5, brightness + 10), 
-                               (i - offset, j - offset, 38, 38))
+        # Background con pattern animato: palette del keyframe più vicino alla fase
+        keyframe = round(self.bg_offset * 0.02 / (2 * math.pi) * self.BG_KEYFRAMES) % self.BG_KEYFRAMES
+        if keyframe != self.bg_keyframe:
+            self.bg_layer.set_palette(self.bg_palettes[keyframe])
+            self.bg_keyframe = keyframe
+        offset = int(self.bg_offset) % self.BG_TILE
+        surface.blit(self.bg_layer, (-offset, -offset))
         
         # Shake effect
         shake_x = int(math.sin(pygame.time.get_ticks() * 0.05) * self.shake)
@@ -183,39 +256,37 @@ class SnakeGame(MiniGame):
         self.shake *= 0.85
         
         # Grid decorativa (bordo)
-        for i in range(self.grid_width + 1):
-            x = i * self.grid_size
-            pygame.draw.line(surface, (40, 50, 70), (x, 0), (x, 720), 1)
-        for j in range(self.grid_height + 1):
-            y = j * self.grid_size
-            pygame.draw.line(surface, (40, 50, 70), (0, y), (1280, y), 1)
-        
-        # Draw food (mela fumettistica)
-        food_screen_x = self.food_x * self.grid_size + self.grid_size // 2 + shake_x
-        food_screen_y = self.food_y * self.grid_size + self.grid_size // 2 + shake_y
-        
-        # Animazione pulsante food
-        pulse = 1.0 + math.sin(pygame.time.get_ticks() * 0.005) * 0.15
-        food_radius = int(self.grid_size * 0.4 * pulse)
-        
-        # Ombra food
-        pygame.draw.circle(surface, (50, 20, 20), 
-                         (food_screen_x + 3, food_screen_y + 3), food_radius)
-        # Food principale (rosso)
-        pygame.draw.circle(surface, (255, 50, 50), 
-                         (food_screen_x, food_screen_y), food_radius)
-        # Highlight food
-        pygame.draw.circle(surface, (255, 150, 150), 
-                         (food_screen_x - food_radius // 3, food_screen_y - food_radius // 3), 
-                         food_radius // 3)
-        # Gambo
-        pygame.draw.rect(surface, (80, 200, 80), 
-                       (food_screen_x - 2, food_screen_y - food_radius - 5, 4, 6))
+        surface.blit(self.grid_layer, (0, 0))
         
+        # Draw food (mela fumettistica); i dettagli in pixel scalano col tabellone
+        k = self.scale
+        if self.food_x is not None:
+            food_screen_x = self.food_x * self.grid_size + self.grid_size // 2 + shake_x
+            food_screen_y = self.food_y * self.grid_size + self.grid_size // 2 + shake_y
+            
+            # Animazione pulsante food
+            pulse = 1.0 + math.sin(pygame.time.get_ticks() * 0.005) * 0.15
+            food_radius = int(self.grid_size * 0.4 * pulse)
+            
+            # Ombra food
+            pygame.draw.circle(surface, (50, 20, 20), 
+                             (food_screen_x + int(3 * k), food_screen_y + int(3 * k)), food_radius)
+            # Food principale (rosso)
+            pygame.draw.circle(surface, (255, 50, 50), 
+                             (food_screen_x, food_screen_y), food_radius)
+            # Highlight food
+            pygame.draw.circle(surface, (255, 150, 150), 
+                             (food_screen_x - food_radius // 3, food_screen_y - food_radius // 3), 
+                             food_radius // 3)
+            # Gambo
+            pygame.draw.rect(surface, (80, 200, 80), 
+                           (food_screen_x - int(2 * k), food_screen_y - food_radius - int(5 * k),
+                            max(1, int(4 * k)), max(1, int(6 * k))))
+            
         # Draw snake (stile fumetto con outline)
-        for i, segment in enumerate(self.snake_segments):
-            sx = segment['x'] * self.grid_size + self.grid_size // 2 + shake_x
-            sy = segment['y'] * self.grid_size + self.grid_size // 2 + shake_y
+        for i, (seg_x, seg_y) in enumerate(self.snake_segments):
+            sx = seg_x * self.grid_size + self.grid_size // 2 + shake_x
+            sy = seg_y * self.grid_size + self.grid_size // 2 + shake_y
             
             # Colore gradiente verde
             is_head = (i == 0)
@@ -229,53 +300,49 @@ class SnakeGame(MiniGame):
                 
                 # Outline nero
                 pygame.draw.circle(surface, (20, 20, 20), 
-                                 (int(sx), int(sy)), int(head_size) + 3)
+                                 (int(sx), int(sy)), int(head_size) + int(3 * k))
                 # Testa verde chiaro
                 pygame.draw.circle(surface, (100, 255, 100), 
                                  (int(sx), int(sy)), int(head_size))
                 
                 # Occhi fumettistici
-                eye_offset = 6
-                eye_radius = 4
+                eye_offset = 6 * k
+                eye_radius = max(1, int(4 * k))
+                pupil_radius = max(1, int(2 * k))
                 
                 # Occhio sinistro
                 pygame.draw.circle(surface, (255, 255, 255), 
-                                 (int(sx - eye_offset), int(sy - 3)), eye_radius)
+                                 (int(sx - eye_offset), int(sy - 3 * k)), eye_radius)
                 pygame.draw.circle(surface, (20, 20, 20), 
-                                 (int(sx - eye_offset + 1), int(sy - 2)), 2)
+                                 (int(sx - eye_offset + k), int(sy - 2 * k)), pupil_radius)
                 
                 # Occhio destro
                 pygame.draw.circle(surface, (255, 255, 255), 
-                                 (int(sx + eye_offset), int(sy - 3)), eye_radius)
+                                 (int(sx + eye_offset), int(sy - 3 * k)), eye_radius)
                 pygame.draw.circle(surface, (20, 20, 20), 
-                                 (int(sx + eye_offset + 1), int(sy - 2)), 2)
+                                 (int(sx + eye_offset + k), int(sy - 2 * k)), pupil_radius)
                 
                 # Bocca
                 pygame.draw.arc(surface, (20, 20, 20), 
-                              (int(sx - 6), int(sy), 12, 8), 
-                              3.14, 6.28, 2)
+                              (int(sx - 6 * k), int(sy), int(12 * k), int(8 * k)), 
+                              3.14, 6.28, max(1, int(2 * k)))
             else:
                 # Corpo con outline
                 body_size = self.grid_size * 0.45
                 pygame.draw.circle(surface, (20, 20, 20), 
-                                 (int(sx), int(sy)), int(body_size) + 2)
+                                 (int(sx), int(sy)), int(body_size) + max(1, int(2 * k)))
                 pygame.draw.circle(surface, (50, brightness, 50), 
                                  (int(sx), int(sy)), int(body_size))
                 # Highlight corpo
                 pygame.draw.circle(surface, (150, 255, 150), 
-                                 (int(sx - 3), int(sy - 3)), int(body_size * 0.3))
+                                 (int(sx - 3 * k), int(sy - 3 * k)), int(body_size * 0.3))
         
         # Particelle mangiata
-        for particle in self.particles:
-            size = max(1, int(particle['life'] * 8))
-            alpha_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            color = particle['color'] + (int(particle['life'] * 255),)
-            pygame.draw.circle(alpha_surf, color, (size, size), size)
-            surface.blit(alpha_surf, (int(particle['x']) - size, int(particle['y']) - size))
+        self.particles.draw(surface)
         
         # Score display (fumettistico)
-        font_big = pygame.font.Font(None, 92)
-        font_small = pygame.font.Font(None, 48)
+        font_big = text_cache.get_font(92)
+        font_small = text_cache.get_font(48)
         
         # Outline score
         score_text = str(self.score)
@@ -302,11 +369,11 @@ class SnakeGame(MiniGame):
         overlay.fill((20, 30, 60, 220))
         surface.blit(overlay, (0, 0))
         
-        font_big = pygame.font.Font(None, 140)
+        font_big = text_cache.get_font(140)
         pause_text = font_big.render("PAUSED", True, (255, 255, 255))
         surface.blit(pause_text, (640 - pause_text.get_width() // 2, 280))
         
-        font_small = pygame.font.Font(None, 52)
+        font_small = text_cache.get_font(52)
         resume_text = font_small.render("MIDDLE BUTTON: RESUME", True, (100, 255, 100))
         menu_text = font_small.render("RIGHT BUTTON: MENU EXIT", True, (255, 200, 100))
         
@@ -1,6 +1,7 @@
 import pygame
 import math
 import random
+import numpy as np
 from dataclasses import dataclass
 from typing import List, Tuple, Optional, Dict, Any
 from enum import Enum
@@ -38,24 +39,6 @@ class Character:
     unlock_cost: int = 0
     unlocked: bool = True
 
-@dataclass
-class Particle:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    life: float
-    max_life: float
-    color: Tuple[int, int, int]
-    size: float
-    shape: str = "circle"
-    gravity: float = 0
-    trail: bool = False
-    fade_out: bool = True
-    glow: bool = False
-    rotation: float = 0
-    rotate_speed: float = 0
-
 @dataclass 
 class DamageNumber:
     x: float
@@ -79,6 +62,9 @@ class FloatingText:
     velocity_y: float = -40
 
 class Projectile:
+    # Glow a 3 strati concentrici (raggio, alpha) per glow_cache
+    GLOW_LAYERS = ((1.0, 1.0), (2 / 3, 2 / 3), (1 / 3, 1 / 3))
+
     def __init__(self, x: float, y: float, vx: float, vy: float, damage: int,
                  color: Tuple[int, int, int], size: float = 6, lifetime: float = 1.5,
                  piercing: int = 1, homing: bool = False, area: float = 1.0,
@@ -120,11 +106,11 @@ class Projectile:
         damage = int(self.base_damage * (2.0 if is_crit else 1.0))
         return damage, is_crit
         
-    def update(self, dt: float, enemies: List['Enemy'] = None):
+    def update(self, dt: float, enemy_grid: 'SpatialHashGrid' = None):
         self.spawn_time += dt
         
-        if self.homing and enemies and self.spawn_time > 0.1:
-            closest = self.find_closest_enemy(enemies)
+        if self.homing and enemy_grid and self.spawn_time > 0.1:
+            closest = self.find_closest_enemy(enemy_grid)
             if closest:
                 dx = closest.x - self.x
                 dy = closest.y - self.y
@@ -164,50 +150,27 @@ class Projectile:
         if abs(self.x - 5000) > 6000 or abs(self.y - 5000) > 6000:
             self.active = False
     
-    def find_closest_enemy(self, enemies: List['Enemy']) -> Optional['Enemy']:
-        closest = None
-        min_dist = float('inf')
-        for enemy in enemies:
-            if enemy.alive and enemy != self.last_hit_enemy:
-                dx = enemy.x - self.x
-                dy = enemy.y - self.y
-                dist = dx*dx + dy*dy
-                if dist < min_dist and dist < 600*600:
-                    min_dist = dist
-                    closest = enemy
-        return closest
+    def find_closest_enemy(self, enemy_grid: 'SpatialHashGrid') -> Optional['Enemy']:
+        return enemy_grid.nearest(self.x, self.y, 600,
+                                  lambda enemy: enemy.alive and enemy != self.last_hit_enemy)
     
-    def draw(self, surface: pygame.Surface, camera_x: float, camera_y: float, shake_x: float, shake_y: float):
-        screen_x = self.x - camera_x + shake_x
-        screen_y = self.y - camera_y + shake_y
-        
-        # Solo disegnare se visibile
-        if not (-100 <= screen_x <= 1380 and -100 <= screen_y <= 820):
-            return
+    def draw(self, surface: pygame.Surface, camera: 'Camera'):
+        screen_x, screen_y = camera.to_screen(self.x, self.y)
             
         if self.trail_enabled:
             for i, (tx, ty, life) in enumerate(self.trail):
                 alpha = life * 0.7
                 size = max(1, self.size * alpha * 0.5)
                 trail_color = tuple(min(255, max(0, int(c * alpha))) for c in self.color)
-                trail_screen_x = tx - camera_x + shake_x
-                trail_screen_y = ty - camera_y + shake_y
-                
-                if -50 <= trail_screen_x <= 1330 and -50 <= trail_screen_y <= 770:
-                    trail_surf = pygame.Surface((int(size*2), int(size*2)), pygame.SRCALPHA)
-                    pygame.draw.circle(trail_surf, (*trail_color, int(alpha * 200)), 
-                                     (int(size), int(size)), int(size))
-                    surface.blit(trail_surf, (int(trail_screen_x - size), int(trail_screen_y - size)))
+                if camera.is_visible(tx, ty, 50):
+                    trail_screen_x, trail_screen_y = camera.to_screen(tx, ty)
+                    glow_cache.draw(surface, (trail_screen_x, trail_screen_y), size,
+                                    trail_color, alpha * 200)
         
         glow_size = self.size * (2.0 + self.glow_pulse * 0.6)
         if glow_size > 0 and self.glow_intensity > 0:
-            glow_surf = pygame.Surface((int(glow_size*2), int(glow_size*2)), pygame.SRCALPHA)
-            for i in range(3, 0, -1):
-                alpha = int(80 * self.glow_intensity * (self.glow_pulse + 0.5) * (i/3))
-                if alpha > 0:
-                    pygame.draw.circle(glow_surf, (*self.color, alpha), 
-                                     (int(glow_size), int(glow_size)), int(glow_size * (i/3)))
-            surface.blit(glow_surf, (int(screen_x - glow_size), int(screen_y - glow_size)))
+            glow_cache.draw(surface, (screen_x, screen_y), glow_size, self.color,
+                            80 * self.glow_intensity * (self.glow_pulse + 0.5), layers=self.GLOW_LAYERS)
         
         draw_color = tuple(min(255, max(0, int(c * (1 + self.glow_pulse*0.3)))) for c in self.color)
         
@@ -289,12 +252,7 @@ class Projectile:
             for i in range(ring_count):
                 ring_size = self.size * (1 - i*0.2)
                 ring_alpha = 150 + int(100 * math.sin(self.lifetime * 10 + i))
-                ring_color = (*draw_color, ring_alpha)
-                
-                ring_surf = pygame.Surface((int(ring_size*2), int(ring_size*2)), pygame.SRCALPHA)
-                pygame.draw.circle(ring_surf, ring_color, 
-                                 (int(ring_size), int(ring_size)), int(ring_size))
-                surface.blit(ring_surf, (int(screen_x - ring_size), int(screen_y - ring_size)))
+                glow_cache.draw(surface, (screen_x, screen_y), ring_size, draw_color, ring_alpha)
             
             cross_size = self.size * 0.8
             pygame.draw.line(surface, (255, 255, 200), 
@@ -357,9 +315,138 @@ class Projectile:
 
 
 
+class EnemyStore:
+    """Stato dinamico dei nemici in array NumPy (una riga per nemico, stesso ordine
+    di VampireBall.enemies): inseguimento, onda degli slime e decadimenti in un
+    solo passo vettoriale. Gli Enemy sono viste sulla propria riga."""
+
+    FLOAT_FIELDS = ('x', 'y', 'speed', 'slow_factor', 'knockback_vx', 'knockback_vy',
+                    'hit_flash', 'attack_cooldown', 'shoot_timer', 'animation_time',
+                    'wave_time', 'wave_amplitude', 'wave_frequency', 'pulse')
+    FIELDS = FLOAT_FIELDS + ('hp', 'type')
+
+    def __init__(self, capacity: int = 256):
+        self.count = 0
+        self.views: List['Enemy'] = []
+        self._allocate_arrays(max(1, capacity))
+
+    def _allocate_arrays(self, capacity: int):
+        old = {name: getattr(self, name) for name in self.FIELDS} if self.views else {}
+        self.capacity = capacity
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        self.hp = np.zeros(capacity, dtype=np.int64)
+        self.type = np.zeros(capacity, dtype=np.int16)
+        for name, array in old.items():
+            getattr(self, name)[:self.count] = array[:self.count]
+
+    def allocate(self, enemy: 'Enemy') -> int:
+        if self.count == self.capacity:
+            self._allocate_arrays(self.capacity * 2)
+        slot = self.count
+        for name in self.FIELDS:
+            getattr(self, name)[slot] = 0
+        self.views.append(enemy)
+        self.count += 1
+        return slot
+
+    def adopt(self, enemy: 'Enemy'):
+        """Sposta il nemico (creato staccato) nello store condiviso"""
+        source, source_slot = enemy._store, enemy._slot
+        slot = self.allocate(enemy)
+        for name in self.FIELDS:
+            getattr(self, name)[slot] = getattr(source, name)[source_slot]
+        self.type[slot] = enemy.type  # Il tipo non cambia: la vista lo tiene come attributo
+        enemy._store, enemy._slot = self, slot
+
+    def compact(self, enemies: List['Enemy']):
+        """Tiene solo le righe di enemies, nel loro ordine. I nemici scartati
+        ricevono una copia privata dello stato (restano validi se referenziati)."""
+        kept = set(map(id, enemies))
+        for view in self.views:
+            if id(view) not in kept:
+                view._detach()
+        slots = np.fromiter((enemy._slot for enemy in enemies), dtype=np.intp, count=len(enemies))
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[:len(slots)] = array[slots]
+        self.count = len(slots)
+        self.views = list(enemies)
+        for slot, enemy in enumerate(self.views):
+            enemy._slot = slot
+
+    def update(self, dt: float, player_x: float, player_y: float):
+        """I nemici morti nel frame vengono scartati subito dopo da compact()"""
+        n = self.count
+        if n == 0:
+            return
+        self.animation_time[:n] += dt * 3
+        self.hit_flash[:n] = np.maximum(0, self.hit_flash[:n] - dt * 5)
+        self.knockback_vx[:n] *= 0.9
+        self.knockback_vy[:n] *= 0.9
+        slow_factor = np.minimum(1.0, self.slow_factor[:n] + dt * 4)
+        self.slow_factor[:n] = slow_factor
+        self.attack_cooldown[:n] = np.maximum(0, self.attack_cooldown[:n] - dt)
+        self.shoot_timer[:n] -= dt
+
+        x = self.x[:n]
+        y = self.y[:n]
+        dx = player_x - x
+        dy = player_y - y
+        dist = np.sqrt(dx*dx + dy*dy)
+        moving = dist > 0
+        dist = np.where(moving, dist, 1.0)
+        effective_speed = self.speed[:n] * slow_factor
+        move_x = (dx/dist) * effective_speed * dt
+        move_y = (dy/dist) * effective_speed * dt
+
+        # Slime: movimento ondulatorio perpendicolare alla direzione del giocatore
+        slime = moving & (self.type[:n] == 5)
+        if slime.any():
+            wave_time = np.where(slime, self.wave_time[:n] + dt, self.wave_time[:n])
+            self.wave_time[:n] = wave_time
+            wave_offset = np.where(
+                slime, np.sin(wave_time * self.wave_frequency[:n]) * self.wave_amplitude[:n] * dt, 0.0)
+            move_x += (-dy/dist) * wave_offset
+            move_y += (dx/dist) * wave_offset
+
+        self.x[:n] = np.where(moving, x + (move_x + self.knockback_vx[:n] * dt), x)
+        self.y[:n] = np.where(moving, y + (move_y + self.knockback_vy[:n] * dt), y)
+        self.pulse[:n] = np.sin(self.animation_time[:n] * 2) * 0.1 + 0.9
+
+
+def _enemy_field(name: str) -> property:
+    """Attributo di Enemy letto/scritto nella riga dello store"""
+    def get(self):
+        return getattr(self._store, name).item(self._slot)
+
+    def set(self, value):
+        getattr(self._store, name)[self._slot] = value
+    return property(get, set)
+
+
 class Enemy:
+    x = _enemy_field('x')
+    y = _enemy_field('y')
+    hp = _enemy_field('hp')
+    speed = _enemy_field('speed')
+    slow_factor = _enemy_field('slow_factor')
+    knockback_vx = _enemy_field('knockback_vx')
+    knockback_vy = _enemy_field('knockback_vy')
+    hit_flash = _enemy_field('hit_flash')
+    attack_cooldown = _enemy_field('attack_cooldown')
+    shoot_timer = _enemy_field('shoot_timer')
+    animation_time = _enemy_field('animation_time')
+    wave_time = _enemy_field('wave_time')
+    wave_amplitude = _enemy_field('wave_amplitude')
+    wave_frequency = _enemy_field('wave_frequency')
+    pulse = _enemy_field('pulse')
+
     def __init__(self, x: float, y: float, enemy_type: int, difficulty: float, 
                  is_boss: bool = False, game_time: float = 0):
+        # Riga privata finché VampireBall.add_enemy non la sposta nello store condiviso
+        self._store = EnemyStore(1)
+        self._slot = self._store.allocate(self)
         self.x = x
         self.y = y
         self.type = enemy_type
@@ -506,49 +593,13 @@ class Enemy:
             self.wave_amplitude = random.uniform(10, 20)
             self.wave_frequency = random.uniform(2, 4)
             
-    def update(self, dt: float, player_x: float, player_y: float, game_time: float = 0):
-        if not self.alive:
-            return
-            
-        self.animation_time += dt * 3
-        self.hit_flash = max(0, self.hit_flash - dt * 5)
-        self.knockback_vx *= 0.9
-        self.knockback_vy *= 0.9
-        self.slow_factor = min(1.0, self.slow_factor + dt * 4)
-        self.attack_cooldown = max(0, self.attack_cooldown - dt)
-        
-        if hasattr(self, 'shoot_timer'):
-            self.shoot_timer -= dt
-        
-        dx = player_x - self.x
-        dy = player_y - self.y
-        dist = math.sqrt(dx*dx + dy*dy)
-        
-        if dist > 0:
-            effective_speed = self.speed * self.slow_factor
-            
-            # Movimento speciale per alcuni nemici
-            if self.type == 5:  # Slime
-                self.wave_time += dt
-                wave_offset = math.sin(self.wave_time * self.wave_frequency) * self.wave_amplitude * dt
-                move_x = (dx/dist) * effective_speed * dt
-                move_y = (dy/dist) * effective_speed * dt
-                # Aggiunge movimento ondulatorio
-                perp_dx = -dy
-                perp_dy = dx
-                perp_dist = math.sqrt(perp_dx*perp_dx + perp_dy*perp_dy)
-                if perp_dist > 0:
-                    move_x += (perp_dx/perp_dist) * wave_offset
-                    move_y += (perp_dy/perp_dist) * wave_offset
-            else:
-                move_x = (dx/dist) * effective_speed * dt
-                move_y = (dy/dist) * effective_speed * dt
-                
-            self.x += move_x + self.knockback_vx * dt
-            self.y += move_y + self.knockback_vy * dt
-            
-        self.pulse = math.sin(self.animation_time * 2) * 0.1 + 0.9
-            
+    def _detach(self):
+        store = EnemyStore(1)
+        slot = store.allocate(self)
+        for name in EnemyStore.FIELDS:
+            getattr(store, name)[slot] = getattr(self._store, name)[self._slot]
+        self._store, self._slot = store, slot
+
     def take_damage(self, damage: int, is_crit: bool = False) -> bool:
         self.hp -= damage
         self.hit_flash = 1.2 if is_crit else 0.8
@@ -560,24 +611,22 @@ class Enemy:
     def apply_slow(self, factor: float):
         self.slow_factor = min(self.slow_factor, factor)
         
-    def draw(self, surface: pygame.Surface, camera_x: float, camera_y: float, shake_x: float, shake_y: float):
+    def draw(self, surface: pygame.Surface, camera: 'Camera'):
         if not self.alive:
             return
             
-        screen_x = self.x - camera_x + shake_x
-        screen_y = self.y - camera_y + shake_y
-        
-        # Solo disegnare se visibile
-        if not (-self.size*2 <= screen_x <= 1280 + self.size*2 and 
-                -self.size*2 <= screen_y <= 720 + self.size*2):
-            return
+        # Lettura diretta della riga (evita una property per ogni accesso)
+        store, slot = self._store, self._slot
+        screen_x = store.x.item(slot) + camera.offset_x
+        screen_y = store.y.item(slot) + camera.offset_y
             
-        current_size = self.size * self.pulse
+        current_size = self.size * store.pulse.item(slot)
         
         # Effetto hit flash
         body_color = self.color
-        if self.hit_flash > 0:
-            flash_amt = int(self.hit_flash * 100)
+        hit_flash = store.hit_flash.item(slot)
+        if hit_flash > 0:
+            flash_amt = int(hit_flash * 100)
             body_color = tuple(min(255, c + flash_amt) for c in self.color)
         
         # Disegno specifico per tipo
@@ -709,10 +758,7 @@ class Enemy:
             pygame.draw.rect(surface, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 2, 6)
             
             # Nome boss
-            font = pygame.font.Font(None, 24)
-            name_text = font.render(f"{self.name} BOSS", True, (255, 200, 100))
-            name_rect = name_text.get_rect(center=(screen_x, bar_y - 15))
-            surface.blit(name_text, name_rect)
+            text_cache.draw(surface, f"{self.name} BOSS", 24, (255, 200, 100), (screen_x, bar_y - 15))
 
 
 
@@ -748,51 +794,32 @@ class AuraEffect:
         if self.duration <= 0:
             self.active = False
             
-    def draw(self, surface: pygame.Surface, camera_x: float, camera_y: float, shake_x: float, shake_y: float):
-        screen_x = self.x - camera_x + shake_x
-        screen_y = self.y - camera_y + shake_y
-        
-        # Solo disegnare se visibile
-        if not (-self.radius*2 <= screen_x <= 1280 + self.radius*2 and 
-                -self.radius*2 <= screen_y <= 720 + self.radius*2):
-            return
+    def draw(self, surface: pygame.Surface, camera: 'Camera'):
+        screen_x, screen_y = camera.to_screen(self.x, self.y)
             
         # Pulse molto leggero
         pulse = (math.sin(self.animation_time) * 0.15 + 0.85) * (self.duration / self.max_duration)
         current_radius = self.radius * pulse
         
-        # Crea una superficie per l'aura
-        aura_size = int(current_radius * 2)
-        aura_surf = pygame.Surface((aura_size, aura_size), pygame.SRCALPHA)
+        # Anelli da 1px disegnati direttamente con alpha blending (gfxdraw):
+        # nessuna surface grande quanto l'aura da allocare o blittare
+        center_x, center_y = int(screen_x), int(screen_y)
         
-        # CENTRO: Solo un punto minimale (opzionale, commenta per rimuovere completamente)
-        # center_alpha = int(30 * pulse)
-        # if center_alpha > 5:
-        #     pygame.draw.circle(aura_surf, (*self.color, center_alpha), 
-        #                      (aura_size//2, aura_size//2), int(current_radius * 0.05))
+        # Effetto di pulso leggero sul bordo (opzionale)
+        edge_pulse = abs(math.sin(self.animation_time * 1.5)) * 0.3 + 0.7
+        edge_alpha = int(40 * edge_pulse * pulse)
         
         # CERCHIO ESTERNO SFUMATO - l'unico elemento visibile principale
         for i in range(6):  # Pochi passi per la sfumatura
             # Calcola raggio e alpha per ogni anello
-            ring_radius = current_radius - (i * 2)  # Anelli distanziati di 2px
+            ring_radius = int(current_radius - (i * 2))  # Anelli distanziati di 2px
             ring_alpha = int(25 * (1 - i/6) * pulse)  # Trasparenza massima 25
             
+            if i == 0 and edge_alpha > 5:
+                ring_alpha = edge_alpha  # Il bordo sostituisce il primo anello
             if ring_alpha > 3 and ring_radius > 0:  # Solo se visibile
-                # Linea molto sottile per ogni anello
-                pygame.draw.circle(aura_surf, (*self.color, ring_alpha), 
-                                 (aura_size//2, aura_size//2), 
-                                 int(ring_radius), 1)  # width=1 pixel
-        
-        # Effetto di pulso leggero sul bordo (opzionale)
-        edge_pulse = abs(math.sin(self.animation_time * 1.5)) * 0.3 + 0.7
-        edge_alpha = int(40 * edge_pulse * pulse)
-        if edge_alpha > 5:
-            pygame.draw.circle(aura_surf, (*self.color, edge_alpha), 
-                             (aura_size//2, aura_size//2), 
-                             int(current_radius), 1)
-        
-        # Disegna l'aura sulla superficie principale
-        surface.blit(aura_surf, (screen_x - aura_size//2, screen_y - aura_size//2))
+                pygame.gfxdraw.circle(surface, center_x, center_y, ring_radius,
+                                      (*self.color, ring_alpha))
 
 
 
@@ -804,6 +831,8 @@ class AuraEffect:
 
 
 class XPGem:
+    GLOW_LAYERS = ((1.0, 1.0), (0.8, 0.5))
+
     def __init__(self, x: float, y: float, value: int, is_big: bool = False):
         self.x = x
         self.y = y
@@ -862,14 +891,8 @@ class XPGem:
         if dist_sq < 300:
             self.collected = True
             
-    def draw(self, surface: pygame.Surface, camera_x: float, camera_y: float, shake_x: float, shake_y: float):
-        screen_x = self.x - camera_x + shake_x
-        screen_y = self.y - camera_y + shake_y
-        
-        # Solo disegnare se visibile
-        if not (-self.size*2 <= screen_x <= 1280 + self.size*2 and 
-                -self.size*2 <= screen_y <= 720 + self.size*2):
-            return
+    def draw(self, surface: pygame.Surface, camera: 'Camera'):
+        screen_x, screen_y = camera.to_screen(self.x, self.y)
             
         # Calcoli per le animazioni
         bob_offset = math.sin(self.bob_phase) * self.bob_height
@@ -880,16 +903,10 @@ class XPGem:
         # GLOW/ALONE (effetto di bagliore continuo)
         glow_pulse = (math.sin(self.lifetime * 6) * 0.5 + 0.5) * 0.4 + 0.6
         glow_size = size * 2.2
-        glow_surf = pygame.Surface((int(glow_size*2), int(glow_size*2)), pygame.SRCALPHA)
         
         # Doppio layer di glow per effetto più morbido
-        for i in range(2):
-            layer_size = glow_size * (1 - i * 0.2)
-            layer_alpha = int(120 * glow_pulse * (1 - i * 0.5))
-            pygame.draw.circle(glow_surf, (*self.glow_color[:3], layer_alpha), 
-                             (int(glow_size), int(glow_size)), int(layer_size))
-        
-        surface.blit(glow_surf, (screen_x - glow_size, current_y - glow_size))
+        glow_cache.draw(surface, (screen_x, current_y), glow_size, self.glow_color,
+                        120 * glow_pulse, layers=self.GLOW_LAYERS)
         
         # FORMA DELLA MONETA/GIMMA (ottagono come diamante/medaglia)
         points = []
@@ -935,33 +952,34 @@ class XPGem:
         sparkle_chance = 0.2  # 20% di chance di scintillio
         if random.random() < sparkle_chance:
             sparkle_size = size * 0.8
-            sparkle_surf = pygame.Surface((int(sparkle_size*2), int(sparkle_size*2)), pygame.SRCALPHA)
-            
-            # Stella a 4 punte
-            for i in range(4):
-                angle = i * math.pi/2
-                pygame.draw.line(
-                    sparkle_surf, 
-                    (255, 255, 255, 220),
-                    (sparkle_size + math.cos(angle) * sparkle_size * 0.3, 
-                     sparkle_size + math.sin(angle) * sparkle_size * 0.3),
-                    (sparkle_size + math.cos(angle) * sparkle_size, 
-                     sparkle_size + math.sin(angle) * sparkle_size),
-                    max(1, size // 8)
-                )
-            
+            sparkle_surf = glow_cache.sprite(("gem_sparkle", size), (int(sparkle_size*2), int(sparkle_size*2)),
+                                             lambda sprite: self.paint_sparkle(sprite, size))
             surface.blit(sparkle_surf, (screen_x - sparkle_size, current_y - sparkle_size))
         
         # NUMERO DEL VALORE (solo per gemme grandi)
         if self.is_big and size > 15:
-            font = pygame.font.Font(None, max(16, size // 2))
-            text = font.render(str(self.value), True, (255, 255, 200))
-            text_rect = text.get_rect(center=(int(screen_x), int(current_y)))
-            
+            font_size = max(16, size // 2)
             # Ombra del testo
-            shadow_text = font.render(str(self.value), True, (100, 80, 0))
-            surface.blit(shadow_text, (text_rect.x + 1, text_rect.y + 1))
-            surface.blit(text, text_rect)
+            text_cache.draw(surface, str(self.value), font_size, (100, 80, 0), (screen_x + 1, current_y + 1))
+            text_cache.draw(surface, str(self.value), font_size, (255, 255, 200), (screen_x, current_y))
+
+    @staticmethod
+    def paint_sparkle(sparkle_surf: pygame.Surface, size: int):
+        # Stella a 4 punte
+        sparkle_size = size * 0.8
+        for i in range(4):
+            angle = i * math.pi/2
+            pygame.draw.line(
+                sparkle_surf, 
+                (255, 255, 255, 220),
+                (sparkle_size + math.cos(angle) * sparkle_size * 0.3, 
+                 sparkle_size + math.sin(angle) * sparkle_size * 0.3),
+                (sparkle_size + math.cos(angle) * sparkle_size, 
+                 sparkle_size + math.sin(angle) * sparkle_size),
+                max(1, size // 8)
+            )
+
+
 class Coin:
     def __init__(self, x: float, y: float, value: int, is_big: bool = False):
         self.x = x
@@ -1023,14 +1041,8 @@ class Coin:
         if dist_sq < 300:
             self.collected = True
             
-    def draw(self, surface: pygame.Surface, camera_x: float, camera_y: float, shake_x: float, shake_y: float):
-        screen_x = self.x - camera_x + shake_x
-        screen_y = self.y - camera_y + shake_y
-        
-        # Solo disegnare se visibile
-        if not (-self.size*4 <= screen_x <= 1280 + self.size*4 and 
-                -self.size*4 <= screen_y <= 720 + self.size*4):
-            return
+    def draw(self, surface: pygame.Surface, camera: 'Camera'):
+        screen_x, screen_y = camera.to_screen(self.x, self.y)
             
         pulse = math.sin(self.pulse_time) * 0.2 + 1.0
         size = int(self.size * pulse)
@@ -1039,19 +1051,13 @@ class Coin:
         aura_size = size * 2.2
         aura_pulse = math.sin(self.lifetime * 6) * 0.3 + 0.7
         aura_alpha = int(120 * aura_pulse * self.glow_intensity)
-        aura_surf = pygame.Surface((int(aura_size*2), int(aura_size*2)), pygame.SRCALPHA)
-        pygame.draw.circle(aura_surf, (*self.glow_color, aura_alpha), 
-                         (int(aura_size), int(aura_size)), int(aura_size))
-        surface.blit(aura_surf, (screen_x - aura_size, screen_y - aura_size))
+        glow_cache.draw(surface, (screen_x, screen_y), aura_size, self.glow_color, aura_alpha)
         
         # Effetto scintillio
         if math.sin(self.sparkle_time) > 0.7:
             sparkle_size = size * 1.5
             sparkle_alpha = int(200 * math.sin(self.sparkle_time))
-            sparkle_surf = pygame.Surface((int(sparkle_size*2), int(sparkle_size*2)), pygame.SRCALPHA)
-            pygame.draw.circle(sparkle_surf, (255, 255, 200, sparkle_alpha), 
-                             (int(sparkle_size), int(sparkle_size)), int(sparkle_size))
-            surface.blit(sparkle_surf, (screen_x - sparkle_size, screen_y - sparkle_size))
+            glow_cache.draw(surface, (screen_x, screen_y), sparkle_size, (255, 255, 200), sparkle_alpha)
         
         # Moneta rotante
         coin_radius = size
@@ -1075,9 +1081,7 @@ class Coin:
         # Disegna "$" stilizzato ruotato con la moneta
         font_size = int(inner_radius * 1.5)
         try:
-            font = pygame.font.Font(None, font_size)
-            text = font.render("$", True, (180, 150, 0))
-            text_rect = text.get_rect(center=(int(screen_x), int(screen_y)))
+            text = text_cache.render("$", font_size, (180, 150, 0))
             
             # Ruota la superficie del testo
             rotated_text = pygame.transform.rotate(text, -self.rotation * 180/math.pi)
@@ -1166,32 +1170,22 @@ class PowerUpDrop:
         if dist_sq < 250:
             self.collected = True
             
-    def draw(self, surface: pygame.Surface, camera_x: float, camera_y: float, shake_x: float, shake_y: float):
-        screen_x = self.x - camera_x + shake_x
-        screen_y = self.y - camera_y + shake_y
-        
-        if not (-50 <= screen_x <= 1330 and -50 <= screen_y <= 770):
-            return
+    def draw(self, surface: pygame.Surface, camera: 'Camera'):
+        screen_x, screen_y = camera.to_screen(self.x, self.y)
             
         pulse = math.sin(self.pulse_time) * 0.2 + 1.0
         size = 15 * pulse
         
         # Glow
         glow_size = size * 2.5
-        glow_surf = pygame.Surface((int(glow_size*2), int(glow_size*2)), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*self.color, 80), 
-                         (int(glow_size), int(glow_size)), int(glow_size))
-        surface.blit(glow_surf, (screen_x - glow_size, screen_y - glow_size))
+        glow_cache.draw(surface, (screen_x, screen_y), glow_size, self.color, 80)
         
         # Icona
         pygame.draw.circle(surface, self.color, (int(screen_x), int(screen_y)), int(size))
         pygame.draw.circle(surface, (255, 255, 255), (int(screen_x), int(screen_y)), int(size), 2)
         
         # Simbolo
-        font = pygame.font.Font(None, int(size * 1.5))
-        symbol = font.render(self.symbol, True, (255, 255, 255))
-        symbol_rect = symbol.get_rect(center=(int(screen_x), int(screen_y)))
-        surface.blit(symbol, symbol_rect)
+        text_cache.draw(surface, self.symbol, int(size * 1.5), (255, 255, 255), (screen_x, screen_y))
 
 class Weapon:
     def __init__(self, name: str, base_damage: int, fire_rate: float,
@@ -1232,6 +1226,13 @@ class Weapon:
         return self.fire_rate / stats_fire_rate_mult
 
 class VampireBall(MiniGame):
+    MAX_ENEMIES = 250  # Tetto di gameplay: lo store regge migliaia di nemici, il disegno no
+    # Strati (raggio, alpha[, spessore]) per glow_cache: scudo a 3 anelli e aura
+    # speciale a 3 dischi (alpha già composta come nei vecchi blit sovrapposti)
+    SHIELD_LAYERS = ((1.0, 1.0, 2), (0.9, 0.7, 2), (0.8, 0.4, 2))
+    SPECIAL_LAYERS = ((1.0, 1.0), (0.8, 1.43), (0.6, 1.6))
+    ENEMY_DRAW_EXTENT = 44  # Margine di culling: 2x la taglia del nemico più grande
+
     def __init__(self, *args, sound=None, **kwargs):
         super().__init__("Vampire Ball",
                         "Survive endless hordes of monsters",
@@ -1296,12 +1297,15 @@ class VampireBall(MiniGame):
         
         # Reset di TUTTE le liste
         self.enemies: List[Enemy] = []
+        self.enemy_store = EnemyStore()  # Righe NumPy dei nemici, stesso ordine di self.enemies
+        self.enemy_grid = SpatialHashGrid(128)  # Indice dei nemici per collisioni e bersagli
+        self.camera = Camera(1280, 720, profiler=profiler)  # Vista e culling per draw_gameplay
         self.projectiles: List[Projectile] = []
         self.aura_effects: List[AuraEffect] = []
         self.xp_gems: List[XPGem] = []
         self.coins_drops: List[Coin] = []
         self.powerup_drops: List[PowerUpDrop] = []
-        self.particles: List[Particle] = []
+        self.particles = ParticleSystem(500, fade="quadratic", drag=(0.92, 1.0), sprites=glow_cache)
         self.damage_numbers: List[DamageNumber] = []
         self.floating_texts: List[FloatingText] = []
         
@@ -1416,6 +1420,51 @@ class VampireBall(MiniGame):
                     'twinkle_speed': random.uniform(0.5, 3.0)
                 })
             self.parallax_layers.append(layer)
+        self.build_background()
+        
+    def build_background(self):
+        """Pre-render dello sfondo di gioco, una volta per reset(): fondo e
+        nebulose in un tile avvolgibile, griglia come strisce tratteggiate,
+        stelle in array (twinkle vettoriale, un fill 2x2 per stella visibile)."""
+        # Fondo + nebulose: si muovono insieme (parallasse 0.05), un solo tile
+        tile = pygame.Surface((1280, 720))
+        tile.fill((5, 8, 15))  # Blu notte quasi nero
+        nebula_colors = [
+            [(30, 20, 50, 15), (40, 25, 60, 10)],  # Viola scuro
+            [(20, 30, 50, 12), (25, 35, 55, 8)]    # Blu scuro
+        ]
+        for i, colors in enumerate(nebula_colors):
+            nebula_size = 180 + i * 120
+            for layer_idx, color_data in enumerate(colors):
+                layer_size = nebula_size * (0.8 + layer_idx * 0.2)
+                # Copie avvolte: il tile deve combaciare sui bordi
+                for wrap_x in (-1280, 0, 1280):
+                    for wrap_y in (-720, 0, 720):
+                        glow_cache.draw(tile, (i * 700 + wrap_x, i * 450 + wrap_y), layer_size,
+                                        color_data, color_data[3])
+        self.background_tile = tile
+        
+        # Griglia: una striscia tratteggiata per direzione (trattini da 10px ogni 20px)
+        grid_color = (30, 35, 50)  # Blu-acciaio scuro
+        vertical = pygame.Surface((1, 720))
+        horizontal = pygame.Surface((1280, 1))
+        for strip in (vertical, horizontal):
+            strip.fill((0, 0, 0))
+            strip.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        for y in range(0, 720, 20):
+            vertical.fill(grid_color, (0, y, 1, 10))
+        for x in range(0, 1280, 20):
+            horizontal.fill(grid_color, (x, 0, 10, 1))
+        self.grid_strips = (vertical, horizontal)
+        
+        # Stelle: colonne NumPy per layer (stesso ordine di parallax_layers)
+        self.star_arrays = []
+        for layer in self.parallax_layers:
+            stars = layer['stars']
+            self.star_arrays.append({
+                name: np.array([star[name] for star in stars], dtype=np.float64)
+                for name in ('x', 'y', 'size', 'brightness', 'twinkle_speed')
+            })
         
     def initialize_powerups_database(self):
         self.all_powerups = {
@@ -2113,7 +2162,7 @@ class VampireBall(MiniGame):
                     
         # SPAWN nemici - SOSTITUISCI QUESTA PARTE
         current_minute = int(self.game_time / 60)
-        max_enemies = min(250, 50 + (current_minute * 30) + (self.wave_number * 20))
+        max_enemies = min(self.MAX_ENEMIES, 50 + (current_minute * 30) + (self.wave_number * 20))
         
         current_enemies = len([e for e in self.enemies if e.alive])
         
@@ -2185,7 +2234,7 @@ class VampireBall(MiniGame):
 
         # Aggiorna proiettili
         for projectile in self.projectiles[:300]:
-            projectile.update(dt, self.enemies)
+            projectile.update(dt, self.enemy_grid)
             
         self.projectiles = [p for p in self.projectiles if p.active][:300]
                 
@@ -2195,11 +2244,14 @@ class VampireBall(MiniGame):
             
         self.aura_effects = [a for a in self.aura_effects if a.active][:60]
                 
-        # Aggiorna nemici
-        for enemy in self.enemies[:250]:
-            enemy.update(dt, self.player_x, self.player_y, self.game_time)
-            
-        self.enemies = [e for e in self.enemies if e.alive][:250]
+        # Aggiorna nemici (un passo vettoriale su tutto lo store)
+        self.enemy_store.update(dt, self.player_x, self.player_y)
+        
+        store = self.enemy_store
+        if len(self.enemies) > self.MAX_ENEMIES or not all(e.alive for e in self.enemies):
+            self.enemies = [e for e in self.enemies if e.alive][:self.MAX_ENEMIES]
+            store.compact(self.enemies)
+        self.rebuild_enemy_grid()
             
         self.check_collisions()
         
@@ -2226,15 +2278,7 @@ class VampireBall(MiniGame):
         self.powerup_drops = [p for p in self.powerup_drops if not p.collected][:50]
                 
         # Aggiorna particelle
-        for particle in self.particles[:500]:
-            particle.vx *= 0.92
-            particle.vy += particle.gravity * dt
-            particle.x += particle.vx * dt
-            particle.y += particle.vy * dt
-            particle.rotation += particle.rotate_speed * dt
-            particle.life -= dt
-            
-        self.particles = [p for p in self.particles if p.life > 0][:500]
+        self.particles.update(dt)
                 
         # Aggiorna numeri danno
         for dmg_num in self.damage_numbers[:60]:
@@ -2461,7 +2505,20 @@ class VampireBall(MiniGame):
             enemy.hp = enemy.max_hp
             enemy.damage = int(enemy.damage * 1.1)
         
+        self.add_enemy(enemy)
+
+    def add_enemy(self, enemy: Enemy):
+        self.enemy_store.adopt(enemy)
         self.enemies.append(enemy)
+        self.enemy_grid.insert(enemy, enemy.x, enemy.y, enemy.size)
+
+    def rebuild_enemy_grid(self):
+        """I nemici si muovono solo in EnemyStore.update: la griglia resta valida fino al frame dopo"""
+        self.enemy_grid.clear()
+        count = self.enemy_store.count
+        positions = zip(self.enemy_store.x[:count].tolist(), self.enemy_store.y[:count].tolist())
+        for enemy, (x, y) in zip(self.enemies, positions):
+            self.enemy_grid.insert(enemy, x, y, enemy.size)
 
     def spawn_boss(self):
         """Sistema boss evoluto con pattern di Vampire Survivors"""
@@ -2583,7 +2640,7 @@ class VampireBall(MiniGame):
         # Spawn minions del boss
         self._spawn_boss_minions(boss.x, boss.y, boss_data['wave'])
         
-        self.enemies.append(boss)
+        self.add_enemy(boss)
         
         # Effetto sonoro
         if self.sound:
@@ -2634,7 +2691,7 @@ class VampireBall(MiniGame):
                 minion.hp = minion.max_hp
                 minion.damage = int(minion.damage * 1.2)
             
-            self.enemies.append(minion)
+            self.add_enemy(minion)
 
 
 
@@ -2672,7 +2729,7 @@ class VampireBall(MiniGame):
                                             current_damage, garlic_weapon.color, 0.3))
         
         # Applica danni ai nemici
-        for enemy in self.enemies:
+        for enemy in self.enemy_grid.query(self.player_x, self.player_y, current_radius):
             if not enemy.alive:
                 continue
                 
@@ -2704,7 +2761,7 @@ class VampireBall(MiniGame):
         self.aura_effects.append(AuraEffect(self.player_x, self.player_y, mega_radius, 
                                           mega_damage, (255, 200, 100), 0.2))
         
-        for enemy in self.enemies:
+        for enemy in self.enemy_grid.query(self.player_x, self.player_y, mega_radius):
             if not enemy.alive:
                 continue
                 
@@ -2726,7 +2783,7 @@ class VampireBall(MiniGame):
                 strike_x = self.player_x + math.cos(angle) * distance
                 strike_y = self.player_y + math.sin(angle) * distance
                 
-                for enemy in self.enemies:
+                for enemy in self.enemy_grid.query(strike_x, strike_y, 100):
                     if not enemy.alive:
                         continue
                         
@@ -2830,7 +2887,7 @@ class VampireBall(MiniGame):
         self.aura_effects.append(AuraEffect(self.player_x, self.player_y, holy_radius, 
                                           holy_damage, (100, 220, 255), 0.5, heal=True))
         
-        for enemy in self.enemies:
+        for enemy in self.enemy_grid.query(self.player_x, self.player_y, holy_radius):
             if not enemy.alive:
                 continue
                 
@@ -3046,7 +3103,7 @@ class VampireBall(MiniGame):
             if not projectile.active:
                 continue
                 
-            for enemy in self.enemies:
+            for enemy in self.enemy_grid.query(projectile.x, projectile.y, projectile.size):
                 if not enemy.alive:
                     continue
                     
@@ -3096,14 +3153,8 @@ class VampireBall(MiniGame):
                             projectile.chain_count -= 1
                             projectile.hits = 0
                             # Trova nuovo bersaglio
-                            new_target = None
-                            min_dist = float('inf')
-                            for other in self.enemies:
-                                if other.alive and other != enemy:
-                                    dist = (other.x - enemy.x)**2 + (other.y - enemy.y)**2
-                                    if dist < min_dist and dist < 300*300:
-                                        min_dist = dist
-                                        new_target = other
+                            new_target = self.enemy_grid.nearest(
+                                enemy.x, enemy.y, 300, lambda other: other.alive and other != enemy)
                             if new_target:
                                 dx = new_target.x - projectile.x
                                 dy = new_target.y - projectile.y
@@ -3118,14 +3169,8 @@ class VampireBall(MiniGame):
                             projectile.bounce_count -= 1
                             projectile.hits = 0
                             # Trova nuovo bersaglio
-                            new_target = None
-                            min_dist = float('inf')
-                            for other in self.enemies:
-                                if other.alive and other != enemy:
-                                    dist = (other.x - projectile.x)**2 + (other.y - projectile.y)**2
-                                    if dist < min_dist and dist < 400*400:
-                                        min_dist = dist
-                                        new_target = other
+                            new_target = self.enemy_grid.nearest(
+                                projectile.x, projectile.y, 400, lambda other: other.alive and other != enemy)
                             if new_target:
                                 dx = new_target.x - projectile.x
                                 dy = new_target.y - projectile.y
@@ -3144,7 +3189,7 @@ class VampireBall(MiniGame):
             if not aura.active:
                 continue
                 
-            for enemy in self.enemies:
+            for enemy in self.enemy_grid.query(aura.x, aura.y, aura.radius):
                 if not enemy.alive:
                     continue
                     
@@ -3166,7 +3211,7 @@ class VampireBall(MiniGame):
                         
         # Collisione giocatore-nemici
         if self.invulnerable_time <= 0:
-            for enemy in self.enemies:
+            for enemy in self.enemy_grid.query(self.player_x, self.player_y, 30):
                 if not enemy.alive:
                     continue
                     
@@ -3588,106 +3633,58 @@ class VampireBall(MiniGame):
             self.sound.create_target_hit().play()
             
     def find_closest_enemy(self) -> Optional[Enemy]:
-        closest = None
-        min_dist = float('inf')
-        for enemy in self.enemies:
-            if enemy.alive:
-                dx = enemy.x - self.player_x
-                dy = enemy.y - self.player_y
-                dist = dx*dx + dy*dy
-                if dist < min_dist:
-                    min_dist = dist
-                    closest = enemy
-        return closest
+        return self.enemy_grid.nearest(self.player_x, self.player_y,
+                                       accept=lambda enemy: enemy.alive)
             
     def create_hit_particles(self, x: float, y: float, color: Tuple[int, int, int], is_crit: bool):
-        count = 15 if is_crit else 8
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(200, 350) if is_crit else random.uniform(100, 200)
-            self.particles.append(
-                Particle(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
-                        0.8 if is_crit else 0.5, 0.8 if is_crit else 0.5,
-                        color, random.uniform(5, 10) if is_crit else random.uniform(3, 7),
-                        gravity=80, trail=True)
-            )
+        if is_crit:
+            self.particles.emit_burst(x, y, 15, speed=(200, 350), life=0.8, size=(5, 10),
+                                      color=color, gravity=80)
+        else:
+            self.particles.emit_burst(x, y, 8, speed=(100, 200), life=0.5, size=(3, 7),
+                                      color=color, gravity=80)
             
     def create_heal_particles(self, x: float, y: float, count: int):
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(80, 150)
-            self.particles.append(
-                Particle(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
-                        1.0, 1.0, (100, 255, 100), random.uniform(4, 8),
-                        gravity=-50, trail=True, fade_out=True, glow=True)
-            )
+        self.particles.emit_burst(x, y, count, speed=(80, 150), life=1.0, size=(4, 8),
+                                  color=(100, 255, 100), gravity=-50, glow=True)
             
     def create_shield_hit_particles(self, x: float, y: float):
-        for _ in range(12):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(150, 250)
-            self.particles.append(
-                Particle(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
-                        0.7, 0.7, (100, 180, 255), random.uniform(4, 7),
-                        gravity=0, trail=True, fade_out=True, glow=True)
-            )
+        self.particles.emit_burst(x, y, 12, speed=(150, 250), life=0.7, size=(4, 7),
+                                  color=(100, 180, 255), glow=True)
             
     def create_death_particles(self, x: float, y: float, color: Tuple[int, int, int], is_boss: bool):
-        count = 50 if is_boss else 25
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(250, 500) if is_boss else random.uniform(120, 300)
-            size = random.uniform(8, 15) if is_boss else random.uniform(4, 9)
-            self.particles.append(
-                Particle(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
-                        2.5 if is_boss else 1.5, 2.5 if is_boss else 1.5,
-                        color, size, gravity=150, trail=True, fade_out=True)
-            )
+        if is_boss:
+            self.particles.emit_burst(x, y, 50, speed=(250, 500), life=2.5, size=(8, 15),
+                                      color=color, gravity=150)
+        else:
+            self.particles.emit_burst(x, y, 25, speed=(120, 300), life=1.5, size=(4, 9),
+                                      color=color, gravity=150)
             
     def create_combo_effect(self):
+        color = (255, 255, 100) if self.combo < 25 else (255, 150, 50) if self.combo < 50 else (255, 50, 50)
         for i in range(20):
             angle = (i / 20) * math.pi * 2
-            speed = 300
-            color = (255, 255, 100) if self.combo < 25 else (255, 150, 50) if self.combo < 50 else (255, 50, 50)
-            self.particles.append(
-                Particle(self.player_x, self.player_y,
-                        math.cos(angle) * speed, math.sin(angle) * speed,
-                        1.5, 1.5, color, 8, gravity=0, trail=True, glow=True)
-            )
+            self.particles.emit(self.player_x, self.player_y,
+                                math.cos(angle) * 300, math.sin(angle) * 300,
+                                1.5, color, 8, glow=True)
             
     def create_lightning_particles(self, x: float, y: float):
         for i in range(8):
             offset_x = random.uniform(-30, 30)
             offset_y = random.uniform(-30, 30)
-            for j in range(10):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(150, 300)
-                self.particles.append(
-                    Particle(x + offset_x, y + offset_y, 
-                            math.cos(angle) * speed, math.sin(angle) * speed,
-                            0.6, 0.6, (140, 200, 255), random.uniform(4, 8),
-                            gravity=0, trail=True, glow=True)
-                )
+            self.particles.emit_burst(x + offset_x, y + offset_y, 10, speed=(150, 300), life=0.6,
+                                      size=(4, 8), color=(140, 200, 255), glow=True)
                 
     def create_fire_explosion(self, x: float, y: float):
-        for _ in range(40):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(200, 400)
-            self.particles.append(
-                Particle(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
-                        1.2, 1.2, (255, 120, 60), random.uniform(6, 12),
-                        gravity=100, trail=True, fade_out=True)
-            )
+        self.particles.emit_burst(x, y, 40, speed=(200, 400), life=1.2, size=(6, 12),
+                                  color=(255, 120, 60), gravity=100)
             
     def create_revival_effect(self):
         for i in range(60):
             angle = (i / 60) * math.pi * 2
-            speed = 300
-            self.particles.append(
-                Particle(self.player_x, self.player_y,
-                        math.cos(angle) * speed, math.sin(angle) * speed,
-                        3.0, 3.0, (255, 100, 255), 10, gravity=0, trail=True, glow=True)
-            )
+            self.particles.emit(self.player_x, self.player_y,
+                                math.cos(angle) * 300, math.sin(angle) * 300,
+                                3.0, (255, 100, 255), 10, glow=True)
             
     def draw(self, surface: pygame.Surface):
         if self.game_state == GameState.CHARACTER_SELECT:
@@ -3736,9 +3733,7 @@ class VampireBall(MiniGame):
                 size = random.randint(2, 5)
                 alpha = int(abs(math.sin(self.animation_time * 3)) * 100)
                 color = self.characters_data[self.selected_character_index].color
-                particle_surf = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surf, (*color, alpha), (size, size), size)
-                surface.blit(particle_surf, (particle_x - size, particle_y - size))
+                glow_cache.draw(surface, (particle_x, particle_y), size, color, alpha)
         
         title = "VAMPIRE SURVIVORS CLONE"
         self.draw_text_outlined(surface, title, 640, 70, 64, (220, 100, 100), (40, 20, 20), 3)
@@ -3995,9 +3990,10 @@ class VampireBall(MiniGame):
                     wind_y = char_y + random.randint(-30, 30)
                     wind_len = random.randint(10, 30)
                     # Correzione: pygame.draw.line non supporta alpha nella tupla colore
-                    wind_surf = pygame.Surface((abs(wind_len), abs(wind_len)), pygame.SRCALPHA)
-                    pygame.draw.line(wind_surf, (200, 200, 255, 100), 
-                                (0, 0), (wind_len, wind_len//2), 1)
+                    wind_surf = glow_cache.sprite(
+                        ("wind", wind_len), (wind_len, wind_len),
+                        lambda sprite: pygame.draw.line(sprite, (200, 200, 255, 100),
+                                                        (0, 0), (wind_len, wind_len//2), 1))
                     surface.blit(wind_surf, (wind_x, wind_y))
                     
             elif char_index == 4:  # NECROMANCER - Necromante Oscuro
@@ -4156,109 +4152,57 @@ class VampireBall(MiniGame):
 
 
     def draw_background(self, surface: pygame.Surface):
-        # Sfondo deep space molto scuro
-        surface.fill((5, 8, 15))  # Blu notte quasi nero
+        # Sfondo deep space + nebulose statiche e discrete (tile pre-renderizzato)
+        self.blit_wrapped(surface, self.background_tile, self.camera_x * 0.05, self.camera_y * 0.05)
         
         # Stelle più statiche e scure
         for i, layer in enumerate(self.parallax_layers):
+            stars = self.star_arrays[i]
             layer_speed = layer['speed'] * 0.3  # Ridotto drasticamente il movimento
             offset_x = (self.camera_x * layer_speed + layer['offset_x']) % 1280
             offset_y = (self.camera_y * layer_speed * 0.5 + layer['offset_y']) % 720
             
-            for star in layer['stars']:
-                # Twinkle minimo
-                twinkle = math.sin(self.animation_time * star['twinkle_speed'] * 0.3) * 0.2 + 0.8
-                
-                # Stelle molto più scure
-                if i == 0:  # Stelle lontane - quasi invisibili
-                    brightness = int(80 * star['brightness'] * twinkle)
-                elif i == 1:  # Stelle medie
-                    brightness = int(120 * star['brightness'] * twinkle * 0.8)
-                else:  # Stelle vicine (poche)
-                    brightness = int(150 * star['brightness'] * twinkle * 0.7)
-                
-                size_variation = star['size'] * (0.9 + 0.1 * twinkle)
-                
-                # Posizione statica con minimo parallasse
-                star_x = (star['x'] + offset_x) % 1280
-                star_y = (star['y'] + offset_y) % 720
-                
-                # Colori scuri e freddi
-                if i == 0:
-                    color = (brightness//2, brightness//2, brightness)  # Blu scuro
-                elif i == 1:
-                    color = (brightness, brightness//3, brightness//3)  # Rosso bordeaux
-                else:
-                    color = (brightness//3, brightness//2, brightness//3)  # Verde scuro
-                
-                # Disegna solo stelle principali, niente bagliori
-                pygame.draw.circle(surface, color, 
-                                (int(star_x), int(star_y)), int(size_variation))
-        
-        # Nebulose statiche e discrete
-        for i in range(2):  # Solo 2 nebulose
-            nebula_x = (self.camera_x * 0.05 + i * 700) % 1280
-            nebula_y = (self.camera_y * 0.05 + i * 450) % 720
+            # Twinkle minimo
+            twinkle = np.sin(self.animation_time * stars['twinkle_speed'] * 0.3) * 0.2 + 0.8
             
-            nebula_size = 180 + i * 120
+            # Stelle molto più scure
+            if i == 0:  # Stelle lontane - quasi invisibili
+                brightness = (80 * stars['brightness'] * twinkle).astype(np.int64)
+            elif i == 1:  # Stelle medie
+                brightness = (120 * stars['brightness'] * twinkle * 0.8).astype(np.int64)
+            else:  # Stelle vicine (poche)
+                brightness = (150 * stars['brightness'] * twinkle * 0.7).astype(np.int64)
+            
+            # Raggio int(size): 0 non disegna nulla, 1 è un blocco 2x2 (come draw.circle)
+            visible = stars['size'] * (0.9 + 0.1 * twinkle) >= 1
+            if not visible.any():
+                continue
+            brightness = brightness[visible]
             
-            # Colori molto scuri e trasparenti
-            nebula_colors = [
-                [(30, 20, 50, 15), (40, 25, 60, 10)],  # Viola scuro
-                [(20, 30, 50, 12), (25, 35, 55, 8)]    # Blu scuro
-            ][i]
+            # Posizione statica con minimo parallasse
+            star_x = ((stars['x'][visible] + offset_x) % 1280).astype(np.int64) - 1
+            star_y = ((stars['y'][visible] + offset_y) % 720).astype(np.int64) - 1
             
-            # Disegna nebulose semplici
-            for layer_idx, color_data in enumerate(nebula_colors):
-                layer_size = nebula_size * (0.8 + layer_idx * 0.2)
-                
-                nebula_surf = pygame.Surface((int(layer_size*2), int(layer_size*2)), pygame.SRCALPHA)
-                pygame.draw.circle(nebula_surf, color_data, 
-                                (int(layer_size), int(layer_size)), int(layer_size))
-                
-                surface.blit(nebula_surf, 
-                        (int(nebula_x - layer_size), int(nebula_y - layer_size)))
+            # Colori scuri e freddi
+            if i == 0:
+                colors = np.column_stack((brightness // 2, brightness // 2, brightness))  # Blu scuro
+            elif i == 1:
+                colors = np.column_stack((brightness, brightness // 3, brightness // 3))  # Rosso bordeaux
+            else:
+                colors = np.column_stack((brightness // 3, brightness // 2, brightness // 3))  # Verde scuro
+            
+            fill = surface.fill
+            for color, x, y in zip(colors.tolist(), star_x.tolist(), star_y.tolist()):
+                fill(color, (x, y, 2, 2))
         
-        # Griglia molto sottile e discreta
+        # Griglia molto sottile e discreta: strisce tratteggiate pre-renderizzate
         grid_size = 160  # Griglia più spaziosa
-        grid_alpha = 12  # Quasi trasparente
-        
+        vertical, horizontal = self.grid_strips
         start_x = int((self.camera_x % grid_size) - grid_size)
         start_y = int((self.camera_y % grid_size) - grid_size)
-        
-        # Linee verticali - molto sottili
-        for x in range(start_x, 1280 + grid_size, grid_size):
-            alpha = grid_alpha
-            color = (30, 35, 50, alpha)  # Blu-acciaio scuro
-            
-            # Linee continue ma sottilissime
-            for y in range(0, 720, 2):  # Linee tratteggiate molto rade
-                if y % 20 < 10:  # Solo metà della linea è disegnata
-                    pygame.draw.line(surface, color, (x, y), (x, y+1), 1)
-        
-        # Linee orizzontali - molto sottili
-        for y in range(start_y, 720 + grid_size, grid_size):
-            alpha = grid_alpha
-            color = (30, 35, 50, alpha)
-            
-            # Linee continue ma sottilissime
-            for x in range(0, 1280, 2):  # Linee tratteggiate molto rade
-                if x % 20 < 10:  # Solo metà della linea è disegnata
-                    pygame.draw.line(surface, color, (x, y), (x+1, y), 1)
-        
-        # Pochissime particelle di polvere - quasi invisibili
-        dust_alpha = 8
-        for i in range(15):  # Solo 15 particelle
-            dust_x = (self.camera_x * 0.2 + i * 185) % 1280
-            dust_y = (self.camera_y * 0.2 + i * 143) % 720
-            
-            size = 0.5 + math.sin(i * 0.5) * 0.3
-            alpha = int(dust_alpha * (0.3 + 0.7 * math.sin(i * 3)))
-            
-            if alpha > 3:  # Solo se abbastanza visibile
-                dust_color = (60, 70, 90, alpha)
-                pygame.draw.circle(surface, dust_color, 
-                                (int(dust_x), int(dust_y)), int(size))
+        surface.blits([(vertical, (x, 0)) for x in range(start_x, 1280 + grid_size, grid_size)] +
+                      [(horizontal, (0, y)) for y in range(start_y, 720 + grid_size, grid_size)],
+                      doreturn=False)
         
         # Aggiunta di alcune "stelle cadenti" molto rare e discrete
         if random.random() < 0.001:  # Molto raro
@@ -4277,77 +4221,56 @@ class VampireBall(MiniGame):
 
          
                     
+    @staticmethod
+    def blit_wrapped(surface: pygame.Surface, tile: pygame.Surface, offset_x: float, offset_y: float):
+        """Tile 1280x720 traslato e avvolto sui bordi (fino a 4 blit)"""
+        offset_x = int(offset_x) % 1280
+        offset_y = int(offset_y) % 720
+        surface.blits([(tile, (offset_x, offset_y)), (tile, (offset_x - 1280, offset_y)),
+                       (tile, (offset_x, offset_y - 720)), (tile, (offset_x - 1280, offset_y - 720))],
+                      doreturn=False)
+        
     def draw_gameplay(self, surface: pygame.Surface):
         self.draw_background(surface)
         
         shake_x = random.uniform(-self.camera_shake * 12, self.camera_shake * 12) if self.camera_shake > 0 else 0
         shake_y = random.uniform(-self.camera_shake * 12, self.camera_shake * 12) if self.camera_shake > 0 else 0
+        camera = self.camera
+        camera.begin(self.camera_x, self.camera_y, shake_x, shake_y)
         
         # Aura effects
-        for aura in self.aura_effects:
-            aura.draw(surface, self.camera_x, self.camera_y, shake_x, shake_y)
+        for aura in camera.visible("auras", self.aura_effects, lambda aura: aura.radius * 2):
+            aura.draw(surface, camera)
                              
         # Particelle
-        for particle in self.particles:
-            alpha = particle.life / particle.max_life
-            if particle.fade_out:
-                alpha *= alpha
-                
-            size = particle.size * alpha
-            if size <= 0:
-                continue
-                
-            color = tuple(min(255, max(0, int(c * alpha))) for c in particle.color)
-            screen_x = particle.x - self.camera_x + shake_x
-            screen_y = particle.y - self.camera_y + shake_y
-            
-            if -100 <= screen_x <= 1380 and -100 <= screen_y <= 820:
-                if particle.glow:
-                    glow_size = size * 2.0
-                    glow_surf = pygame.Surface((int(glow_size*2), int(glow_size*2)), pygame.SRCALPHA)
-                    pygame.draw.circle(glow_surf, (*color, int(alpha * 150)), 
-                                     (int(glow_size), int(glow_size)), int(glow_size))
-                    surface.blit(glow_surf, (int(screen_x - glow_size), int(screen_y - glow_size)))
-                
-                if particle.shape == "circle":
-                    pygame.draw.circle(surface, color, (int(screen_x), int(screen_y)), int(size))
-                elif particle.shape == "star":
-                    points = []
-                    for i in range(5):
-                        angle = particle.rotation + i * math.pi * 2 / 5
-                        radius = size * (0.5 if i % 2 == 0 else 1.0)
-                        points.append((
-                            screen_x + math.cos(angle) * radius,
-                            screen_y + math.sin(angle) * radius
-                        ))
-                    if len(points) > 2:
-                        pygame.draw.polygon(surface, color, points)
+        self.particles.draw(surface, camera.offset_x, camera.offset_y, bounds=camera.bounds(100))
                              
         # Proiettili
-        for projectile in self.projectiles:
-            projectile.draw(surface, self.camera_x, self.camera_y, shake_x, shake_y)
+        for projectile in camera.visible("projectiles", self.projectiles, 100):
+            projectile.draw(surface, camera)
             
-        # Nemici
-        for enemy in self.enemies:
-            if enemy.alive:
-                enemy.draw(surface, self.camera_x, self.camera_y, shake_x, shake_y)
+        # Nemici: culling vettoriale sulle colonne dello store
+        store = self.enemy_store
+        visible = camera.visible_mask("enemies", store.x[:store.count], store.y[:store.count],
+                                      self.ENEMY_DRAW_EXTENT)
+        views = store.views
+        for slot in np.flatnonzero(visible).tolist():
+            views[slot].draw(surface, camera)
                 
         # Pickup - ordine di disegno per visibilità
-        for coin in self.coins_drops:
-            coin.draw(surface, self.camera_x, self.camera_y, shake_x, shake_y)
+        for coin in camera.visible("coins", self.coins_drops, 40):
+            coin.draw(surface, camera)
             
-        for gem in self.xp_gems:
-            gem.draw(surface, self.camera_x, self.camera_y, shake_x, shake_y)
+        for gem in camera.visible("gems", self.xp_gems, lambda gem: gem.size * 2):
+            gem.draw(surface, camera)
             
-        for powerup in self.powerup_drops:
-            powerup.draw(surface, self.camera_x, self.camera_y, shake_x, shake_y)
+        for powerup in camera.visible("powerups", self.powerup_drops, 50):
+            powerup.draw(surface, camera)
             
         # Minions
         for minion in self.minions:
-            screen_x = minion['x'] - self.camera_x + shake_x
-            screen_y = minion['y'] - self.camera_y + shake_y
-            
-            if -50 <= screen_x <= 1330 and -50 <= screen_y <= 770:
+            if camera.is_visible(minion['x'], minion['y'], 50):
+                screen_x, screen_y = camera.to_screen(minion['x'], minion['y'])
                 pygame.draw.circle(surface, minion['color'], (int(screen_x), int(screen_y)), 
                                  int(minion['size']))
                 pygame.draw.circle(surface, (255, 255, 255), (int(screen_x), int(screen_y)), 
@@ -4364,61 +4287,36 @@ class VampireBall(MiniGame):
                 pygame.draw.rect(surface, (100, 255, 100), (bar_x, bar_y, bar_width * hp_ratio, bar_height))
             
         # Giocatore
-        self.draw_player(surface, shake_x, shake_y)
+        self.draw_player(surface, camera)
         
         # Numeri danno
-        for dmg_num in self.damage_numbers:
+        for dmg_num in camera.visible("damage_numbers", self.damage_numbers, 100):
             alpha = dmg_num.life
             size = int(dmg_num.size + (1 - alpha) * 15)
-            color = tuple(min(255, max(0, int(c * alpha))) for c in dmg_num.color)
             text = f"{dmg_num.value}" + ("!" if dmg_num.is_critical else "")
-            screen_x = dmg_num.x - self.camera_x + shake_x
-            screen_y = dmg_num.y - self.camera_y + shake_y
+            screen_x, screen_y = camera.to_screen(dmg_num.x, dmg_num.y)
             
-            if -100 <= screen_x <= 1380 and -100 <= screen_y <= 820:
-                font = pygame.font.Font(None, size)
-                
-                # Ombra testo
-                shadow_surf = font.render(text, True, (30, 30, 40))
-                shadow_surf.set_alpha(int(alpha * 255))
-                shadow_rect = shadow_surf.get_rect(center=(int(screen_x)+2, int(screen_y)+2))
-                surface.blit(shadow_surf, shadow_rect)
-                
-                # Bordo testo
-                for dx in [-1, 0, 1]:
-                    for dy in [-1, 0, 1]:
-                        if dx != 0 or dy != 0:
-                            outline_surf = font.render(text, True, (60, 60, 80))
-                            outline_surf.set_alpha(int(alpha * 180))
-                            outline_rect = outline_surf.get_rect(center=(int(screen_x)+dx, int(screen_y)+dy))
-                            surface.blit(outline_surf, outline_rect)
-                
-                # Testo principale
-                text_surf = font.render(text, True, color)
-                text_rect = text_surf.get_rect(center=(int(screen_x), int(screen_y)))
-                surface.blit(text_surf, text_rect)
-                          
+            # Ombra testo
+            text_cache.draw(surface, text, size, (30, 30, 40), (screen_x + 2, screen_y + 2),
+                            alpha=alpha * 255)
+            
+            # Testo principale con bordo (composto una volta nella cache)
+            text_cache.draw(surface, text, size, dmg_num.color, (screen_x, screen_y),
+                            ((60, 60, 80), 1), alpha * 255)
+                      
         # Testo fluttuante
-        for text in self.floating_texts:
+        for text in camera.visible("texts", self.floating_texts, 100):
             alpha = min(1.0, text.life / 1.5)
-            color = tuple(min(255, max(0, int(c * alpha))) for c in text.color)
-            screen_x = text.x - self.camera_x + shake_x
-            screen_y = text.y - self.camera_y + shake_y
+            screen_x, screen_y = camera.to_screen(text.x, text.y)
             
-            if -100 <= screen_x <= 1380 and -100 <= screen_y <= 820:
-                font = pygame.font.Font(None, text.size)
-                
-                # Ombra testo
-                shadow_surf = font.render(text.text, True, (40, 40, 60))
-                shadow_surf.set_alpha(int(alpha * 180))
-                shadow_rect = shadow_surf.get_rect(center=(int(screen_x)+3, int(screen_y)+3))
-                surface.blit(shadow_surf, shadow_rect)
-                
-                # Testo principale
-                text_surf = font.render(text.text, True, color)
-                text_rect = text_surf.get_rect(center=(int(screen_x), int(screen_y)))
-                surface.blit(text_surf, text_rect)
-                          
+            # Ombra testo
+            text_cache.draw(surface, text.text, text.size, (40, 40, 60), (screen_x + 3, screen_y + 3),
+                            alpha=alpha * 180)
+            
+            # Testo principale
+            text_cache.draw(surface, text.text, text.size, text.color, (screen_x, screen_y),
+                            alpha=alpha * 255)
+                      
         # HUD
         self.draw_hud(surface)
         
@@ -4444,9 +4342,8 @@ class VampireBall(MiniGame):
 
 
 
-    def draw_player(self, surface: pygame.Surface, shake_x: float, shake_y: float):
-        screen_x = self.player_x - self.camera_x + shake_x
-        screen_y = self.player_y - self.camera_y + shake_y
+    def draw_player(self, surface: pygame.Surface, camera: 'Camera'):
+        screen_x, screen_y = camera.to_screen(self.player_x, self.player_y)
         
         if self.invulnerable_time > 0 and int(self.invulnerable_time * 25) % 2 == 0:
             return
@@ -4461,11 +4358,7 @@ class VampireBall(MiniGame):
         shadow_size = max(5, 25 + move_intensity * 5)
         shadow_alpha = min(255, 150 + int(move_intensity * 50))
         if shadow_size > 0 and shadow_alpha > 0:
-            shadow_surf = pygame.Surface((int(shadow_size*2), int(shadow_size*2)), pygame.SRCALPHA)
-            # Correggi: usa solo 3 componenti per draw.circle, gestisci alpha tramite Surface
-            pygame.draw.circle(shadow_surf, (40, 40, 60), 
-                            (int(shadow_size), int(shadow_size)), int(shadow_size))
-            shadow_surf.set_alpha(shadow_alpha)
+            shadow_surf = glow_cache.circle(shadow_size, (40, 40, 60), shadow_alpha)
             surface.blit(shadow_surf, (int(screen_x - shadow_size), int(screen_y + 8)))
         
         # Effetto movimento (scia) - solo quando si muove velocemente
@@ -4478,12 +4371,7 @@ class VampireBall(MiniGame):
                     trail_x = screen_x - self.player_vx * 0.02 * i
                     trail_y = screen_y - self.player_vy * 0.02 * i
                     if trail_size > 0:
-                        trail_surf = pygame.Surface((max(2, trail_size*2), max(2, trail_size*2)), pygame.SRCALPHA)
-                        # Correggi: usa solo 3 componenti per draw.circle
-                        pygame.draw.circle(trail_surf, char.color[:3], 
-                                        (trail_size, trail_size), trail_size)
-                        trail_surf.set_alpha(trail_alpha)
-                        surface.blit(trail_surf, (int(trail_x - trail_size), int(trail_y - trail_size)))
+                        glow_cache.draw(surface, (trail_x, trail_y), trail_size, char.color, trail_alpha)
         
         # Calcola l'angolo di movimento per orientare alcune animazioni
         move_angle = 0
@@ -4807,23 +4695,9 @@ class VampireBall(MiniGame):
             shield_pulse = math.sin(self.animation_time * 8) * 0.2 + 0.8
             
             if shield_size > 0 and shield_alpha > 0:
-                shield_surf = pygame.Surface((max(2, int(shield_size*2)), max(2, int(shield_size*2))), pygame.SRCALPHA)
-                
-                for i in range(3):
-                    layer_size = shield_size * (1 - i * 0.1)
-                    layer_alpha = min(255, int(shield_alpha * (1 - i * 0.3)))
-                    if layer_size > 0 and layer_alpha > 0:
-                        # Correggi: usa solo 3 componenti per draw.circle
-                        color_surf = pygame.Surface((max(2, int(layer_size*2*shield_pulse)), 
-                                                max(2, int(layer_size*2*shield_pulse))), pygame.SRCALPHA)
-                        pygame.draw.circle(color_surf, (100, 180, 255), 
-                                        (int(layer_size*shield_pulse), int(layer_size*shield_pulse)), 
-                                        int(layer_size * shield_pulse), 2)
-                        color_surf.set_alpha(layer_alpha)
-                        shield_surf.blit(color_surf, (int(shield_size - layer_size*shield_pulse), 
-                                                    int(shield_size - layer_size*shield_pulse)))
-                
-                surface.blit(shield_surf, (int(screen_x - shield_size), int(screen_y - shield_size)))
+                # 3 anelli concentrici (raggio e alpha decrescenti) in un solo sprite
+                glow_cache.draw(surface, (screen_x, screen_y), shield_size * shield_pulse,
+                                (100, 180, 255), shield_alpha, layers=self.SHIELD_LAYERS)
         
         # Indicatore abilità speciale attiva
         if self.special_active:
@@ -4833,28 +4707,14 @@ class VampireBall(MiniGame):
             special_color = char.color[:3]  # Prendi solo RGB
             
             if radius > 0:
-                special_surf = pygame.Surface((max(2, radius*2), max(2, radius*2)), pygame.SRCALPHA)
-                
                 # Aura esterna
-                for i in range(3):
-                    ring_size = radius * (1 - i * 0.2)
-                    ring_alpha = min(255, int(100 * (1 - i * 0.3)))
-                    if ring_size > 0 and ring_alpha > 0:
-                        ring_surf = pygame.Surface((max(2, int(ring_size*2)), max(2, int(ring_size*2))), pygame.SRCALPHA)
-                        pygame.draw.circle(ring_surf, special_color, 
-                                        (int(ring_size), int(ring_size)), int(ring_size))
-                        ring_surf.set_alpha(ring_alpha)
-                        special_surf.blit(ring_surf, (int(radius - ring_size), int(radius - ring_size)))
+                glow_cache.draw(surface, (screen_x, screen_y), radius, special_color, 100,
+                                layers=self.SPECIAL_LAYERS)
                 
                 # Bordo pulsante
                 border_width = max(2, int(radius * 0.1))
-                border_surf = pygame.Surface((max(2, radius*2), max(2, radius*2)), pygame.SRCALPHA)
-                pygame.draw.circle(border_surf, (255, 255, 200), 
-                                (radius, radius), radius, border_width)
-                border_surf.set_alpha(200)
-                special_surf.blit(border_surf, (0, 0))
-                
-                surface.blit(special_surf, (int(screen_x - radius), int(screen_y - radius)))
+                glow_cache.draw(surface, (screen_x, screen_y), radius, (255, 255, 200), 200,
+                                width=border_width)
             
             # Particelle speciali rotanti
             particle_count = 8
@@ -5264,10 +5124,8 @@ class VampireBall(MiniGame):
         
     def draw_text(self, surface: pygame.Surface, text: str, x: int, y: int,
                   size: int, color: Tuple[int, int, int], centered: bool = True):
-        color = tuple(min(255, max(0, int(c))) for c in color)
         try:
-            font = pygame.font.Font(None, size)
-            text_surface = font.render(text, True, color)
+            text_surface = text_cache.render(text, size, color)
             if centered:
                 text_rect = text_surface.get_rect(center=(x, y))
             else:
@@ -5279,23 +5137,8 @@ class VampireBall(MiniGame):
     def draw_text_outlined(self, surface: pygame.Surface, text: str, x: int, y: int,
                           size: int, color: Tuple[int, int, int], outline_color: Tuple[int, int, int],
                           outline_width: int = 2):
-        color = tuple(min(255, max(0, int(c))) for c in color)
-        outline_color = tuple(min(255, max(0, int(c))) for c in outline_color)
-        
         try:
-            font = pygame.font.Font(None, size)
-            
-            # Outline
-            for offset_x in range(-outline_width, outline_width + 1):
-                for offset_y in range(-outline_width, outline_width + 1):
-                    if offset_x != 0 or offset_y != 0:
-                        outline_surface = font.render(text, True, outline_color)
-                        outline_rect = outline_surface.get_rect(center=(x + offset_x, y + offset_y))
-                        surface.blit(outline_surface, outline_rect)
-                        
-            # Testo principale
-            text_surface = font.render(text, True, color)
-            text_rect = text_surface.get_rect(center=(x, y))
-            surface.blit(text_surface, text_rect)
+            # Outline + testo principale composti una volta nella cache condivisa
+            text_cache.draw(surface, text, size, color, (x, y), (outline_color, outline_width))
         except:
             pass
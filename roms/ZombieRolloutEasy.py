@@ -2,8 +2,222 @@ import pygame
 import math
 import random
 from collections import deque
+import numpy as np
+
+
+# ========== RECORD DELLE ENTITÀ ==========
+# Classi con __slots__ al posto dei dict: attributi a offset fisso, niente
+# lookup per stringa nei loop caldi e meno memoria per istanza.
+
+class Zombie:
+    __slots__ = ('x', 'y', 'vx', 'vy', 'speed', 'health', 'max_health', 'damage',
+                 'radius', 'color', 'type', 'animation_timer', 'explosion_radius', 'alive')
+
+    def __init__(self, x, y, zombie_type, speed, health, damage, radius, color, explosion_radius=0):
+        self.x = x
+        self.y = y
+        self.vx = 0
+        self.vy = 0
+        self.speed = speed
+        self.health = health
+        self.max_health = health
+        self.damage = damage
+        self.radius = radius
+        self.color = color
+        self.type = zombie_type
+        self.animation_timer = 0
+        self.explosion_radius = explosion_radius
+        self.alive = True
+
+
+class Boss(Zombie):
+    __slots__ = ('charge_timer', 'charge_cooldown', 'is_charging', 'charge_target_x',
+                 'charge_target_y', 'spawn_timer', 'spawn_cooldown')
+
+    def __init__(self, x, y, speed, health, damage):
+        super().__init__(x, y, 'boss', speed, health, damage, 45, (200, 50, 50))
+        self.charge_timer = 0
+        self.charge_cooldown = 2.5
+        self.is_charging = False
+        self.charge_target_x = 0
+        self.charge_target_y = 0
+        self.spawn_timer = 0
+        self.spawn_cooldown = 4.0
+
+
+class Bullet:
+    __slots__ = ('x', 'y', 'vx', 'vy', 'lifetime', 'damage', 'size', 'is_crit', 'pierce_count')
+
+    def __init__(self, x, y, vx, vy, damage, size, is_crit, pierce_count):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.lifetime = 3.0
+        self.damage = damage
+        self.size = size
+        self.is_crit = is_crit
+        self.pierce_count = pierce_count
+
+
+class XPGem:
+    __slots__ = ('x', 'y', 'value', 'lifetime', 'radius', 'animation_timer', 'vx', 'vy')
+
+    def __init__(self, x, y, value, vx, vy):
+        self.x = x
+        self.y = y
+        self.value = value
+        self.lifetime = 30.0
+        self.radius = 8
+        self.animation_timer = 0
+        self.vx = vx
+        self.vy = vy
+
+
+class PowerUp:
+    __slots__ = ('x', 'y', 'type', 'lifetime', 'radius', 'animation_timer')
+
+    def __init__(self, x, y, powerup_type, lifetime=10.0, radius=15):
+        self.x = x
+        self.y = y
+        self.type = powerup_type
+        self.lifetime = lifetime
+        self.radius = radius
+        self.animation_timer = 0
+
+
+class DamageNumber:
+    __slots__ = ('x', 'y', 'damage', 'lifetime', 'vy')
+
+    def __init__(self, x, y, damage):
+        self.x = x
+        self.y = y
+        self.damage = damage
+        self.lifetime = 0.8
+        self.vy = -60
+
+
+class Shockwave:
+    __slots__ = ('x', 'y', 'radius', 'max_radius', 'lifetime', 'damage', 'hit')
+
+    def __init__(self, x, y, max_radius, damage):
+        self.x = x
+        self.y = y
+        self.radius = 0
+        self.max_radius = max_radius
+        self.lifetime = 0.8
+        self.damage = damage
+        self.hit = set()  # Zombie già colpiti da quest'onda
+
+
+# ========== REGIA DELLE ONDATE ==========
+
+class SpawnDirector:
+    """Programma di spawn di un'ondata precalcolato in array NumPy quando
+    l'ondata parte (istanti, punti sul bordo, tipi): a ogni frame un
+    searchsorted sull'orologio dà il lotto di spawn scaduti, senza tiri di
+    dado per singolo zombie. Le orde arrivano a branchi dallo stesso lato."""
+
+    KINDS = ('normal', 'fast', 'tank', 'exploder')
+    WEIGHTS = (0.45, 0.25, 0.18, 0.12)
+    HORDE_WEIGHTS = (0.6, 0.35, 0.05, 0.0)
+    EDGE_MARGIN = 20
+    CULL_MARGIN = 50         # update_zombies elimina chi è più fuori di così
+    HORDE_DEPTH = 25         # Profondità del branco oltre EDGE_MARGIN (resta entro CULL_MARGIN)
+    HORDE_PACK = 8           # Zombie per branco
+    HORDE_SPREAD = 0.04      # Dispersione del branco lungo il lato (frazione)
+    MAX_PER_FRAME = 16       # Tetto per frame: niente picchi anche con orde enormi
+
+    def __init__(self, left, top, right, bottom):
+        self.bounds = (left, top, right, bottom)
+        self.plan(0, 1.0)
+
+    def plan(self, count, interval, weights=WEIGHTS):
+        """Un zombie ogni interval secondi da un lato a caso"""
+        self._reset(np.arange(1, count + 1) * interval,
+                    np.random.choice(len(self.KINDS), count, p=weights),
+                    *self.edge_points(count))
+
+    def plan_horde(self, count, pack_interval, weights=HORDE_WEIGHTS):
+        """Branchi di HORDE_PACK zombie, uno ogni pack_interval secondi,
+        raccolti attorno a un punto del bordo"""
+        packs = -(-count // self.HORDE_PACK)
+        pack = np.repeat(np.arange(packs), self.HORDE_PACK)[:count]
+        side = np.random.randint(0, 4, packs)[pack]
+        along = np.random.random(packs)[pack] + np.random.normal(0, self.HORDE_SPREAD, count)
+        margin = self.EDGE_MARGIN + np.random.uniform(0, self.HORDE_DEPTH, count)
+        self._reset((pack + 1) * pack_interval,
+                    np.random.choice(len(self.KINDS), count, p=weights),
+                    *self.edge_points(count, side, np.clip(along, 0, 1), margin))
+
+    def _reset(self, times, kinds, xs, ys):
+        self.times = times
+        self.kinds = kinds.astype(np.int8)
+        self.xs = xs
+        self.ys = ys
+        self.count = len(times)
+        self.cursor = 0
+        self.clock = 0.0
+
+    def edge_points(self, count, side=None, along=None, margin=EDGE_MARGIN):
+        """count punti appena fuori dal lato side (0 alto, 1 destra, 2 basso,
+        3 sinistra) in posizione along (0..1); a caso se non indicati"""
+        left, top, right, bottom = self.bounds
+        if side is None:
+            side = np.random.randint(0, 4, count)
+        if along is None:
+            along = np.random.random(count)
+        xs = np.where(side == 1, right + margin,
+                      np.where(side == 3, left - margin, left + along * (right - left)))
+        ys = np.where(side == 0, top - margin,
+                      np.where(side == 2, bottom + margin, top + along * (bottom - top)))
+        return xs, ys
+
+    @property
+    def finished(self):
+        return self.cursor >= self.count
+
+    def drain(self, dt, room):
+        """Avanza l'orologio e restituisce (tipi, xs, ys) degli spawn scaduti,
+        al più room e MAX_PER_FRAME. Senza posto a schermo il programma resta
+        fermo, come faceva il vecchio timer."""
+        if self.cursor >= self.count:
+            return None
+        if room <= 0:
+            self.clock = min(self.clock + dt, self.times[self.cursor])
+            return None
+        self.clock += dt
+        due = int(np.searchsorted(self.times, self.clock, 'right'))
+        start = self.cursor
+        stop = min(due, start + room, start + self.MAX_PER_FRAME)
+        if stop <= start:
+            return None
+        self.cursor = stop
+        return (self.kinds[start:stop].tolist(), self.xs[start:stop].tolist(),
+                self.ys[start:stop].tolist())
+
+    def burst(self, count, kinds=(0, 1)):
+        """Lotto fuori programma (minion del boss): tipi scelti fra kinds"""
+        xs, ys = self.edge_points(count)
+        return np.random.choice(kinds, count).tolist(), xs.tolist(), ys.tolist()
+
 
 class ZombieRolloutEasy(MiniGame):
+    # Sotto questa soglia il loop diretto costa meno di una query sulla griglia
+    BROADPHASE_MIN_ZOMBIES = 8
+    # Orde: dall'ondata 8, ogni 5 (8, 13, 18...), tre volte gli zombie a branchi
+    HORDE_FIRST_WAVE = 8
+    HORDE_MULTIPLIER = 3
+    HORDE_PACK_INTERVAL = 0.6
+    HORDE_MAX_ON_SCREEN = 300
+    # Decal (sangue e bruciature): alpha tolta all'intero layer al secondo,
+    # pari ai vecchi 0.3 per frame a 60 fps
+    DECAL_FADE_RATE = 18
+    DECAL_TILE_W = 64
+    DECAL_TILE_H = 48
+    BLOOD_COLOR = (100, 0, 0)
+    SCORCH_COLOR = (20, 14, 8)
+    
     def __init__(self, *args, sound=None, **kwargs):
         super().__init__("Zombie Rollout Easy", "Survive the zombie apocalypse with your armed sphere!", *args, **kwargs)
         self.sound = sound
@@ -45,8 +259,21 @@ class ZombieRolloutEasy(MiniGame):
         self.piercing_shots = 0
         
         self.zombies = []
-        self.particles = []
-        self.blood_splats = []
+        self.zombie_grid = SpatialHashGrid(64)  # Broadphase: ricostruita dopo il movimento
+        self.particles = ParticleSystem(2048, style="alpha", size_fade=False, drag=(0.96, 0.96),
+                                        sprites=glow_cache)
+        # Layer persistente in coordinate mondo: ogni macchia è timbrata una
+        # volta sola e tutto il layer sbiadisce insieme in update_decals().
+        # Diviso in tile: fade e blit toccano solo le tile con qualcosa sopra.
+        tw, th = self.DECAL_TILE_W, self.DECAL_TILE_H
+        self.decal_layer = pygame.Surface((1280, 720), pygame.SRCALPHA)
+        self.decal_fade_surface = pygame.Surface((tw, th), pygame.SRCALPHA)
+        self.decal_fade_surface.fill((0, 0, 0, 1))
+        self.decal_rects = [pygame.Rect(tx * tw, ty * th, tw, th)
+                            for ty in range(720 // th) for tx in range(1280 // tw)]
+        self.decal_tiles = [0] * len(self.decal_rects)  # Limite superiore dell'alpha per tile
+        self.decal_alpha = 0   # Massimo fra le tile: 0 = layer vuoto
+        self.decal_fade = 0.0  # Frazione di alpha accumulata e non ancora tolta
         self.damage_numbers = []
         self.powerups = []
         self.xp_gems = []
@@ -55,7 +282,6 @@ class ZombieRolloutEasy(MiniGame):
         self.zombies_per_wave = 15
         self.zombies_spawned_this_wave = 0
         self.zombies_killed_this_wave = 0
-        self.spawn_timer = 0
         self.spawn_rate = 1.2
         self.wave_transition = False
         self.wave_transition_timer = 0
@@ -87,7 +313,11 @@ class ZombieRolloutEasy(MiniGame):
         self.trail_points = deque(maxlen=12)
         
         self.boss_wave = False
+        self.horde_wave = False
         self.boss = None
+        self.spawn_director = SpawnDirector(self.play_area_left, self.play_area_top,
+                                            self.play_area_right, self.play_area_bottom)
+        self.plan_wave()
         
         self.camera_x = 0
         self.camera_y = 0
@@ -199,6 +429,8 @@ class ZombieRolloutEasy(MiniGame):
         self.update_xp_gems(dt)
         self.update_damage_numbers(dt)
         self.update_shockwaves(dt)
+        self.update_decals(dt)
+        self.compact_zombies()
         self.update_wave_system(dt)
         self.update_camera(dt)
         
@@ -218,7 +450,7 @@ class ZombieRolloutEasy(MiniGame):
         surface.fill((15, 15, 25))
         
         self.draw_background(surface)
-        self.draw_blood_splats(surface)
+        self.draw_decals(surface)
         self.draw_trail(surface)
         self.draw_shockwaves(surface)
         self.draw_xp_gems(surface)
@@ -283,8 +515,8 @@ class ZombieRolloutEasy(MiniGame):
         nearest_zombie = self.find_nearest_zombie()
         
         if nearest_zombie:
-            angle = math.atan2(nearest_zombie['y'] - self.player_y, 
-                             nearest_zombie['x'] - self.player_x)
+            angle = math.atan2(nearest_zombie.y - self.player_y, 
+                             nearest_zombie.x - self.player_x)
         else:
             angle = self.player_rotation
         
@@ -311,49 +543,26 @@ class ZombieRolloutEasy(MiniGame):
         
         for spread in spread_angles:
             bullet_angle = angle + spread
-            self.bullets.append({
-                'x': bullet_x,
-                'y': bullet_y,
-                'vx': math.cos(bullet_angle) * (self.bullet_speed + self.projectile_speed_bonus),
-                'vy': math.sin(bullet_angle) * (self.bullet_speed + self.projectile_speed_bonus),
-                'lifetime': 3.0,
-                'damage': damage,
-                'size': self.bullet_size + (2 if is_crit else 0),
-                'is_crit': is_crit,
-                'pierce_count': self.piercing_shots
-            })
-        
-        for _ in range(3):
-            particle_angle = angle + random.uniform(-0.3, 0.3)
-            self.particles.append({
-                'x': bullet_x,
-                'y': bullet_y,
-                'vx': math.cos(particle_angle) * random.uniform(100, 200),
-                'vy': math.sin(particle_angle) * random.uniform(100, 200),
-                'lifetime': random.uniform(0.2, 0.4),
-                'max_lifetime': 0.4,
-                'size': random.uniform(2, 4),
-                'color': (255, 150, 150) if is_crit else (255, 255, 150)
-            })
+            self.bullets.append(Bullet(
+                bullet_x, bullet_y,
+                math.cos(bullet_angle) * (self.bullet_speed + self.projectile_speed_bonus),
+                math.sin(bullet_angle) * (self.bullet_speed + self.projectile_speed_bonus),
+                damage, self.bullet_size + (2 if is_crit else 0), is_crit, self.piercing_shots))
+        
+        self.particles.emit_burst(bullet_x, bullet_y, 3, speed=(100, 200), angle=(angle - 0.3, angle + 0.3),
+                                  life=(0.2, 0.4), max_life=0.4, size=(2, 4),
+                                  color=(255, 150, 150) if is_crit else (255, 255, 150))
         
         if self.sound:
             self.sound.create_shoot().play()
 
     def find_nearest_zombie(self):
-        nearest = None
-        min_dist = float('inf')
-        
-        for zombie in self.zombies:
-            dist = math.sqrt((zombie['x'] - self.player_x)**2 + 
-                           (zombie['y'] - self.player_y)**2)
-            if dist < min_dist:
-                min_dist = dist
-                nearest = zombie
+        nearest = self.zombie_grid.nearest(self.player_x, self.player_y,
+                                           accept=lambda zombie: zombie.alive)
         
         if self.boss:
-            dist = math.sqrt((self.boss['x'] - self.player_x)**2 + 
-                           (self.boss['y'] - self.player_y)**2)
-            if dist < min_dist:
+            boss_dist_sq = (self.boss.x - self.player_x)**2 + (self.boss.y - self.player_y)**2
+            if nearest is None or boss_dist_sq < (nearest.x - self.player_x)**2 + (nearest.y - self.player_y)**2:
                 nearest = self.boss
         
         return nearest
@@ -363,161 +572,137 @@ class ZombieRolloutEasy(MiniGame):
         self.dash_cooldown = self.dash_max_cooldown
         self.invulnerable_timer = 0.2
         
-        for _ in range(15):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(150, 350)
-            self.particles.append({
-                'x': self.player_x,
-                'y': self.player_y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'lifetime': random.uniform(0.3, 0.7),
-                'max_lifetime': 0.7,
-                'size': random.uniform(3, 7),
-                'color': (100, 200, 255)
-            })
+        self.particles.emit_burst(self.player_x, self.player_y, 15, speed=(150, 350),
+                                  life=(0.3, 0.7), max_life=0.7, size=(3, 7),
+                                  color=(100, 200, 255))
 
     def activate_shockwave(self):
         self.shockwave_cooldown = self.shockwave_max_cooldown
         base_damage = 40 + (self.area_damage_bonus * 0.4)
-        self.shockwaves.append({
-            'x': self.player_x,
-            'y': self.player_y,
-            'radius': 0,
-            'max_radius': 180 + self.area_damage_bonus,
-            'lifetime': 0.8,
-            'damage': base_damage
-        })
+        self.shockwaves.append(Shockwave(self.player_x, self.player_y,
+                                         180 + self.area_damage_bonus, base_damage))
         self.screen_shake = 0.6
 
     def update_shockwaves(self, dt):
         for wave in self.shockwaves[:]:
-            wave['lifetime'] -= dt
-            wave['radius'] += 500 * dt
+            wave.lifetime -= dt
+            wave.radius += 500 * dt
             
-            if wave['lifetime'] <= 0 or wave['radius'] > wave['max_radius']:
+            if wave.lifetime <= 0 or wave.radius > wave.max_radius:
+                self.stamp_decal(wave.x, wave.y, wave.radius, self.SCORCH_COLOR, 60, width=5)
                 self.shockwaves.remove(wave)
                 continue
             
-            for zombie in self.zombies[:]:
-                dist = math.sqrt((zombie['x'] - wave['x'])**2 + 
-                               (zombie['y'] - wave['y'])**2)
-                if dist <= wave['radius'] and dist >= wave['radius'] - 25:
-                    if not zombie.get('hit_by_wave_' + str(id(wave))):
-                        self.damage_zombie(zombie, wave['damage'])
-                        zombie['hit_by_wave_' + str(id(wave))] = True
+            outer_sq = wave.radius ** 2
+            inner_sq = max(0, wave.radius - 25) ** 2
+            for zombie in self.zombie_grid.query(wave.x, wave.y, wave.radius):
+                if not zombie.alive:
+                    continue
+                dist_sq = (zombie.x - wave.x)**2 + (zombie.y - wave.y)**2
+                if inner_sq <= dist_sq <= outer_sq:
+                    if zombie not in wave.hit:
+                        self.damage_zombie(zombie, wave.damage)
+                        wave.hit.add(zombie)
                         
-                        knockback_angle = math.atan2(zombie['y'] - wave['y'], 
-                                                    zombie['x'] - wave['x'])
-                        zombie['vx'] += math.cos(knockback_angle) * 500
-                        zombie['vy'] += math.sin(knockback_angle) * 500
+                        knockback_angle = math.atan2(zombie.y - wave.y, 
+                                                    zombie.x - wave.x)
+                        zombie.vx += math.cos(knockback_angle) * 500
+                        zombie.vy += math.sin(knockback_angle) * 500
             
             if self.boss:
-                dist = math.sqrt((self.boss['x'] - wave['x'])**2 + 
-                               (self.boss['y'] - wave['y'])**2)
-                if dist <= wave['radius'] and dist >= wave['radius'] - 25:
-                    if not self.boss.get('hit_by_wave_' + str(id(wave))):
-                        self.damage_zombie(self.boss, wave['damage'])
-                        self.boss['hit_by_wave_' + str(id(wave))] = True
+                dist = math.sqrt((self.boss.x - wave.x)**2 + 
+                               (self.boss.y - wave.y)**2)
+                if dist <= wave.radius and dist >= wave.radius - 25:
+                    if self.boss not in wave.hit:
+                        self.damage_zombie(self.boss, wave.damage)
+                        wave.hit.add(self.boss)
+
+    def stamp_decal(self, x, y, radius, color, alpha, width=0, layers=None):
+        """Timbra una macchia sul layer dei decal: costo una tantum per evento"""
+        glow_cache.draw(self.decal_layer, (x, y), radius, color, alpha, width, layers)
+        tw, th = self.DECAL_TILE_W, self.DECAL_TILE_H
+        cols = 1280 // tw
+        tx0 = max(0, int(x - radius) // tw)
+        tx1 = min(cols - 1, int(x + radius) // tw)
+        ty0 = max(0, int(y - radius) // th)
+        ty1 = min(720 // th - 1, int(y + radius) // th)
+        tiles = self.decal_tiles
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                i = ty * cols + tx
+                tiles[i] = min(255, tiles[i] + alpha)
+                if tiles[i] > self.decal_alpha:
+                    self.decal_alpha = tiles[i]
+
+    def update_decals(self, dt):
+        """Sbiadisce le tile attive di 1 livello di alpha per volta con un blit
+        sottrattivo (la fill con BLEND_RGBA_SUB costa ~40 volte di più)"""
+        if self.decal_alpha <= 0:
+            return
+        self.decal_fade += self.DECAL_FADE_RATE * dt
+        step = int(self.decal_fade)
+        if not step:
+            return
+        self.decal_fade -= step
+        layer, fade = self.decal_layer, self.decal_fade_surface
+        tiles, rects = self.decal_tiles, self.decal_rects
+        top = 0
+        for i, alpha in enumerate(tiles):
+            if alpha <= 0:
+                continue
+            pos = rects[i].topleft
+            for _ in range(min(step, alpha)):
+                layer.blit(fade, pos, None, pygame.BLEND_RGBA_SUB)
+            alpha = max(0, alpha - step)
+            tiles[i] = alpha
+            if alpha > top:
+                top = alpha
+        self.decal_alpha = top
+        if not top:
+            self.decal_fade = 0.0
 
     def update_bullets(self, dt):
-        for bullet in self.bullets[:]:
-            bullet['lifetime'] -= dt
-            if bullet['lifetime'] <= 0:
-                self.bullets.remove(bullet)
+        left, right = self.play_area_left, self.play_area_right
+        top, bottom = self.play_area_top, self.play_area_bottom
+        alive = []
+        for bullet in self.bullets:
+            bullet.lifetime -= dt
+            if bullet.lifetime <= 0:
                 continue
             
-            bullet['x'] += bullet['vx'] * dt
-            bullet['y'] += bullet['vy'] * dt
+            bullet.x += bullet.vx * dt
+            bullet.y += bullet.vy * dt
             
-            if (bullet['x'] < self.play_area_left or bullet['x'] > self.play_area_right or
-                bullet['y'] < self.play_area_top or bullet['y'] > self.play_area_bottom):
-                self.bullets.remove(bullet)
+            if left <= bullet.x <= right and top <= bullet.y <= bottom:
+                alive.append(bullet)
+        self.bullets = alive
 
-    def spawn_zombie(self, zombie_type='normal'):
-        if len(self.zombies) >= self.max_zombies_on_screen:
-            return
-        
-        side = random.randint(0, 3)
-        if side == 0:
-            zombie_x = random.uniform(self.play_area_left, self.play_area_right)
-            zombie_y = self.play_area_top - 20
-        elif side == 1:
-            zombie_x = self.play_area_right + 20
-            zombie_y = random.uniform(self.play_area_top, self.play_area_bottom)
-        elif side == 2:
-            zombie_x = random.uniform(self.play_area_left, self.play_area_right)
-            zombie_y = self.play_area_bottom + 20
-        else:
-            zombie_x = self.play_area_left - 20
-            zombie_y = random.uniform(self.play_area_top, self.play_area_bottom)
-        
-        wave_mult = 1 + (self.wave - 1) * 0.15
-        
-        if zombie_type == 'fast':
-            zombie = {
-                'x': zombie_x,
-                'y': zombie_y,
-                'vx': 0,
-                'vy': 0,
-                'speed': (120 + self.wave * 4) * wave_mult,
-                'health': (25 + self.wave * 3) * wave_mult,
-                'max_health': (25 + self.wave * 3) * wave_mult,
-                'damage': 8 * wave_mult,
-                'radius': 11,
-                'color': (255, 100, 100),
-                'type': 'fast',
-                'animation_timer': 0
-            }
-        elif zombie_type == 'tank':
-            zombie = {
-                'x': zombie_x,
-                'y': zombie_y,
-                'vx': 0,
-                'vy': 0,
-                'speed': (40 + self.wave * 2) * wave_mult,
-                'health': (120 + self.wave * 25) * wave_mult,
-                'max_health': (120 + self.wave * 25) * wave_mult,
-                'damage': 20 * wave_mult,
-                'radius': 22,
-                'color': (150, 150, 100),
-                'type': 'tank',
-                'animation_timer': 0
-            }
-        elif zombie_type == 'exploder':
-            zombie = {
-                'x': zombie_x,
-                'y': zombie_y,
-                'vx': 0,
-                'vy': 0,
-                'speed': (70 + self.wave * 3) * wave_mult,
-                'health': (40 + self.wave * 8) * wave_mult,
-                'max_health': (40 + self.wave * 8) * wave_mult,
-                'damage': 30 * wave_mult,
-                'radius': 14,
-                'color': (255, 150, 0),
-                'type': 'exploder',
-                'animation_timer': 0,
-                'explosion_radius': 90
-            }
-        else:
-            zombie = {
-                'x': zombie_x,
-                'y': zombie_y,
-                'vx': 0,
-                'vy': 0,
-                'speed': (65 + self.wave * 3) * wave_mult,
-                'health': (45 + self.wave * 8) * wave_mult,
-                'max_health': (45 + self.wave * 8) * wave_mult,
-                'damage': 12 * wave_mult,
-                'radius': 15,
-                'color': (100, 200, 100),
-                'type': 'normal',
-                'animation_timer': 0
-            }
-        
-        self.zombies.append(zombie)
-        self.zombies_spawned_this_wave += 1
+    def zombie_templates(self):
+        """Parametri dei tipi per l'ondata corrente, nell'ordine di SpawnDirector.KINDS:
+        (tipo, velocità, vita, danno, raggio, colore, raggio esplosione)"""
+        wave = self.wave
+        wave_mult = 1 + (wave - 1) * 0.15
+        return (
+            ('normal', (65 + wave * 3) * wave_mult, (45 + wave * 8) * wave_mult,
+             12 * wave_mult, 15, (100, 200, 100), 0),
+            ('fast', (120 + wave * 4) * wave_mult, (25 + wave * 3) * wave_mult,
+             8 * wave_mult, 11, (255, 100, 100), 0),
+            ('tank', (40 + wave * 2) * wave_mult, (120 + wave * 25) * wave_mult,
+             20 * wave_mult, 22, (150, 150, 100), 0),
+            ('exploder', (70 + wave * 3) * wave_mult, (40 + wave * 8) * wave_mult,
+             30 * wave_mult, 14, (255, 150, 0), 90),
+        )
+
+    def spawn_batch(self, kinds, xs, ys):
+        """Crea un lotto di zombie (indici in SpawnDirector.KINDS) e li inserisce
+        nella griglia; i parametri dell'ondata si calcolano una volta per lotto"""
+        templates = self.zombie_templates()
+        zombies, insert = self.zombies, self.zombie_grid.insert
+        for kind, x, y in zip(kinds, xs, ys):
+            zombie = Zombie(x, y, *templates[kind])
+            zombies.append(zombie)
+            insert(zombie, x, y, zombie.radius)
+        self.zombies_spawned_this_wave += len(kinds)
 
     def spawn_boss(self):
         side = random.randint(0, 3)
@@ -536,152 +721,147 @@ class ZombieRolloutEasy(MiniGame):
         
         wave_mult = 1 + (self.wave - 1) * 0.2
         
-        self.boss = {
-            'x': boss_x,
-            'y': boss_y,
-            'vx': 0,
-            'vy': 0,
-            'speed': 55 * wave_mult,
-            'health': (2000 + self.wave * 800) * wave_mult,
-            'max_health': (2000 + self.wave * 800) * wave_mult,
-            'damage': 35 * wave_mult,
-            'radius': 45,
-            'color': (200, 50, 50),
-            'type': 'boss',
-            'animation_timer': 0,
-            'charge_timer': 0,
-            'charge_cooldown': 2.5,
-            'is_charging': False,
-            'charge_target_x': 0,
-            'charge_target_y': 0,
-            'spawn_timer': 0,
-            'spawn_cooldown': 4.0
-        }
+        self.boss = Boss(boss_x, boss_y, 55 * wave_mult,
+                         (2000 + self.wave * 800) * wave_mult, 35 * wave_mult)
 
     def update_zombies(self, dt):
-        for zombie in self.zombies[:]:
-            zombie['animation_timer'] += dt
+        """Muove i zombie e ricostruisce la griglia; chi esce dall'area diventa una
+        tombstone (alive=False), scartata da compact_zombies() a fine frame"""
+        grid = self.zombie_grid
+        grid.clear()
+        cull = SpawnDirector.CULL_MARGIN
+        min_x, max_x = self.play_area_left - cull, self.play_area_right + cull
+        min_y, max_y = self.play_area_top - cull, self.play_area_bottom + cull
+        player_x, player_y = self.player_x, self.player_y
+        for zombie in self.zombies:
+            zombie.animation_timer += dt
             
-            angle_to_player = math.atan2(self.player_y - zombie['y'], 
-                                        self.player_x - zombie['x'])
+            angle_to_player = math.atan2(player_y - zombie.y, player_x - zombie.x)
             
-            target_vx = math.cos(angle_to_player) * zombie['speed']
-            target_vy = math.sin(angle_to_player) * zombie['speed']
+            target_vx = math.cos(angle_to_player) * zombie.speed
+            target_vy = math.sin(angle_to_player) * zombie.speed
             
-            zombie['vx'] = zombie.get('vx', 0) * 0.9 + target_vx * 0.1
-            zombie['vy'] = zombie.get('vy', 0) * 0.9 + target_vy * 0.1
+            zombie.vx = zombie.vx * 0.9 + target_vx * 0.1
+            zombie.vy = zombie.vy * 0.9 + target_vy * 0.1
             
-            zombie['x'] += zombie['vx'] * dt
-            zombie['y'] += zombie['vy'] * dt
+            zombie.x += zombie.vx * dt
+            zombie.y += zombie.vy * dt
             
-            if zombie['x'] < self.play_area_left - 50 or zombie['x'] > self.play_area_right + 50:
-                self.zombies.remove(zombie)
-            elif zombie['y'] < self.play_area_top - 50 or zombie['y'] > self.play_area_bottom + 50:
-                self.zombies.remove(zombie)
+            if min_x <= zombie.x <= max_x and min_y <= zombie.y <= max_y:
+                grid.insert(zombie, zombie.x, zombie.y, zombie.radius)
+            else:
+                zombie.alive = False
+    
+    def compact_zombies(self):
+        """Una sola passata per frame: toglie le tombstone lasciate da uccisioni e uscite"""
+        self.zombies = [zombie for zombie in self.zombies if zombie.alive]
 
     def update_boss(self, dt):
         if not self.boss:
             return
         
-        self.boss['animation_timer'] += dt
-        self.boss['charge_timer'] += dt
-        self.boss['spawn_timer'] += dt
-        
-        if self.boss['spawn_timer'] >= self.boss['spawn_cooldown']:
-            self.boss['spawn_timer'] = 0
-            for _ in range(3):
-                zombie_type = random.choice(['normal', 'fast'])
-                self.spawn_zombie(zombie_type)
-        
-        if self.boss['charge_timer'] >= self.boss['charge_cooldown'] and not self.boss['is_charging']:
-            self.boss['is_charging'] = True
-            self.boss['charge_target_x'] = self.player_x
-            self.boss['charge_target_y'] = self.player_y
-            self.boss['charge_timer'] = 0
+        self.boss.animation_timer += dt
+        self.boss.charge_timer += dt
+        self.boss.spawn_timer += dt
+        
+        if self.boss.spawn_timer >= self.boss.spawn_cooldown:
+            self.boss.spawn_timer = 0
+            count = min(3, self.max_zombies_on_screen - len(self.zombies))
+            if count > 0:
+                self.spawn_batch(*self.spawn_director.burst(count))
+        
+        if self.boss.charge_timer >= self.boss.charge_cooldown and not self.boss.is_charging:
+            self.boss.is_charging = True
+            self.boss.charge_target_x = self.player_x
+            self.boss.charge_target_y = self.player_y
+            self.boss.charge_timer = 0
             self.screen_shake = 0.3
             
             if self.sound:
                 self.sound.create_combo(6).play()
         
-        if self.boss['is_charging']:
-            angle_to_target = math.atan2(self.boss['charge_target_y'] - self.boss['y'], 
-                                        self.boss['charge_target_x'] - self.boss['x'])
+        if self.boss.is_charging:
+            angle_to_target = math.atan2(self.boss.charge_target_y - self.boss.y, 
+                                        self.boss.charge_target_x - self.boss.x)
             
             charge_speed = 400
-            self.boss['vx'] = math.cos(angle_to_target) * charge_speed
-            self.boss['vy'] = math.sin(angle_to_target) * charge_speed
+            self.boss.vx = math.cos(angle_to_target) * charge_speed
+            self.boss.vy = math.sin(angle_to_target) * charge_speed
             
-            if self.boss['charge_timer'] >= 1.2:
-                self.boss['is_charging'] = False
-                self.boss['charge_timer'] = 0
+            if self.boss.charge_timer >= 1.2:
+                self.boss.is_charging = False
+                self.boss.charge_timer = 0
         else:
-            angle_to_player = math.atan2(self.player_y - self.boss['y'], 
-                                        self.player_x - self.boss['x'])
-            
-            target_vx = math.cos(angle_to_player) * self.boss['speed']
-            target_vy = math.sin(angle_to_player) * self.boss['speed']
-            
-            self.boss['vx'] = self.boss.get('vx', 0) * 0.95 + target_vx * 0.05
-            self.boss['vy'] = self.boss.get('vy', 0) * 0.95 + target_vy * 0.05
-        
-        self.boss['x'] += self.boss['vx'] * dt
-        self.boss['y'] += self.boss['vy'] * dt
-        
-        if self.boss['x'] - self.boss['radius'] < self.play_area_left:
-            self.boss['x'] = self.play_area_left + self.boss['radius']
-            self.boss['vx'] *= -0.7
-        if self.boss['x'] + self.boss['radius'] > self.play_area_right:
-            self.boss['x'] = self.play_area_right - self.boss['radius']
-            self.boss['vx'] *= -0.7
-        if self.boss['y'] - self.boss['radius'] < self.play_area_top:
-            self.boss['y'] = self.play_area_top + self.boss['radius']
-            self.boss['vy'] *= -0.7
-        if self.boss['y'] + self.boss['radius'] > self.play_area_bottom:
-            self.boss['y'] = self.play_area_bottom - self.boss['radius']
-            self.boss['vy'] *= -0.7
+            angle_to_player = math.atan2(self.player_y - self.boss.y, 
+                                        self.player_x - self.boss.x)
+            
+            target_vx = math.cos(angle_to_player) * self.boss.speed
+            target_vy = math.sin(angle_to_player) * self.boss.speed
+            
+            self.boss.vx = self.boss.vx * 0.95 + target_vx * 0.05
+            self.boss.vy = self.boss.vy * 0.95 + target_vy * 0.05
+        
+        self.boss.x += self.boss.vx * dt
+        self.boss.y += self.boss.vy * dt
+        
+        if self.boss.x - self.boss.radius < self.play_area_left:
+            self.boss.x = self.play_area_left + self.boss.radius
+            self.boss.vx *= -0.7
+        if self.boss.x + self.boss.radius > self.play_area_right:
+            self.boss.x = self.play_area_right - self.boss.radius
+            self.boss.vx *= -0.7
+        if self.boss.y - self.boss.radius < self.play_area_top:
+            self.boss.y = self.play_area_top + self.boss.radius
+            self.boss.vy *= -0.7
+        if self.boss.y + self.boss.radius > self.play_area_bottom:
+            self.boss.y = self.play_area_bottom - self.boss.radius
+            self.boss.vy *= -0.7
 
     def update_collisions(self):
-        for bullet in self.bullets[:]:
+        """Broadphase sulla griglia dei zombie, test esatti su distanze al quadrato.
+        I proiettili esauriti restano con pierce_count < 0 fino alla compattazione finale."""
+        grid = self.zombie_grid
+        # Stesso ordine in entrambi i casi: la griglia restituisce i candidati in ordine d'inserimento
+        use_grid = len(self.zombies) >= self.BROADPHASE_MIN_ZOMBIES
+        for bullet in self.bullets:
             hit_something = False
-            
-            for zombie in self.zombies[:]:
-                dist = math.sqrt((bullet['x'] - zombie['x'])**2 + 
-                               (bullet['y'] - zombie['y'])**2)
-                if dist < zombie['radius'] + bullet['size']:
-                    self.damage_zombie(zombie, bullet['damage'])
+            bullet_size = bullet.size
+            
+            candidates = grid.query(bullet.x, bullet.y, bullet_size) if use_grid else self.zombies
+            for zombie in candidates:
+                if not zombie.alive:
+                    continue
+                reach = zombie.radius + bullet_size
+                if (bullet.x - zombie.x)**2 + (bullet.y - zombie.y)**2 < reach * reach:
+                    self.damage_zombie(zombie, bullet.damage)
                     hit_something = True
-                    
-                    if bullet['pierce_count'] <= 0:
-                        if bullet in self.bullets:
-                            self.bullets.remove(bullet)
+                    bullet.pierce_count -= 1
+                    if bullet.pierce_count < 0:
                         break
-                    else:
-                        bullet['pierce_count'] -= 1
-            
-            if not hit_something and self.boss and bullet in self.bullets:
-                dist = math.sqrt((bullet['x'] - self.boss['x'])**2 + 
-                               (bullet['y'] - self.boss['y'])**2)
-                if dist < self.boss['radius'] + bullet['size']:
-                    self.damage_zombie(self.boss, bullet['damage'])
-                    
-                    if bullet['pierce_count'] <= 0:
-                        self.bullets.remove(bullet)
-                    else:
-                        bullet['pierce_count'] -= 1
+            
+            if not hit_something and self.boss:
+                reach = self.boss.radius + bullet_size
+                if (bullet.x - self.boss.x)**2 + (bullet.y - self.boss.y)**2 < reach * reach:
+                    self.damage_zombie(self.boss, bullet.damage)
+                    bullet.pierce_count -= 1
+        
+        self.bullets = [bullet for bullet in self.bullets if bullet.pierce_count >= 0]
         
         if self.invulnerable_timer <= 0:
-            for zombie in self.zombies:
-                dist = math.sqrt((self.player_x - zombie['x'])**2 + 
-                               (self.player_y - zombie['y'])**2)
-                if dist < self.player_radius + zombie['radius']:
-                    damage = zombie['damage'] * (1 - self.armor / 100)
+            candidates = grid.query(self.player_x, self.player_y, self.player_radius) if use_grid else self.zombies
+            for zombie in candidates:
+                if not zombie.alive:
+                    continue
+                reach = self.player_radius + zombie.radius
+                if (self.player_x - zombie.x)**2 + (self.player_y - zombie.y)**2 < reach * reach:
+                    damage = zombie.damage * (1 - self.armor / 100)
                     self.player_health -= damage
                     self.invulnerable_timer = 0.4
                     self.screen_shake = 0.3
                     self.combo_counter = 0
                     
-                    knockback_angle = math.atan2(self.player_y - zombie['y'], 
-                                                self.player_x - zombie['x'])
+                    knockback_angle = math.atan2(self.player_y - zombie.y, 
+                                                self.player_x - zombie.x)
                     self.player_velocity_x = math.cos(knockback_angle) * 350
                     self.player_velocity_y = math.sin(knockback_angle) * 350
                     
@@ -690,17 +870,17 @@ class ZombieRolloutEasy(MiniGame):
                     break
             
             if self.boss:
-                dist = math.sqrt((self.player_x - self.boss['x'])**2 + 
-                               (self.player_y - self.boss['y'])**2)
-                if dist < self.player_radius + self.boss['radius']:
-                    damage = self.boss['damage'] * (1 - self.armor / 100)
+                dist = math.sqrt((self.player_x - self.boss.x)**2 + 
+                               (self.player_y - self.boss.y)**2)
+                if dist < self.player_radius + self.boss.radius:
+                    damage = self.boss.damage * (1 - self.armor / 100)
                     self.player_health -= damage
                     self.invulnerable_timer = 0.5
                     self.screen_shake = 0.6
                     self.combo_counter = 0
                     
-                    knockback_angle = math.atan2(self.player_y - self.boss['y'], 
-                                                self.player_x - self.boss['x'])
+                    knockback_angle = math.atan2(self.player_y - self.boss.y, 
+                                                self.player_x - self.boss.x)
                     self.player_velocity_x = math.cos(knockback_angle) * 500
                     self.player_velocity_y = math.sin(knockback_angle) * 500
                     
@@ -708,35 +888,19 @@ class ZombieRolloutEasy(MiniGame):
                         self.sound.create_combo(8).play()
 
     def damage_zombie(self, zombie, damage):
-        zombie['health'] -= damage
+        zombie.health -= damage
         
         if self.lifesteal > 0:
             heal = damage * (self.lifesteal / 100)
             self.player_health = min(self.player_max_health, self.player_health + heal)
         
-        self.damage_numbers.append({
-            'x': zombie['x'],
-            'y': zombie['y'] - zombie['radius'],
-            'damage': int(damage),
-            'lifetime': 0.8,
-            'vy': -60
-        })
-        
-        for _ in range(4):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(50, 150)
-            self.particles.append({
-                'x': zombie['x'],
-                'y': zombie['y'],
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'lifetime': random.uniform(0.3, 0.6),
-                'max_lifetime': 0.6,
-                'size': random.uniform(2, 5),
-                'color': (200, 0, 0)
-            })
-        
-        if zombie['health'] <= 0:
+        self.damage_numbers.append(DamageNumber(zombie.x, zombie.y - zombie.radius, int(damage)))
+        
+        self.particles.emit_burst(zombie.x, zombie.y, 4, speed=(50, 150),
+                                  life=(0.3, 0.6), max_life=0.6, size=(2, 5),
+                                  color=(200, 0, 0))
+        
+        if zombie.health <= 0:
             self.kill_zombie(zombie)
 
     def kill_zombie(self, zombie):
@@ -744,30 +908,15 @@ class ZombieRolloutEasy(MiniGame):
             self.score += 10000
             self.xp += 200
             
-            for _ in range(80):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(150, 500)
-                self.particles.append({
-                    'x': zombie['x'],
-                    'y': zombie['y'],
-                    'vx': math.cos(angle) * speed,
-                    'vy': math.sin(angle) * speed,
-                    'lifetime': random.uniform(0.6, 2.0),
-                    'max_lifetime': 2.0,
-                    'size': random.uniform(5, 12),
-                    'color': (255, 150, 0)
-                })
-            
-            self.blood_splats.append({
-                'x': zombie['x'],
-                'y': zombie['y'],
-                'radius': zombie['radius'] * 3,
-                'alpha': 180
-            })
+            self.particles.emit_burst(zombie.x, zombie.y, 80, speed=(150, 500),
+                                      life=(0.6, 2.0), max_life=2.0, size=(5, 12),
+                                      color=(255, 150, 0))
+            
+            self.stamp_decal(zombie.x, zombie.y, zombie.radius * 3, self.BLOOD_COLOR, 180)
             
             for _ in range(15):
-                self.spawn_xp_gem(zombie['x'] + random.uniform(-60, 60), 
-                                 zombie['y'] + random.uniform(-60, 60), 20)
+                self.spawn_xp_gem(zombie.x + random.uniform(-60, 60), 
+                                 zombie.y + random.uniform(-60, 60), 20)
             
             if self.sound:
                 self.sound.create_high_score().play()
@@ -777,8 +926,7 @@ class ZombieRolloutEasy(MiniGame):
             
             return
         
-        if zombie in self.zombies:
-            self.zombies.remove(zombie)
+        zombie.alive = False
         
         self.zombies_killed_this_wave += 1
         self.combo_counter += 1
@@ -788,41 +936,26 @@ class ZombieRolloutEasy(MiniGame):
         zombie_score = 50
         xp_value = 3
         
-        if zombie['type'] == 'fast':
+        if zombie.type == 'fast':
             zombie_score = 75
             xp_value = 4
-        elif zombie['type'] == 'tank':
+        elif zombie.type == 'tank':
             zombie_score = 120
             xp_value = 8
-        elif zombie['type'] == 'exploder':
+        elif zombie.type == 'exploder':
             zombie_score = 90
             xp_value = 6
         
         self.score += int(zombie_score * score_multiplier)
         
-        if zombie['type'] == 'exploder':
-            self.create_explosion(zombie['x'], zombie['y'], zombie['explosion_radius'])
-        
-        for _ in range(12):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(60, 220)
-            self.particles.append({
-                'x': zombie['x'],
-                'y': zombie['y'],
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'lifetime': random.uniform(0.4, 1.0),
-                'max_lifetime': 1.0,
-                'size': random.uniform(3, 7),
-                'color': zombie['color']
-            })
-        
-        self.blood_splats.append({
-            'x': zombie['x'],
-            'y': zombie['y'],
-            'radius': zombie['radius'] * 2,
-            'alpha': 120
-        })
+        if zombie.type == 'exploder':
+            self.create_explosion(zombie.x, zombie.y, zombie.explosion_radius)
+        
+        self.particles.emit_burst(zombie.x, zombie.y, 12, speed=(60, 220),
+                                  life=(0.4, 1.0), max_life=1.0, size=(3, 7),
+                                  color=zombie.color)
+        
+        self.stamp_decal(zombie.x, zombie.y, zombie.radius * 2, self.BLOOD_COLOR, 120)
         
         if self.combo_counter % 10 == 0 and self.sound:
             self.sound.create_combo(min(9, self.combo_counter // 10)).play()
@@ -834,53 +967,46 @@ class ZombieRolloutEasy(MiniGame):
             for _ in range(xp_value):
                 offset_x = random.uniform(-15, 15)
                 offset_y = random.uniform(-15, 15)
-                self.spawn_xp_gem(zombie['x'] + offset_x, zombie['y'] + offset_y, 5)
+                self.spawn_xp_gem(zombie.x + offset_x, zombie.y + offset_y, 5)
 
     def spawn_xp_gem(self, x, y, value):
-        self.xp_gems.append({
-            'x': x,
-            'y': y,
-            'value': value,
-            'lifetime': 30.0,
-            'radius': 8,
-            'animation_timer': 0,
-            'vx': random.uniform(-50, 50),
-            'vy': random.uniform(-50, 50)
-        })
+        self.xp_gems.append(XPGem(x, y, value, random.uniform(-50, 50), random.uniform(-50, 50)))
 
     def update_xp_gems(self, dt):
-        for gem in self.xp_gems[:]:
-            gem['lifetime'] -= dt
-            gem['animation_timer'] += dt
+        remaining = []
+        for gem in self.xp_gems:
+            gem.lifetime -= dt
+            gem.animation_timer += dt
             
-            if gem['lifetime'] <= 0:
-                self.xp_gems.remove(gem)
+            if gem.lifetime <= 0:
                 continue
             
-            gem['vx'] *= 0.95
-            gem['vy'] *= 0.95
-            gem['x'] += gem['vx'] * dt
-            gem['y'] += gem['vy'] * dt
+            gem.vx *= 0.95
+            gem.vy *= 0.95
+            gem.x += gem.vx * dt
+            gem.y += gem.vy * dt
             
-            dist = math.sqrt((self.player_x - gem['x'])**2 + 
-                           (self.player_y - gem['y'])**2)
+            dist = math.sqrt((self.player_x - gem.x)**2 + 
+                           (self.player_y - gem.y)**2)
             
             if dist < self.magnetism_range:
-                angle_to_player = math.atan2(self.player_y - gem['y'], 
-                                            self.player_x - gem['x'])
+                angle_to_player = math.atan2(self.player_y - gem.y, 
+                                            self.player_x - gem.x)
                 magnet_speed = 300
-                gem['x'] += math.cos(angle_to_player) * magnet_speed * dt
-                gem['y'] += math.sin(angle_to_player) * magnet_speed * dt
+                gem.x += math.cos(angle_to_player) * magnet_speed * dt
+                gem.y += math.sin(angle_to_player) * magnet_speed * dt
             
             if dist < self.pickup_range:
-                self.xp += gem['value']
-                self.xp_gems.remove(gem)
+                self.xp += gem.value
                 
                 if self.sound:
                     self.sound.create_target_hit().play()
                 
                 if self.xp >= self.xp_to_next_level:
                     self.trigger_level_up()
+            else:
+                remaining.append(gem)
+        self.xp_gems = remaining
 
     def trigger_level_up(self):
         self.level += 1
@@ -898,34 +1024,25 @@ class ZombieRolloutEasy(MiniGame):
             self.sound.create_pause().play()
 
     def create_explosion(self, x, y, radius):
-        for _ in range(40):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(120, 350)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'lifetime': random.uniform(0.5, 1.2),
-                'max_lifetime': 1.2,
-                'size': random.uniform(5, 14),
-                'color': (255, 150, 0)
-            })
+        self.particles.emit_burst(x, y, 40, speed=(120, 350),
+                                  life=(0.5, 1.2), max_life=1.2, size=(5, 14),
+                                  color=(255, 150, 0))
         
         self.screen_shake = 0.7
+        self.stamp_decal(x, y, radius * 0.6, self.SCORCH_COLOR, 110,
+                         layers=((1.0, 0.5), (0.65, 1.0)))
         
         if self.sound:
             self.sound.create_combo(7).play()
         
         explosion_damage = 60 + self.area_damage_bonus
         
-        for zombie in self.zombies[:]:
-            dist = math.sqrt((zombie['x'] - x)**2 + (zombie['y'] - y)**2)
-            if dist < radius:
+        for zombie in self.zombie_grid.query(x, y, radius):
+            if zombie.alive and (zombie.x - x)**2 + (zombie.y - y)**2 < radius * radius:
                 self.damage_zombie(zombie, explosion_damage)
         
         if self.boss:
-            dist = math.sqrt((self.boss['x'] - x)**2 + (self.boss['y'] - y)**2)
+            dist = math.sqrt((self.boss.x - x)**2 + (self.boss.y - y)**2)
             if dist < radius:
                 self.damage_zombie(self.boss, explosion_damage)
         
@@ -937,38 +1054,28 @@ class ZombieRolloutEasy(MiniGame):
 
     def update_powerups(self, dt):
         for powerup in self.powerups[:]:
-            powerup['lifetime'] -= dt
-            powerup['animation_timer'] += dt
+            powerup.lifetime -= dt
+            powerup.animation_timer += dt
             
-            if powerup['lifetime'] <= 0:
+            if powerup.lifetime <= 0:
                 self.powerups.remove(powerup)
                 continue
             
-            dist = math.sqrt((self.player_x - powerup['x'])**2 + 
-                           (self.player_y - powerup['y'])**2)
+            dist = math.sqrt((self.player_x - powerup.x)**2 + 
+                           (self.player_y - powerup.y)**2)
             
-            if dist < self.player_radius + powerup['radius']:
+            if dist < self.player_radius + powerup.radius:
                 self.collect_powerup(powerup)
                 self.powerups.remove(powerup)
 
     def collect_powerup(self, powerup):
-        if powerup['type'] == 'health':
+        if powerup.type == 'health':
             heal_amount = 40
             self.player_health = min(self.player_max_health, self.player_health + heal_amount)
             
-            for _ in range(12):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(60, 180)
-                self.particles.append({
-                    'x': powerup['x'],
-                    'y': powerup['y'],
-                    'vx': math.cos(angle) * speed,
-                    'vy': math.sin(angle) * speed,
-                    'lifetime': random.uniform(0.3, 0.7),
-                    'max_lifetime': 0.7,
-                    'size': random.uniform(2, 6),
-                    'color': (0, 255, 0)
-                })
+            self.particles.emit_burst(powerup.x, powerup.y, 12, speed=(60, 180),
+                                      life=(0.3, 0.7), max_life=0.7, size=(2, 6),
+                                      color=(0, 255, 0))
         
         self.score += 100
         
@@ -976,27 +1083,19 @@ class ZombieRolloutEasy(MiniGame):
             self.sound.create_combo(3).play()
 
     def update_particles(self, dt):
-        for particle in self.particles[:]:
-            particle['lifetime'] -= dt
-            if particle['lifetime'] <= 0:
-                self.particles.remove(particle)
-                continue
-            
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-            
-            particle['vx'] *= 0.96
-            particle['vy'] *= 0.96
+        self.particles.update(dt)
 
     def update_damage_numbers(self, dt):
-        for number in self.damage_numbers[:]:
-            number['lifetime'] -= dt
-            if number['lifetime'] <= 0:
-                self.damage_numbers.remove(number)
+        remaining = []
+        for number in self.damage_numbers:
+            number.lifetime -= dt
+            if number.lifetime <= 0:
                 continue
             
-            number['y'] += number['vy'] * dt
-            number['vy'] += 80 * dt
+            number.y += number.vy * dt
+            number.vy += 80 * dt
+            remaining.append(number)
+        self.damage_numbers = remaining
 
     def update_wave_system(self, dt):
         if self.wave_transition:
@@ -1013,6 +1112,14 @@ class ZombieRolloutEasy(MiniGame):
                 else:
                     self.boss_wave = False
                 
+                self.horde_wave = (self.wave >= self.HORDE_FIRST_WAVE and self.wave % 5 == 3)
+                if self.horde_wave:
+                    self.zombies_per_wave *= self.HORDE_MULTIPLIER
+                    self.max_zombies_on_screen = self.HORDE_MAX_ON_SCREEN
+                else:
+                    self.max_zombies_on_screen = 150
+                self.plan_wave()
+                
                 if self.sound:
                     self.sound.create_game_start().play()
             return
@@ -1030,27 +1137,25 @@ class ZombieRolloutEasy(MiniGame):
                 self.wave_transition_timer = 2.5
                 self.boss_wave = False
         else:
-            if self.zombies_spawned_this_wave < self.zombies_per_wave:
-                self.spawn_timer += dt
-                
-                spawn_rate = max(0.3, self.spawn_rate - self.wave * 0.03)
-                
-                if self.spawn_timer >= spawn_rate:
-                    self.spawn_timer = 0
-                    
-                    rand = random.random()
-                    if rand < 0.45:
-                        self.spawn_zombie('normal')
-                    elif rand < 0.7:
-                        self.spawn_zombie('fast')
-                    elif rand < 0.88:
-                        self.spawn_zombie('tank')
-                    else:
-                        self.spawn_zombie('exploder')
-            
-            if self.zombies_spawned_this_wave >= self.zombies_per_wave and len(self.zombies) == 0:
+            director = self.spawn_director
+            batch = director.drain(dt, self.max_zombies_on_screen - len(self.zombies))
+            if batch:
+                self.spawn_batch(*batch)
+            
+            if director.finished and len(self.zombies) == 0:
                 self.wave_transition = True
                 self.wave_transition_timer = 2.5
+                self.horde_wave = False
+
+    def plan_wave(self):
+        """Precalcola il programma di spawn dell'ondata corrente (vuoto per il boss)"""
+        if self.boss_wave:
+            self.spawn_director.plan(0, 1.0)
+        elif self.horde_wave:
+            self.spawn_director.plan_horde(self.zombies_per_wave, self.HORDE_PACK_INTERVAL)
+        else:
+            spawn_rate = max(0.3, self.spawn_rate - self.wave * 0.03)
+            self.spawn_director.plan(self.zombies_per_wave, spawn_rate)
 
     def update_camera(self, dt):
         if self.screen_shake > 0:
@@ -1130,20 +1235,13 @@ class ZombieRolloutEasy(MiniGame):
                          self.play_area_right - self.play_area_left, 
                          self.play_area_bottom - self.play_area_top), 3)
 
-    def draw_blood_splats(self, surface):
-        for splat in self.blood_splats[:]:
-            splat['alpha'] -= 0.3
-            if splat['alpha'] <= 0:
-                self.blood_splats.remove(splat)
-                continue
-            
-            draw_x = int(splat['x'] + self.camera_x)
-            draw_y = int(splat['y'] + self.camera_y)
-            
-            splat_surface = pygame.Surface((splat['radius'] * 2, splat['radius'] * 2), pygame.SRCALPHA)
-            color = (100, 0, 0, int(splat['alpha']))
-            pygame.draw.circle(splat_surface, color, (splat['radius'], splat['radius']), splat['radius'])
-            surface.blit(splat_surface, (draw_x - splat['radius'], draw_y - splat['radius']))
+    def draw_decals(self, surface):
+        if self.decal_alpha <= 0:
+            return
+        layer, rects = self.decal_layer, self.decal_rects
+        cam_x, cam_y = int(self.camera_x), int(self.camera_y)
+        surface.blits([(layer, (rects[i].x + cam_x, rects[i].y + cam_y), rects[i])
+                       for i, alpha in enumerate(self.decal_tiles) if alpha > 0], False)
 
     def draw_trail(self, surface):
         if len(self.trail_points) < 2:
@@ -1159,10 +1257,13 @@ class ZombieRolloutEasy(MiniGame):
             draw_x = int(x + self.camera_x)
             draw_y = int(y + self.camera_y)
             
-            trail_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            color = (100, 200, 255, alpha // 2)
-            pygame.draw.circle(trail_surface, color, (radius, radius), radius)
-            surface.blit(trail_surface, (draw_x - radius, draw_y - radius))
+            glow_cache.draw(surface, (draw_x, draw_y), radius, (100, 200, 255), alpha // 2)
+
+    def get_shadow(self, width, height, alpha, top=0):
+        """Ombra ellittica in cache (top = offset verticale dell'ellisse nello sprite)"""
+        return glow_cache.sprite(
+            ("zombie_shadow", width, height, alpha, top), (width, height),
+            lambda sprite: pygame.draw.ellipse(sprite, (0, 0, 0, alpha), (0, top, width, height - top)))
 
     def draw_player(self, surface):
         draw_x = int(self.player_x + self.camera_x)
@@ -1172,10 +1273,7 @@ class ZombieRolloutEasy(MiniGame):
             return
         
         glow_radius = int(self.player_radius * 1.6)
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        glow_color = (100, 200, 255, 120)
-        pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
-        surface.blit(glow_surface, (draw_x - glow_radius, draw_y - glow_radius))
+        glow_cache.draw(surface, (draw_x, draw_y), glow_radius, (100, 200, 255), 120)
         
         pygame.draw.circle(surface, (70, 140, 200), (draw_x, draw_y), self.player_radius)
         pygame.draw.circle(surface, (110, 190, 255), (draw_x, draw_y), self.player_radius, 3)
@@ -1194,35 +1292,30 @@ class ZombieRolloutEasy(MiniGame):
 
     def draw_zombies(self, surface):
         for zombie in self.zombies:
-            draw_x = int(zombie['x'] + self.camera_x)
-            draw_y = int(zombie['y'] + self.camera_y)
+            draw_x = int(zombie.x + self.camera_x)
+            draw_y = int(zombie.y + self.camera_y)
             
             if draw_x < -50 or draw_x > 1330 or draw_y < 70 or draw_y > 770:
                 continue
             
-            wobble = math.sin(zombie['animation_timer'] * 12) * 2
+            wobble = math.sin(zombie.animation_timer * 12) * 2
             draw_y += int(wobble)
             
-            shadow_surface = pygame.Surface((zombie['radius'] * 2, zombie['radius'] * 2), pygame.SRCALPHA)
-            shadow_color = (0, 0, 0, 60)
-            pygame.draw.ellipse(shadow_surface, shadow_color, (0, zombie['radius'], zombie['radius'] * 2, zombie['radius']))
-            surface.blit(shadow_surface, (draw_x - zombie['radius'], draw_y))
+            shadow_surface = self.get_shadow(zombie.radius * 2, zombie.radius * 2, 60, zombie.radius)
+            surface.blit(shadow_surface, (draw_x - zombie.radius, draw_y))
             
-            body_color = zombie['color']
-            pygame.draw.circle(surface, body_color, (draw_x, draw_y), zombie['radius'])
+            body_color = zombie.color
+            pygame.draw.circle(surface, body_color, (draw_x, draw_y), zombie.radius)
             
             darker_color = tuple(max(0, c - 50) for c in body_color)
-            pygame.draw.circle(surface, darker_color, (draw_x, draw_y), zombie['radius'], 2)
+            pygame.draw.circle(surface, darker_color, (draw_x, draw_y), zombie.radius, 2)
             
-            if zombie['type'] == 'exploder':
-                pulse = abs(math.sin(zombie['animation_timer'] * 6))
-                glow_radius = int(zombie['radius'] * (1 + pulse * 0.4))
-                glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                glow_color = (255, 150, 0, int(120 * pulse))
-                pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
-                surface.blit(glow_surface, (draw_x - glow_radius, draw_y - glow_radius))
+            if zombie.type == 'exploder':
+                pulse = abs(math.sin(zombie.animation_timer * 6))
+                glow_radius = int(zombie.radius * (1 + pulse * 0.4))
+                glow_cache.draw(surface, (draw_x, draw_y), glow_radius, (255, 150, 0), int(120 * pulse))
             
-            eye_offset = zombie['radius'] * 0.4
+            eye_offset = zombie.radius * 0.4
             left_eye_x = draw_x - 4
             right_eye_x = draw_x + 4
             eye_y = draw_y - eye_offset
@@ -1230,13 +1323,13 @@ class ZombieRolloutEasy(MiniGame):
             pygame.draw.circle(surface, (255, 0, 0), (left_eye_x, int(eye_y)), 3)
             pygame.draw.circle(surface, (255, 0, 0), (right_eye_x, int(eye_y)), 3)
             
-            if zombie['type'] != 'fast' or zombie['health'] < zombie['max_health']:
-                health_bar_width = zombie['radius'] * 2
+            if zombie.type != 'fast' or zombie.health < zombie.max_health:
+                health_bar_width = zombie.radius * 2
                 health_bar_height = 3
-                health_bar_x = draw_x - zombie['radius']
-                health_bar_y = draw_y - zombie['radius'] - 8
+                health_bar_x = draw_x - zombie.radius
+                health_bar_y = draw_y - zombie.radius - 8
                 
-                health_ratio = zombie['health'] / zombie['max_health']
+                health_ratio = zombie.health / zombie.max_health
                 health_color = (255, 0, 0) if health_ratio < 0.3 else (255, 165, 0) if health_ratio < 0.6 else (0, 255, 0)
                 pygame.draw.rect(surface, (40, 40, 40), 
                                (health_bar_x, health_bar_y, health_bar_width, health_bar_height))
@@ -1248,32 +1341,27 @@ class ZombieRolloutEasy(MiniGame):
             return
         
         boss = self.boss
-        draw_x = int(boss['x'] + self.camera_x)
-        draw_y = int(boss['y'] + self.camera_y)
-        
-        if boss['is_charging']:
-            charge_glow = abs(math.sin(boss['charge_timer'] * 25))
-            glow_radius = int(boss['radius'] * (1.4 + charge_glow * 0.4))
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            glow_color = (255, 50, 50, int(180 * charge_glow))
-            pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
-            surface.blit(glow_surface, (draw_x - glow_radius, draw_y - glow_radius))
-        
-        wobble = math.sin(boss['animation_timer'] * 10) * 4
+        draw_x = int(boss.x + self.camera_x)
+        draw_y = int(boss.y + self.camera_y)
+        
+        if boss.is_charging:
+            charge_glow = abs(math.sin(boss.charge_timer * 25))
+            glow_radius = int(boss.radius * (1.4 + charge_glow * 0.4))
+            glow_cache.draw(surface, (draw_x, draw_y), glow_radius, (255, 50, 50), int(180 * charge_glow))
+        
+        wobble = math.sin(boss.animation_timer * 10) * 4
         draw_y += int(wobble)
         
-        shadow_surface = pygame.Surface((boss['radius'] * 3, boss['radius'] * 2), pygame.SRCALPHA)
-        shadow_color = (0, 0, 0, 100)
-        pygame.draw.ellipse(shadow_surface, shadow_color, (0, 0, boss['radius'] * 3, boss['radius'] * 2))
-        surface.blit(shadow_surface, (draw_x - boss['radius'] * 1.5, draw_y + boss['radius'] * 0.3))
+        shadow_surface = self.get_shadow(boss.radius * 3, boss.radius * 2, 100)
+        surface.blit(shadow_surface, (draw_x - boss.radius * 1.5, draw_y + boss.radius * 0.3))
         
-        pygame.draw.circle(surface, boss['color'], (draw_x, draw_y), boss['radius'])
-        pygame.draw.circle(surface, (150, 30, 30), (draw_x, draw_y), boss['radius'], 5)
+        pygame.draw.circle(surface, boss.color, (draw_x, draw_y), boss.radius)
+        pygame.draw.circle(surface, (150, 30, 30), (draw_x, draw_y), boss.radius, 5)
         
         for i in range(12):
-            angle = (i / 12) * math.pi * 2 + boss['animation_timer']
-            spike_x = draw_x + math.cos(angle) * boss['radius']
-            spike_y = draw_y + math.sin(angle) * boss['radius']
+            angle = (i / 12) * math.pi * 2 + boss.animation_timer
+            spike_x = draw_x + math.cos(angle) * boss.radius
+            spike_y = draw_y + math.sin(angle) * boss.radius
             spike_end_x = spike_x + math.cos(angle) * 18
             spike_end_y = spike_y + math.sin(angle) * 18
             pygame.draw.line(surface, (100, 20, 20), (int(spike_x), int(spike_y)), 
@@ -1284,135 +1372,104 @@ class ZombieRolloutEasy(MiniGame):
             pygame.draw.circle(surface, (255, 0, 0), (draw_x + ex, draw_y + ey), 8)
             pygame.draw.circle(surface, (100, 0, 0), (draw_x + ex, draw_y + ey), 4)
         
-        health_bar_width = boss['radius'] * 3
+        health_bar_width = boss.radius * 3
         health_bar_height = 10
-        health_bar_x = draw_x - boss['radius'] * 1.5
-        health_bar_y = draw_y - boss['radius'] - 25
+        health_bar_x = draw_x - boss.radius * 1.5
+        health_bar_y = draw_y - boss.radius - 25
         
         pygame.draw.rect(surface, (50, 50, 50), 
                        (health_bar_x, health_bar_y, health_bar_width, health_bar_height))
         
-        health_ratio = boss['health'] / boss['max_health']
+        health_ratio = boss.health / boss.max_health
         health_color = (255, 0, 0) if health_ratio < 0.3 else (255, 100, 0) if health_ratio < 0.6 else (255, 200, 0)
         pygame.draw.rect(surface, health_color, 
                        (health_bar_x, health_bar_y, int(health_bar_width * health_ratio), health_bar_height))
         pygame.draw.rect(surface, (200, 200, 200), 
                        (health_bar_x, health_bar_y, health_bar_width, health_bar_height), 2)
         
-        font = pygame.font.Font(None, 28)
+        font = text_cache.get_font(28)
         boss_text = font.render("BOSS", True, (255, 50, 50))
         text_rect = boss_text.get_rect(center=(draw_x, health_bar_y - 12))
         surface.blit(boss_text, text_rect)
 
     def draw_bullets(self, surface):
         for bullet in self.bullets:
-            draw_x = int(bullet['x'] + self.camera_x)
-            draw_y = int(bullet['y'] + self.camera_y)
+            draw_x = int(bullet.x + self.camera_x)
+            draw_y = int(bullet.y + self.camera_y)
             
-            glow_radius = int(bullet['size'] * 2.5)
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            glow_color = (255, 200, 200, 120) if bullet['is_crit'] else (255, 255, 150, 100)
-            pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
-            surface.blit(glow_surface, (draw_x - glow_radius, draw_y - glow_radius))
+            glow_radius = int(bullet.size * 2.5)
+            if bullet.is_crit:
+                glow_cache.draw(surface, (draw_x, draw_y), glow_radius, (255, 200, 200), 120)
+            else:
+                glow_cache.draw(surface, (draw_x, draw_y), glow_radius, (255, 255, 150), 100)
             
-            bullet_color = (255, 100, 100) if bullet['is_crit'] else (255, 255, 0)
-            pygame.draw.circle(surface, bullet_color, (draw_x, draw_y), bullet['size'])
-            pygame.draw.circle(surface, (255, 255, 200), (draw_x, draw_y), bullet['size'] - 1)
+            bullet_color = (255, 100, 100) if bullet.is_crit else (255, 255, 0)
+            pygame.draw.circle(surface, bullet_color, (draw_x, draw_y), bullet.size)
+            pygame.draw.circle(surface, (255, 255, 200), (draw_x, draw_y), bullet.size - 1)
 
     def draw_xp_gems(self, surface):
         for gem in self.xp_gems:
-            draw_x = int(gem['x'] + self.camera_x)
-            draw_y = int(gem['y'] + self.camera_y)
+            draw_x = int(gem.x + self.camera_x)
+            draw_y = int(gem.y + self.camera_y)
             
-            float_offset = math.sin(gem['animation_timer'] * 4) * 3
+            float_offset = math.sin(gem.animation_timer * 4) * 3
             draw_y += int(float_offset)
             
             color = (150, 100, 255)
             
-            glow_radius = int(gem['radius'] * 1.8)
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pulse = abs(math.sin(gem['animation_timer'] * 5))
-            glow_color = (*color, int(100 * pulse))
-            pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
-            surface.blit(glow_surface, (draw_x - glow_radius, draw_y - glow_radius))
+            glow_radius = int(gem.radius * 1.8)
+            pulse = abs(math.sin(gem.animation_timer * 5))
+            glow_cache.draw(surface, (draw_x, draw_y), glow_radius, color, int(100 * pulse))
             
-            pygame.draw.circle(surface, color, (draw_x, draw_y), gem['radius'])
-            pygame.draw.circle(surface, (200, 150, 255), (draw_x, draw_y), gem['radius'] - 2)
+            pygame.draw.circle(surface, color, (draw_x, draw_y), gem.radius)
+            pygame.draw.circle(surface, (200, 150, 255), (draw_x, draw_y), gem.radius - 2)
 
     def draw_powerups(self, surface):
         for powerup in self.powerups:
-            draw_x = int(powerup['x'] + self.camera_x)
-            draw_y = int(powerup['y'] + self.camera_y)
+            draw_x = int(powerup.x + self.camera_x)
+            draw_y = int(powerup.y + self.camera_y)
             
-            float_offset = math.sin(powerup['animation_timer'] * 3) * 6
+            float_offset = math.sin(powerup.animation_timer * 3) * 6
             draw_y += int(float_offset)
             
-            if powerup['type'] == 'health':
+            if powerup.type == 'health':
                 color = (0, 255, 0)
                 symbol = '+'
             else:
                 color = (255, 0, 255)
                 symbol = '?'
             
-            glow_radius = int(powerup['radius'] * 1.7)
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pulse = abs(math.sin(powerup['animation_timer'] * 5))
-            glow_color = (*color, int(120 * pulse))
-            pygame.draw.circle(glow_surface, glow_color, (glow_radius, glow_radius), glow_radius)
-            surface.blit(glow_surface, (draw_x - glow_radius, draw_y - glow_radius))
+            glow_radius = int(powerup.radius * 1.7)
+            pulse = abs(math.sin(powerup.animation_timer * 5))
+            glow_cache.draw(surface, (draw_x, draw_y), glow_radius, color, int(120 * pulse))
             
-            pygame.draw.circle(surface, color, (draw_x, draw_y), powerup['radius'])
-            pygame.draw.circle(surface, (255, 255, 255), (draw_x, draw_y), powerup['radius'], 2)
+            pygame.draw.circle(surface, color, (draw_x, draw_y), powerup.radius)
+            pygame.draw.circle(surface, (255, 255, 255), (draw_x, draw_y), powerup.radius, 2)
             
-            font = pygame.font.Font(None, 36)
+            font = text_cache.get_font(36)
             symbol_text = font.render(symbol, True, (255, 255, 255))
             text_rect = symbol_text.get_rect(center=(draw_x, draw_y))
             surface.blit(symbol_text, text_rect)
 
     def draw_particles(self, surface):
-        for particle in self.particles:
-            draw_x = int(particle['x'] + self.camera_x)
-            draw_y = int(particle['y'] + self.camera_y)
-            
-            if draw_x < -20 or draw_x > 1300 or draw_y < 100 or draw_y > 740:
-                continue
-            
-            alpha = int(255 * (particle['lifetime'] / particle['max_lifetime']))
-            color = (*particle['color'], alpha)
-            
-            particle_surface = pygame.Surface((int(particle['size'] * 2), int(particle['size'] * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, color, (int(particle['size']), int(particle['size'])), int(particle['size']))
-            surface.blit(particle_surface, (draw_x - int(particle['size']), draw_y - int(particle['size'])))
+        self.particles.draw(surface, self.camera_x, self.camera_y, bounds=(-20, 100, 1300, 740))
 
     def draw_damage_numbers(self, surface):
-        font = pygame.font.Font(None, 30)
-        
         for number in self.damage_numbers:
-            draw_x = int(number['x'] + self.camera_x)
-            draw_y = int(number['y'] + self.camera_y)
-            
-            alpha = int(255 * (number['lifetime'] / 0.8))
-            
-            text = font.render(str(number['damage']), True, (255, 255, 255))
-            text_surface = pygame.Surface(text.get_size(), pygame.SRCALPHA)
-            text_surface.fill((0, 0, 0, 0))
-            text_surface.blit(text, (0, 0))
-            text_surface.set_alpha(alpha)
+            draw_x = int(number.x + self.camera_x)
+            draw_y = int(number.y + self.camera_y)
             
-            text_rect = text_surface.get_rect(center=(draw_x, draw_y))
-            surface.blit(text_surface, text_rect)
+            alpha = int(255 * (number.lifetime / 0.8))
+            text_cache.draw(surface, str(number.damage), 30, (255, 255, 255), (draw_x, draw_y), alpha=alpha)
 
     def draw_shockwaves(self, surface):
         for wave in self.shockwaves:
-            draw_x = int(wave['x'] + self.camera_x)
-            draw_y = int(wave['y'] + self.camera_y)
+            draw_x = int(wave.x + self.camera_x)
+            draw_y = int(wave.y + self.camera_y)
             
-            alpha = int(255 * (wave['lifetime'] / 0.8))
+            alpha = int(255 * (wave.lifetime / 0.8))
             
-            wave_surface = pygame.Surface((int(wave['radius'] * 2), int(wave['radius'] * 2)), pygame.SRCALPHA)
-            color = (100, 200, 255, alpha // 2)
-            pygame.draw.circle(wave_surface, color, (int(wave['radius']), int(wave['radius'])), int(wave['radius']), 4)
-            surface.blit(wave_surface, (draw_x - int(wave['radius']), draw_y - int(wave['radius'])))
+            glow_cache.draw(surface, (draw_x, draw_y), wave.radius, (100, 200, 255), alpha // 2, width=4)
 
     def draw_ui(self, surface):
         panel_height = 115
@@ -1420,9 +1477,9 @@ class ZombieRolloutEasy(MiniGame):
         panel_surface.fill((0, 0, 0, 180))
         surface.blit(panel_surface, (0, 0))
         
-        font_large = pygame.font.Font(None, 52)
-        font_medium = pygame.font.Font(None, 34)
-        font_small = pygame.font.Font(None, 26)
+        font_large = text_cache.get_font(52)
+        font_medium = text_cache.get_font(34)
+        font_small = text_cache.get_font(26)
         
         score_text = font_large.render(f"Score: {self.score}", True, (255, 255, 255))
         surface.blit(score_text, (20, 12))
@@ -1503,7 +1560,7 @@ class ZombieRolloutEasy(MiniGame):
         pygame.draw.rect(surface, color if cooldown_ratio >= 1 else (80, 80, 80), 
                        (x, y, icon_size, icon_size), 4)
         
-        font = pygame.font.Font(None, 22)
+        font = text_cache.get_font(22)
         name_text = font.render(name, True, (255, 255, 255))
         text_rect = name_text.get_rect(center=(x + icon_size // 2, y + icon_size // 2))
         surface.blit(name_text, text_rect)
@@ -1519,9 +1576,10 @@ class ZombieRolloutEasy(MiniGame):
         overlay.fill((0, 0, 0, 160))
         surface.blit(overlay, (0, 0))
         
-        font_huge = pygame.font.Font(None, 110)
-        font_large = pygame.font.Font(None, 70)
+        font_huge = text_cache.get_font(110)
+        font_large = text_cache.get_font(70)
         
+        upcoming = self.wave + 1  # L'ondata che parte a fine transizione
         if self.wave > 1:
             wave_text = font_huge.render(f"WAVE {self.wave}", True, (255, 255, 100))
             wave_rect = wave_text.get_rect(center=(640, 320))
@@ -1531,6 +1589,10 @@ class ZombieRolloutEasy(MiniGame):
                 boss_text = font_large.render("BOSS INCOMING!", True, (255, 50, 50))
                 boss_rect = boss_text.get_rect(center=(640, 430))
                 surface.blit(boss_text, boss_rect)
+            elif upcoming >= self.HORDE_FIRST_WAVE and upcoming % 5 == 3:
+                horde_text = font_large.render("HORDE INCOMING!", True, (255, 150, 0))
+                horde_rect = horde_text.get_rect(center=(640, 430))
+                surface.blit(horde_text, horde_rect)
             else:
                 ready_text = font_large.render("GET READY!", True, (200, 200, 200))
                 ready_rect = ready_text.get_rect(center=(640, 430))
@@ -1541,10 +1603,10 @@ class ZombieRolloutEasy(MiniGame):
         overlay.fill((0, 0, 0, 200))
         surface.blit(overlay, (0, 0))
         
-        font_huge = pygame.font.Font(None, 96)
-        font_large = pygame.font.Font(None, 48)
-        font_medium = pygame.font.Font(None, 36)
-        font_small = pygame.font.Font(None, 28)
+        font_huge = text_cache.get_font(96)
+        font_large = text_cache.get_font(48)
+        font_medium = text_cache.get_font(36)
+        font_small = text_cache.get_font(28)
         
         title_text = font_huge.render("LEVEL UP!", True, (255, 255, 0))
         title_rect = title_text.get_rect(center=(640, 150))
@@ -1608,7 +1670,7 @@ class ZombieRolloutEasy(MiniGame):
         overlay.fill((0, 0, 0, 200))
         surface.blit(overlay, (0, 0))
         
-        font = pygame.font.Font(None, 110)
+        font = text_cache.get_font(110)
         pause_text = font.render("PAUSED", True, (255, 255, 255))
         text_rect = pause_text.get_rect(center=(640, 360))
         surface.blit(pause_text, text_rect)
\ No newline at end of file